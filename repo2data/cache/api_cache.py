@@ -0,0 +1,284 @@
+"""On-disk cache for provider metadata API responses."""
+
+import contextlib
+import hashlib
+import io
+import os
+import re
+import time
+from pathlib import Path
+from typing import Dict, Any, BinaryIO, Iterator, List, Optional
+import logging
+
+import requests
+
+from repo2data.cache.global_cache import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Cached responses to version-pinned requests older than this are
+# fetched again
+API_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Request URLs that name an explicit version (e.g. Dataverse
+# ".../versions/1.2", Figshare ".../versions/3"), whose response cannot
+# change once published
+_PINNED_VERSION_RE = re.compile(r"/versions/\d+(?:\.\d+)*(?:/|$)")
+
+
+def api_cache_enabled() -> bool:
+    """
+    Check whether API responses may be cached.
+
+    Returns
+    -------
+    bool
+        False if REPO2DATA_NO_CACHE is set, True otherwise
+    """
+    return os.environ.get('REPO2DATA_NO_CACHE', '').lower() not in ('1', 'true', 'yes')
+
+
+def is_version_pinned(url: str) -> bool:
+    """
+    Check whether a request URL names an explicit, published version.
+
+    Parameters
+    ----------
+    url : str
+        Request URL
+
+    Returns
+    -------
+    bool
+        True if the response to ``url`` cannot change
+    """
+    return _PINNED_VERSION_RE.search(url) is not None
+
+
+def _cache_path(url: str, params: Optional[Dict[str, Any]] = None) -> Path:
+    """Get the cache file for a request URL and query parameters."""
+    key = url
+    if params:
+        key += "?" + "&".join(f"{k}={params[k]}" for k in sorted(params))
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return get_cache_dir() / 'api' / f"{digest}.json"
+
+
+def _etag_path(path: Path) -> Path:
+    """Get the file holding the ETag of a cached response."""
+    return path.with_suffix('.etag')
+
+
+def load_api_response(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    max_age: Optional[float] = API_CACHE_TTL
+) -> Optional[bytes]:
+    """
+    Load a cached API response body.
+
+    Parameters
+    ----------
+    url : str
+        Request URL
+    params : dict, optional
+        Query parameters of the request
+    max_age : float or None
+        Maximum age of the cached response in seconds (None: any age)
+
+    Returns
+    -------
+    bytes or None
+        Cached response body, or None if missing or expired
+    """
+    path = _cache_path(url, params)
+
+    try:
+        if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+            return None
+        content = path.read_bytes()
+    except OSError:
+        return None
+
+    logger.debug(f"Using cached API response for {url}")
+    return content
+
+
+def load_api_etag(
+    url: str,
+    params: Optional[Dict[str, Any]] = None
+) -> Optional[str]:
+    """
+    Load the ETag stored with a cached API response.
+
+    Parameters
+    ----------
+    url : str
+        Request URL
+    params : dict, optional
+        Query parameters of the request
+
+    Returns
+    -------
+    str or None
+        ETag, or None if none was stored
+    """
+    try:
+        return _etag_path(_cache_path(url, params)).read_text().strip() or None
+    except OSError:
+        return None
+
+
+def store_api_response(
+    url: str,
+    params: Optional[Dict[str, Any]],
+    content: bytes,
+    etag: Optional[str] = None
+) -> None:
+    """
+    Store an API response body (and its ETag) in the cache.
+
+    Failures to write the cache are logged and otherwise ignored.
+
+    Parameters
+    ----------
+    url : str
+        Request URL
+    params : dict or None
+        Query parameters of the request
+    content : bytes
+        Response body
+    etag : str, optional
+        ETag of the response, used to revalidate it later
+    """
+    path = _cache_path(url, params)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    etag_path = _etag_path(path)
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Drop the old ETag first, so it never pairs with a new body
+        etag_path.unlink(missing_ok=True)
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+        if etag:
+            etag_path.write_text(etag)
+    except OSError as e:
+        logger.debug(f"Could not cache API response for {url}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+
+class _RecordingReader:
+    """Binary reader that keeps a copy of everything read through it."""
+
+    def __init__(self, stream: BinaryIO, chunks: List[bytes]):
+        self.stream = stream
+        self.chunks = chunks
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        self.chunks.append(data)
+        return data
+
+
+@contextlib.contextmanager
+def open_api_response(
+    session: requests.Session,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: float = 30
+) -> Iterator[BinaryIO]:
+    """
+    GET an API response body through the cache.
+
+    Responses to version-pinned requests (see ``is_version_pinned``) are
+    reused for API_CACHE_TTL without a request. Any other cached response
+    is revalidated with ``If-None-Match`` and only reused on a
+    304 Not Modified, so a newly published version is never hidden;
+    such responses are only cached if the server sent an ETag.
+
+    Parameters
+    ----------
+    session : requests.Session
+        Session to send the request with
+    url : str
+        Request URL
+    params : dict, optional
+        Query parameters of the request
+    timeout : float
+        Request timeout in seconds
+
+    Yields
+    ------
+    file-like
+        Binary reader of the (decoded) response body
+
+    Raises
+    ------
+    requests.RequestException
+        If the request fails
+    """
+    use_cache = api_cache_enabled()
+    pinned = use_cache and is_version_pinned(url)
+
+    if pinned:
+        cached = load_api_response(url, params)
+        if cached is not None:
+            yield io.BytesIO(cached)
+            return
+
+    headers = {}
+    cached = None
+    if use_cache and not pinned:
+        etag = load_api_etag(url, params)
+        if etag:
+            cached = load_api_response(url, params, max_age=None)
+            if cached is not None:
+                headers['If-None-Match'] = etag
+
+    with session.get(
+        url, params=params, headers=headers, stream=True, timeout=timeout
+    ) as response:
+        if response.status_code == 304 and cached is not None:
+            logger.debug(f"API response for {url} not modified")
+            yield io.BytesIO(cached)
+            return
+
+        response.raise_for_status()
+        response.raw.decode_content = True
+
+        etag = response.headers.get('ETag')
+        if not use_cache or not (pinned or etag):
+            yield response.raw
+            return
+
+        # Keep a copy of the body for the cache while it is consumed
+        chunks = []
+        yield _RecordingReader(response.raw, chunks)
+        chunks.append(response.raw.read())
+        store_api_response(url, params, b"".join(chunks), etag=etag)
+
+
+def get_api_response(
+    session: requests.Session,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: float = 30
+) -> bytes:
+    """
+    GET a whole API response body through the cache.
+
+    See ``open_api_response`` for when cached responses are used.
+
+    Returns
+    -------
+    bytes
+        Response body
+
+    Raises
+    ------
+    requests.RequestException
+        If the request fails
+    """
+    with open_api_response(session, url, params, timeout) as body:
+        return body.read()
@@ -31,7 +31,8 @@ class CacheManager:
         self,
         cache_dir: Path,
         download_key: Optional[str] = None,
-        use_global_cache: bool = True
+        use_global_cache: bool = True,
+        global_cache: Optional[GlobalCacheManager] = None
     ):
         """
         Initialize CacheManager.
@@ -45,6 +46,8 @@ class CacheManager:
         use_global_cache : bool
             If True, use global cache system (default: True)
             Can be disabled via REPO2DATA_USE_LOCAL_CACHE env var
+        global_cache : GlobalCacheManager, optional
+            Shared global cache instance. If None, a new one is opened
         """
         self.cache_dir = Path(cache_dir)
         self.download_key = download_key
@@ -55,7 +58,7 @@ class CacheManager:
 
         # Initialize global cache manager if enabled
         if self.use_global_cache:
-            self.global_cache = GlobalCacheManager()
+            self.global_cache = global_cache or GlobalCacheManager()
         else:
             self.global_cache = None
 
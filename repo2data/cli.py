@@ -17,7 +17,7 @@ from repo2data import DatasetManager, __version__, GlobalCacheManager, get_cache
 from repo2data.utils.logger import setup_logger
 from rich.table import Table
 from rich.panel import Panel
-from repo2data.utils.logger import console
+from repo2data.utils.logger import get_console
 
 
 def get_parser() -> argparse.ArgumentParser:
@@ -208,13 +208,17 @@ Documentation: https://github.com/SIMEXP/Repo2Data
     return parser
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
 def _format_size(size_bytes: int) -> str:
     """Format bytes to human-readable size."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} PB"
+    size_bytes = int(size_bytes)
+    if size_bytes <= 0:
+        return "0.0 B"
+    # Each unit is 2**10 times the previous one
+    idx = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
 
 
 def _format_timestamp(timestamp_str: str) -> str:
@@ -250,7 +254,7 @@ def cache_list_command(args) -> int:
     entries = cache.list_all_cached()
 
     if not entries:
-        console.print(Panel(
+        get_console().print(Panel(
             "[yellow]No cached datasets found[/yellow]",
             title="Cache",
             border_style="yellow"
@@ -294,12 +298,12 @@ def cache_list_command(args) -> int:
         )
         total_size += size
 
-    console.print()
-    console.print(table)
-    console.print()
-    console.print(f"[dim]Total cache size: {_format_size(total_size)}[/dim]")
-    console.print(f"[dim]Cache location: {get_cache_dir()}[/dim]")
-    console.print()
+    get_console().print()
+    get_console().print(table)
+    get_console().print()
+    get_console().print(f"[dim]Total cache size: {_format_size(total_size)}[/dim]")
+    get_console().print(f"[dim]Cache location: {get_cache_dir()}[/dim]")
+    get_console().print()
 
     return 0
 
@@ -308,23 +312,23 @@ def cache_clean_command(args) -> int:
     """Handle 'cache clean' command."""
     cache = GlobalCacheManager()
 
-    console.print()
-    console.print("[cyan]Cleaning orphaned cache entries...[/cyan]")
+    get_console().print()
+    get_console().print("[cyan]Cleaning orphaned cache entries...[/cyan]")
 
     removed = cache.clean_orphaned_entries()
 
     if removed > 0:
-        console.print(Panel(
+        get_console().print(Panel(
             f"[green]✓ Removed {removed} orphaned cache entr{'ies' if removed > 1 else 'y'}[/green]",
             border_style="green"
         ))
     else:
-        console.print(Panel(
+        get_console().print(Panel(
             "[green]✓ No orphaned cache entries found[/green]",
             border_style="green"
         ))
 
-    console.print()
+    get_console().print()
     return 0
 
 
@@ -334,16 +338,16 @@ def cache_verify_command(args) -> int:
     entries = cache.list_all_cached()
 
     if not entries:
-        console.print(Panel(
+        get_console().print(Panel(
             "[yellow]No cached datasets to verify[/yellow]",
             title="Cache Verification",
             border_style="yellow"
         ))
         return 0
 
-    console.print()
-    console.print(f"[cyan]Verifying {len(entries)} cached dataset(s)...[/cyan]")
-    console.print()
+    get_console().print()
+    get_console().print(f"[cyan]Verifying {len(entries)} cached dataset(s)...[/cyan]")
+    get_console().print()
 
     valid = 0
     invalid = 0
@@ -353,29 +357,29 @@ def cache_verify_command(args) -> int:
         path = Path(entry['destination_path'])
 
         if path.exists():
-            console.print(f"  [green]✓[/green] {project_name} - [dim]{path}[/dim]")
+            get_console().print(f"  [green]✓[/green] {project_name} - [dim]{path}[/dim]")
             valid += 1
         else:
-            console.print(f"  [red]✗[/red] {project_name} - [red]Missing:[/red] [dim]{path}[/dim]")
+            get_console().print(f"  [red]✗[/red] {project_name} - [red]Missing:[/red] [dim]{path}[/dim]")
             invalid += 1
 
-    console.print()
+    get_console().print()
 
     if invalid > 0:
-        console.print(Panel(
+        get_console().print(Panel(
             f"[yellow]⚠ {invalid} dataset(s) missing on disk[/yellow]\n\n"
             f"Run [bold]repo2data cache clean[/bold] to remove orphaned entries",
             title="Verification Results",
             border_style="yellow"
         ))
     else:
-        console.print(Panel(
+        get_console().print(Panel(
             f"[green]✓ All {valid} cached dataset(s) verified[/green]",
             title="Verification Results",
             border_style="green"
         ))
 
-    console.print()
+    get_console().print()
     return 0
 
 
@@ -385,7 +389,7 @@ def cache_clear_command(args) -> int:
     entries = cache.list_all_cached()
 
     if not entries:
-        console.print(Panel(
+        get_console().print(Panel(
             "[yellow]Cache is already empty[/yellow]",
             title="Cache",
             border_style="yellow"
@@ -394,25 +398,25 @@ def cache_clear_command(args) -> int:
 
     # Confirm if not already confirmed
     if not args.confirm:
-        console.print()
-        console.print(f"[yellow]This will clear {len(entries)} cache entr{'ies' if len(entries) > 1 else 'y'}[/yellow]")
-        console.print("[dim](Data files will NOT be deleted)[/dim]")
-        console.print()
+        get_console().print()
+        get_console().print(f"[yellow]This will clear {len(entries)} cache entr{'ies' if len(entries) > 1 else 'y'}[/yellow]")
+        get_console().print("[dim](Data files will NOT be deleted)[/dim]")
+        get_console().print()
         response = input("Continue? [y/N]: ")
         if response.lower() not in ('y', 'yes'):
-            console.print("[yellow]Cancelled[/yellow]")
+            get_console().print("[yellow]Cancelled[/yellow]")
             return 0
 
-    console.print()
-    console.print("[cyan]Clearing cache...[/cyan]")
+    get_console().print()
+    get_console().print("[cyan]Clearing cache...[/cyan]")
 
     cleared = cache.clear_all()
 
-    console.print(Panel(
+    get_console().print(Panel(
         f"[green]✓ Cleared {cleared} cache entr{'ies' if cleared > 1 else 'y'}[/green]",
         border_style="green"
     ))
-    console.print()
+    get_console().print()
 
     return 0
 
@@ -423,7 +427,7 @@ def cache_info_command(args) -> int:
     entries = cache.list_all_cached()
 
     if not entries:
-        console.print(Panel(
+        get_console().print(Panel(
             "[yellow]Cache is empty[/yellow]",
             title="Cache Statistics",
             border_style="yellow"
@@ -455,13 +459,13 @@ def cache_info_command(args) -> int:
 [bold cyan]Average Age:[/bold cyan] {int(avg_age)} days
 [bold cyan]Cache Location:[/bold cyan] {get_cache_dir()}"""
 
-    console.print()
-    console.print(Panel(
+    get_console().print()
+    get_console().print(Panel(
         info_text,
         title="Cache Statistics",
         border_style="cyan"
     ))
-    console.print()
+    get_console().print()
 
     return 0
 
@@ -477,15 +481,15 @@ def cache_migrate_command(args) -> int:
     else:
         search_paths = [Path.cwd()]
 
-    console.print()
-    console.print(f"[cyan]Searching for local cache files in {len(search_paths)} location(s)...[/cyan]")
-    console.print()
+    get_console().print()
+    get_console().print(f"[cyan]Searching for local cache files in {len(search_paths)} location(s)...[/cyan]")
+    get_console().print()
 
     # Find all local cache files
     cache_files = migrator.find_local_caches(search_paths)
 
     if not cache_files:
-        console.print(Panel(
+        get_console().print(Panel(
             "[yellow]No local cache files found[/yellow]\n\n"
             "[dim]Local cache files are named 'repo2data_cache.json' or '*_repo2data_cache.json'[/dim]",
             title="Migration",
@@ -493,42 +497,42 @@ def cache_migrate_command(args) -> int:
         ))
         return 0
 
-    console.print(f"[cyan]Found {len(cache_files)} local cache file(s)[/cyan]")
-    console.print()
+    get_console().print(f"[cyan]Found {len(cache_files)} local cache file(s)[/cyan]")
+    get_console().print()
 
     # Show files to be migrated
     for cache_file in cache_files[:10]:  # Show first 10
-        console.print(f"  [dim]• {cache_file}[/dim]")
+        get_console().print(f"  [dim]• {cache_file}[/dim]")
     if len(cache_files) > 10:
-        console.print(f"  [dim]... and {len(cache_files) - 10} more[/dim]")
+        get_console().print(f"  [dim]... and {len(cache_files) - 10} more[/dim]")
 
-    console.print()
+    get_console().print()
 
     # Migrate
-    console.print("[cyan]Migrating to global cache...[/cyan]")
+    get_console().print("[cyan]Migrating to global cache...[/cyan]")
     migrated, failed = migrator.migrate_all(search_paths, remove_after=args.remove)
 
-    console.print()
+    get_console().print()
 
     if migrated > 0:
         action = "migrated and removed" if args.remove else "migrated"
-        console.print(Panel(
+        get_console().print(Panel(
             f"[green]✓ Successfully {action} {migrated} local cache file(s)[/green]" +
             (f"\n[red]✗ Failed to migrate {failed} file(s)[/red]" if failed > 0 else ""),
             title="Migration Complete",
             border_style="green"
         ))
-        console.print()
-        console.print(f"[dim]Global cache location: {get_cache_dir()}[/dim]")
+        get_console().print()
+        get_console().print(f"[dim]Global cache location: {get_cache_dir()}[/dim]")
     else:
-        console.print(Panel(
+        get_console().print(Panel(
             "[yellow]No cache files were migrated[/yellow]\n\n"
             "[dim]Cache files may already be migrated or contain invalid data[/dim]",
             title="Migration",
             border_style="yellow"
         ))
 
-    console.print()
+    get_console().print()
     return 0
 
 
@@ -536,35 +540,35 @@ def cache_remove_command(args) -> int:
     """Handle 'cache remove' command."""
     cache = GlobalCacheManager()
 
-    console.print()
+    get_console().print()
 
     if args.path:
         # Remove by destination path
-        console.print(f"[cyan]Removing cache entry for path: {args.identifier}[/cyan]")
+        get_console().print(f"[cyan]Removing cache entry for path: {args.identifier}[/cyan]")
         removed = cache.remove_by_destination(args.identifier)
     else:
         # Remove by project name
-        console.print(f"[cyan]Removing cache entries for project: {args.identifier}[/cyan]")
+        get_console().print(f"[cyan]Removing cache entries for project: {args.identifier}[/cyan]")
         removed = cache.remove_by_project(args.identifier)
 
-    console.print()
+    get_console().print()
 
     if removed > 0:
-        console.print(Panel(
+        get_console().print(Panel(
             f"[green]✓ Removed {removed} cache entr{'ies' if removed > 1 else 'y'}[/green]\n\n"
             "[dim]Data files were NOT deleted[/dim]",
             title="Cache Removed",
             border_style="green"
         ))
     else:
-        console.print(Panel(
+        get_console().print(Panel(
             f"[yellow]No cache entries found for: {args.identifier}[/yellow]\n\n"
             "[dim]Use 'repo2data cache list' to see all cached datasets[/dim]",
             title="Not Found",
             border_style="yellow"
         ))
 
-    console.print()
+    get_console().print()
     return 0
 
 
@@ -606,10 +610,10 @@ def main() -> int:
                 parser.print_help()
                 return 1
         except KeyboardInterrupt:
-            console.print("\n[yellow]Interrupted by user[/yellow]")
+            get_console().print("\n[yellow]Interrupted by user[/yellow]")
             return 130
         except Exception as e:
-            console.print(f"\n[red]Error:[/red] {e}")
+            get_console().print(f"\n[red]Error:[/red] {e}")
             return 1
 
     # Setup logging for download commands
@@ -37,6 +37,21 @@ class SingleDownloadConfig(BaseModel):
         default=None,
         description="Enable recursive download for directory structures"
     )
+    max_concurrent_downloads: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Number of files downloaded in parallel (Dataverse, Figshare)"
+    )
+    connections_per_file: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Parallel range requests for one large HTTP file (1 disables)"
+    )
+    probe_sha256: Optional[str] = Field(
+        default=None,
+        description="sha256 of size, first and last 64 KiB (see compute_probe); "
+                    "rejects a mismatching existing file before a full checksum"
+    )
 
     @field_validator('dataLayout')
     @classmethod
@@ -1,6 +1,7 @@
 """Dataset downloader for executing individual downloads."""
 
 import os
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
@@ -8,8 +9,9 @@ import logging
 from rich.panel import Panel
 
 from repo2data.cache.manager import CacheManager
+from repo2data.cache.global_cache import GlobalCacheManager
 from repo2data.utils.decompressor import Decompressor
-from repo2data.utils.logger import get_logger, console
+from repo2data.utils.logger import get_logger, get_console
 
 # Import provider registry
 from repo2data.providers import registry
@@ -56,7 +58,9 @@ class DatasetDownloader:
         server_mode: bool = False,
         server_destination: str = "./data",
         requirement_path: Optional[str] = None,
-        download_key: Optional[str] = None
+        download_key: Optional[str] = None,
+        global_cache: Optional[GlobalCacheManager] = None,
+        executor: Optional[Executor] = None
     ):
         """
         Initialize DatasetDownloader.
@@ -73,20 +77,31 @@ class DatasetDownloader:
             Path to requirement file (for dataLayout resolution)
         download_key : str, optional
             Key for multi-download configurations
+        global_cache : GlobalCacheManager, optional
+            Shared global cache instance (avoids reopening the cache
+            database for every download)
+        executor : concurrent.futures.Executor, optional
+            Thread pool shared with the provider and decompressor; if
+            None, each starts its own
         """
         self.config = config
         self.server_mode = server_mode
         self.server_destination = server_destination
         self.requirement_path = requirement_path
         self.download_key = download_key
+        self.executor = executor
         self.logger = get_logger(__name__)
 
         # Compute destination path
         self.destination = self._compute_destination()
 
         # Initialize cache manager and decompressor
-        self.cache_manager = CacheManager(self.destination, download_key)
-        self.decompressor = Decompressor(self.destination)
+        self.cache_manager = CacheManager(
+            self.destination,
+            download_key,
+            global_cache=global_cache
+        )
+        self.decompressor = Decompressor(self.destination, executor=executor)
 
     def _compute_destination(self) -> Path:
         """
@@ -159,8 +174,8 @@ class DatasetDownloader:
 
         # Check cache
         if self.cache_manager.is_cached(self.config):
-            console.print()
-            console.print(Panel(
+            get_console().print()
+            get_console().print(Panel(
                 f"[chartreuse2]✅ Data has already been downloaded![/chartreuse2] \n\n[dim]{self.destination}[/dim]",
                 title="[bold]Cache Hit[/bold]",
                 border_style="green",
@@ -189,6 +204,7 @@ class DatasetDownloader:
         # Download using provider
         # Providers handle their own progress display
         self.logger.debug(f"Using {provider.provider_name} provider")
+        provider.executor = self.executor
 
         try:
             downloaded_path = provider.download()
@@ -211,7 +227,7 @@ class DatasetDownloader:
         # Save cache
         try:
             cache_path = self.cache_manager.save_cache(self.config)
-            console.print(f"  [green]✓[/green] Cache saved")
+            get_console().print(f"  [green]✓[/green] Cache saved")
         except Exception as e:
             self.logger.warning(f"Failed to save cache: {e}")
             # Don't fail the download if cache save fails
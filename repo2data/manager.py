@@ -1,6 +1,9 @@
 """Dataset manager for orchestrating downloads."""
 
+import copy
+import functools
 import os
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 import logging
@@ -11,13 +14,47 @@ from rich.tree import Tree
 from repo2data.config.loader import ConfigLoader
 from repo2data.config.validator import ConfigValidator
 from repo2data.downloader import DatasetDownloader
-from repo2data.utils.logger import get_logger, console
+from repo2data.providers import registry
+from repo2data.utils.download import DEFAULT_MAX_WORKERS
+from repo2data.utils.executor import create_executor
+from repo2data.utils.logger import get_logger, get_console
 from repo2data.cache.global_cache import GlobalCacheManager, get_cache_dir
 from repo2data.cache.migration import CacheMigrator
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _load_requirement_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Load and validate a local requirement file.
+
+    Memoized on the file's modification time, so managers created for
+    an unchanged file skip parsing and validation. Callers must not
+    mutate the returned dict (``DatasetManager`` copies it).
+
+    Parameters
+    ----------
+    path : str
+        Path to the requirement file
+    mtime_ns : int
+        Modification time of the file in nanoseconds (cache key only)
+
+    Returns
+    -------
+    dict
+        Validated requirements
+
+    Raises
+    ------
+    ValueError
+        If requirements are invalid
+    """
+    requirements = ConfigLoader(path).load()
+    ConfigValidator().validate(requirements)
+    return requirements
+
+
 def _get_directory_size(path: Path) -> int:
     """Calculate total size of directory in bytes."""
     total = 0
@@ -30,21 +67,37 @@ def _get_directory_size(path: Path) -> int:
     return total
 
 
-def _format_size(size_bytes: int) -> str:
-    """Format bytes to human-readable size."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} PB"
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 
-def _build_directory_tree(path: Path, max_depth: int = 2, max_files: int = 10) -> Tree:
-    """Build a rich Tree showing directory structure."""
+def _format_size(size_bytes: int) -> str:
+    """Format bytes to human-readable size."""
+    size_bytes = int(size_bytes)
+    if size_bytes <= 0:
+        return "0.0 B"
+    # Each unit is 2**10 times the previous one
+    idx = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
+
+
+def _build_directory_tree(
+    path: Path,
+    max_depth: int = 2,
+    max_files: int = 10,
+    max_nodes: int = 2000
+) -> Tree:
+    """Build a rich Tree showing directory structure.
+
+    Stops adding entries once ``max_nodes`` nodes have been added, so
+    memory stays bounded for very wide or deep directories.
+    """
     tree = Tree(f"[bold cyan]{path.name}/[/bold cyan]")
+    nodes_total = 0
 
     def add_children(parent_tree: Tree, parent_path: Path, current_depth: int):
-        if current_depth >= max_depth:
+        nonlocal nodes_total
+
+        if current_depth >= max_depth or nodes_total >= max_nodes:
             return
 
         try:
@@ -52,13 +105,19 @@ def _build_directory_tree(path: Path, max_depth: int = 2, max_files: int = 10) -
             file_count = 0
 
             for item in items:
+                if nodes_total >= max_nodes:
+                    parent_tree.add("[dim]... (truncated)[/dim]")
+                    return
+
                 if item.is_dir():
                     subtree = parent_tree.add(f"[cyan]{item.name}/[/cyan]")
+                    nodes_total += 1
                     add_children(subtree, item, current_depth + 1)
                 else:
                     if file_count < max_files:
                         size = item.stat().st_size
                         parent_tree.add(f"[dim]{item.name}[/dim] [yellow]({_format_size(size)})[/yellow]")
+                        nodes_total += 1
                         file_count += 1
 
             if file_count == max_files and len([x for x in items if x.is_file()]) > max_files:
@@ -85,7 +144,9 @@ class DatasetManager:
         requirement_path: Optional[str] = None,
         server_mode: bool = False,
         server_destination: str = "./data",
-        auto_migrate_cache: bool = True
+        auto_migrate_cache: bool = True,
+        show_summary: Optional[bool] = None,
+        executor: Optional[Executor] = None
     ):
         """
         Initialize DatasetManager.
@@ -101,11 +162,24 @@ class DatasetManager:
             Destination directory when in server mode
         auto_migrate_cache : bool
             If True, automatically migrate local cache files to global cache
+        show_summary : bool, optional
+            If True, print the size summary and directory trees after
+            install. Defaults to ``not server_mode``: server mode only
+            returns paths and skips the directory walk.
+        executor : concurrent.futures.Executor, optional
+            Thread pool shared by all downloads and extractions of this
+            manager (anything with a compatible ``submit``). Defaults to
+            a pool of ``min(32, cpu_count * 4)`` threads created on first
+            use, which ``install`` (or ``close``) shuts down again. A
+            caller's executor is never shut down.
         """
         self.requirement_path = requirement_path
         self.server_mode = server_mode
         self.server_destination = server_destination
         self.auto_migrate_cache = auto_migrate_cache
+        self.show_summary = (
+            not server_mode if show_summary is None else show_summary
+        )
         self.logger = get_logger(__name__)
 
         # Load and validate configuration
@@ -113,6 +187,43 @@ class DatasetManager:
         self.config_validator = ConfigValidator()
         self.requirements: Optional[Dict[str, Any]] = None
         self._migration_done = False
+        self._global_cache: Optional[GlobalCacheManager] = None
+        self._executor = executor
+        self._owns_executor = False
+
+    @property
+    def global_cache(self) -> GlobalCacheManager:
+        """Global cache shared by all downloads of this manager."""
+        if self._global_cache is None:
+            self._global_cache = GlobalCacheManager()
+        return self._global_cache
+
+    @property
+    def executor(self) -> Executor:
+        """Thread pool shared by all downloads of this manager."""
+        if self._executor is None:
+            self._executor = create_executor()
+            self._owns_executor = True
+        return self._executor
+
+    def close(self) -> None:
+        """
+        Shut down the thread pool this manager created, if any.
+
+        Waits for running tasks. A later ``install`` creates a new pool.
+        """
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._owns_executor = False
+
+    def __enter__(self) -> "DatasetManager":
+        """Use the manager as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Shut down the manager's own thread pool."""
+        self.close()
 
     def load_requirements(self) -> Dict[str, Any]:
         """
@@ -128,6 +239,20 @@ class DatasetManager:
         ValueError
             If requirements are invalid
         """
+        config_path = self.config_loader.config_path
+
+        # Local files are parsed and validated once per modification
+        try:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except (OSError, ValueError):
+            mtime_ns = None
+
+        if mtime_ns is not None:
+            self.requirements = copy.deepcopy(
+                _load_requirement_cached(os.path.abspath(config_path), mtime_ns)
+            )
+            return self.requirements
+
         # Load configuration
         self.requirements = self.config_loader.load()
 
@@ -148,8 +273,7 @@ class DatasetManager:
 
         try:
             # Create migrator
-            global_cache = GlobalCacheManager()
-            migrator = CacheMigrator(global_cache)
+            migrator = CacheMigrator(self.global_cache)
 
             # Auto-migrate (without removing local files for backward compat)
             migrated, failed = migrator.auto_migrate(
@@ -182,6 +306,14 @@ class DatasetManager:
         >>> print(paths)
         ['./data/dataset1', './data/dataset2']
         """
+        try:
+            return self._install()
+        finally:
+            # Leave no idle worker threads behind (notebooks, server mode)
+            self.close()
+
+    def _install(self) -> List[str]:
+        """Install all datasets (see ``install``)."""
         # Load requirements if not already loaded
         if self.requirements is None:
             self.load_requirements()
@@ -209,30 +341,45 @@ class DatasetManager:
             header_text += f"\n[dim]source:[/dim] {first_src}"
 
         # Show header
-        console.print()
-        console.print(Panel.fit(header_text, title="repo2data", border_style="cyan"))
+        get_console().print()
+        get_console().print(Panel.fit(header_text, title="repo2data", border_style="cyan"))
 
         results = []
         cached_results = []
 
+        downloaders = {}
+        for download_key, config in downloads.items():
+            try:
+                downloaders[download_key] = DatasetDownloader(
+                    config=config,
+                    server_mode=self.server_mode,
+                    server_destination=self.server_destination,
+                    requirement_path=self.config_loader.config_path,
+                    download_key=download_key,
+                    global_cache=self.global_cache,
+                    executor=self.executor
+                )
+            except Exception as e:
+                # Reported when the download is processed below
+                downloaders[download_key] = e
+
+        if len(downloaders) > 1:
+            self._batch_download(downloaders)
+
         # Process downloads
         for idx, (download_key, config) in enumerate(downloads.items(), 1):
             project_name = config.get('projectName', 'unknown')
             display_name = download_key or project_name
 
-            console.print(
+            get_console().print(
                 f"\n[cyan]({idx}/{len(downloads)})[/cyan] "
                 f"[bold]{display_name}[/bold]"
             )
 
             try:
-                downloader = DatasetDownloader(
-                    config=config,
-                    server_mode=self.server_mode,
-                    server_destination=self.server_destination,
-                    requirement_path=self.config_loader.config_path,
-                    download_key=download_key
-                )
+                downloader = downloaders[download_key]
+                if isinstance(downloader, Exception):
+                    raise downloader
 
                 # Check if cached before downloading
                 was_cached = downloader.is_cached()
@@ -242,18 +389,18 @@ class DatasetManager:
                     cached_results.append(result_path)
                 else:
                     results.append(result_path)
-                    console.print(
+                    get_console().print(
                         f"  [green]✓[/green] Downloaded to [bright_yellow]{result_path}[/bright_yellow]"
                     )
 
             except Exception as e:
-                console.print(f"  [red]✗[/red] {str(e)}")
+                get_console().print(f"  [red]✗[/red] {str(e)}")
                 # Continue with other downloads
                 continue
 
         # Show summary with details only for fresh downloads
-        console.print()
-        if results:
+        get_console().print()
+        if results and self.show_summary:
             # Calculate total size
             total_size = sum(_get_directory_size(Path(p)) for p in results)
 
@@ -268,26 +415,78 @@ class DatasetManager:
                 for result_path in results:
                     summary += f"  • {result_path}\n"
 
-            console.print(Panel.fit(summary.rstrip(), border_style="green", title="Summary"))
+            get_console().print(Panel.fit(summary.rstrip(), border_style="green", title="Summary"))
 
             # Show directory tree for each download
             for result_path in results:
                 path = Path(result_path)
                 if path.exists():
-                    console.print()
+                    get_console().print()
                     tree = _build_directory_tree(path)
-                    console.print(Panel(tree, border_style="plum1", width=80))
-        elif not cached_results:
+                    get_console().print(Panel(tree, border_style="plum1", width=80))
+        elif not results and not cached_results:
             # Only show error if nothing was downloaded AND nothing was cached
-            console.print(Panel.fit(
+            get_console().print(Panel.fit(
                 f"[bold red]✗ No datasets downloaded[/bold red]",
                 border_style="red"
             ))
-        console.print()
+        get_console().print()
 
         # Return all paths (both fresh downloads and cached)
         return results + cached_results
 
+    def _batch_download(
+        self,
+        downloaders: Dict[Optional[str], Any]
+    ) -> None:
+        """
+        Fetch downloads of providers that support batching in one go.
+
+        Uncached downloads are grouped by provider; a provider class with
+        a ``batch_download`` classmethod and more than one download gets
+        them all in one call. The per-download pass that follows then
+        finds the files complete and only verifies, decompresses and
+        caches them, or retries and reports whatever the batch missed.
+
+        Parameters
+        ----------
+        downloaders : dict
+            Download key -> DatasetDownloader (or the error creating it)
+        """
+        groups: Dict[type, List[DatasetDownloader]] = {}
+        for downloader in downloaders.values():
+            if isinstance(downloader, Exception):
+                continue
+            source = downloader.config.get("src", "")
+            provider_class = registry.get_provider_class(source) if source else None
+            if provider_class is None or not hasattr(provider_class, "batch_download"):
+                continue
+            if downloader.is_cached():
+                continue
+            groups.setdefault(provider_class, []).append(downloader)
+
+        for provider_class, group in groups.items():
+            if len(group) < 2:
+                continue
+
+            max_concurrent = max(
+                int(d.config.get("max_concurrent_downloads") or DEFAULT_MAX_WORKERS)
+                for d in group
+            )
+            get_console().print(
+                f"\n[cyan]Fetching {len(group)} {provider_class.__name__} "
+                f"downloads together[/cyan]"
+            )
+            try:
+                provider_class.batch_download(
+                    [d.config["src"] for d in group],
+                    [d.destination for d in group],
+                    max_concurrent=max_concurrent,
+                    executor=self.executor
+                )
+            except Exception as e:
+                self.logger.debug(f"Batch download incomplete: {e}")
+
     def _parse_requirements(self) -> Dict[Optional[str], Dict[str, Any]]:
         """
         Parse requirements into individual download configurations.
@@ -310,21 +509,17 @@ class DatasetManager:
         if not self.requirements:
             raise ValueError("Requirements not loaded")
 
-        # Detect single vs multi-download
-        first_key = next(iter(self.requirements))
-        first_value = self.requirements[first_key]
-
-        if isinstance(first_value, dict):
-            # Multi-download configuration
-            downloads = {}
-            for key, value in self.requirements.items():
-                if isinstance(value, dict):
-                    downloads[key] = value
-            return downloads
-        else:
-            # Single download configuration
+        # A single download has 'src' at the top level; anything else is a
+        # mapping of download keys to configurations
+        if "src" in self.requirements:
             return {None: self.requirements}
 
+        downloads = {
+            key: value for key, value in self.requirements.items()
+            if isinstance(value, dict)
+        }
+        return downloads if downloads else {None: self.requirements}
+
     def get_download_info(self) -> Dict[str, Any]:
         """
         Get information about configured downloads.
@@ -1,10 +1,19 @@
 """Base class for data providers."""
 
+import subprocess
+import threading
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable
 import logging
 
+import requests
+
+from repo2data.utils.executor import worker_pool
+from repo2data.utils.http import create_session, DEFAULT_POOL_SIZE, RETRY_STATUSES
+
 
 class BaseProvider(ABC):
     """
@@ -14,6 +23,18 @@ class BaseProvider(ABC):
     (e.g., HTTP, S3, Google Drive, etc.).
     """
 
+    # HTTP session shared by all instances of a provider class
+    _session: Optional[requests.Session] = None
+
+    # Keep-alive connections kept per host by the shared session
+    SESSION_POOL_SIZE = DEFAULT_POOL_SIZE
+
+    # Response statuses the shared session retries with backoff
+    RETRY_STATUSES = RETRY_STATUSES
+
+    # stderr lines of a failed command kept for the error message
+    STDERR_TAIL_LINES = 50
+
     def __init__(self, config: Dict[str, Any], destination: Path):
         """
         Initialize the provider.
@@ -31,8 +52,13 @@ class BaseProvider(ABC):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.progress_callback: Optional[Callable[[int, int], None]] = None
 
+        # Shared thread pool (set by DatasetManager); None means each
+        # download starts its own
+        self.executor: Optional[Executor] = None
+
+    @classmethod
     @abstractmethod
-    def can_handle(self, source: str) -> bool:
+    def can_handle(cls, source: str) -> bool:
         """
         Check if this provider can handle the given source.
 
@@ -78,6 +104,43 @@ class BaseProvider(ABC):
         """
         pass
 
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """
+        Get the HTTP session shared by all instances of this provider.
+
+        The session is created on first use, so downloads from the same
+        host reuse pooled keep-alive connections instead of opening a new
+        TCP/TLS connection per request. Connection errors and responses
+        with a status in RETRY_STATUSES (429 and 5xx) are retried with
+        exponential backoff (see ``repo2data.utils.http.create_session``).
+
+        Returns
+        -------
+        requests.Session
+            Shared session for this provider class
+        """
+        # Look in the class' own namespace so subclasses get their own session
+        if cls.__dict__.get('_session') is None:
+            cls._session = create_session(
+                pool_size=cls.SESSION_POOL_SIZE,
+                retry_statuses=cls.RETRY_STATUSES
+            )
+        return cls._session
+
+    @classmethod
+    def close_session(cls) -> None:
+        """Close this provider's shared session and its pooled connections."""
+        session = cls.__dict__.get('_session')
+        if session is not None:
+            session.close()
+            cls._session = None
+
+    @property
+    def session(self) -> requests.Session:
+        """Shared HTTP session of this provider class."""
+        return self.get_session()
+
     def set_progress_callback(
         self,
         callback: Optional[Callable[[int, int], None]]
@@ -92,6 +155,95 @@ class BaseProvider(ABC):
         """
         self.progress_callback = callback
 
+    def _worker_pool(self, max_workers: int):
+        """
+        Get a context manager yielding an executor for this download.
+
+        Runs at most ``max_workers`` tasks at a time, on the shared
+        ``executor`` if one is set (see ``repo2data.utils.executor``).
+
+        Parameters
+        ----------
+        max_workers : int
+            Maximum number of concurrent tasks
+
+        Returns
+        -------
+        contextlib.AbstractContextManager
+            Yields a concurrent.futures.Executor
+        """
+        return worker_pool(self.executor, max_workers)
+
+    def _run_command(
+        self,
+        args: List[str],
+        timeout: Optional[float] = None,
+        env: Optional[Dict[str, str]] = None
+    ) -> subprocess.CompletedProcess:
+        """
+        Run an external command, streaming its output.
+
+        stdout goes straight to the terminal, so CLI progress shows up
+        live. stderr is logged line by line at debug level as it arrives;
+        only the last STDERR_TAIL_LINES lines are kept, so long-running
+        commands do not accumulate their output in memory.
+
+        Parameters
+        ----------
+        args : list of str
+            Command and arguments
+        timeout : float, optional
+            Seconds after which the command is killed
+        env : dict, optional
+            Environment of the command (default: inherit this process')
+
+        Returns
+        -------
+        subprocess.CompletedProcess
+            Result with ``returncode`` and the stderr tail in ``stderr``
+
+        Raises
+        ------
+        FileNotFoundError
+            If the command does not exist
+        subprocess.TimeoutExpired
+            If the command ran longer than ``timeout``
+        """
+        tail = deque(maxlen=self.STDERR_TAIL_LINES)
+        timed_out = threading.Event()
+
+        with subprocess.Popen(
+            args,
+            stdout=None,
+            stderr=subprocess.PIPE,
+            env=env,
+            text=True,
+            errors='replace'
+        ) as proc:
+            def kill():
+                timed_out.set()
+                proc.kill()
+
+            timer = None
+            if timeout is not None:
+                timer = threading.Timer(timeout, kill)
+                timer.start()
+
+            try:
+                for line in proc.stderr:
+                    line = line.rstrip()
+                    self.logger.debug(f"{args[0]}: {line}")
+                    tail.append(line)
+                returncode = proc.wait()
+            finally:
+                if timer is not None:
+                    timer.cancel()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(args, timeout)
+
+        return subprocess.CompletedProcess(args, returncode, None, "\n".join(tail))
+
     def _ensure_destination_exists(self) -> None:
         """Create destination directory if it doesn't exist."""
         self.destination.mkdir(parents=True, exist_ok=True)
@@ -1,7 +1,7 @@
 """Datalad provider for git-annex datasets."""
 
-import re
-import subprocess
+import importlib.util
+import shutil
 from pathlib import Path
 from typing import Dict, Any
 
@@ -15,7 +15,8 @@ class DataladProvider(BaseProvider):
     Uses datalad to clone and install git-annex repositories.
     """
 
-    def can_handle(self, source: str) -> bool:
+    @classmethod
+    def can_handle(cls, source: str) -> bool:
         """
         Check if source is a git repository URL.
 
@@ -29,7 +30,7 @@ class DataladProvider(BaseProvider):
         bool
             True if source ends with .git
         """
-        return bool(re.match(r".*?\.git$", source))
+        return source.endswith('.git')
 
     @property
     def provider_name(self) -> str:
@@ -54,14 +55,48 @@ class DataladProvider(BaseProvider):
         """
         self.logger.info(f"Installing Datalad dataset: {self.source}")
 
-        # Check if datalad is available
-        try:
-            subprocess.run(
-                ['datalad', '--version'],
-                capture_output=True,
-                check=True
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        # Prefer the in-process Python API over spawning the datalad CLI
+        if importlib.util.find_spec('datalad') is not None:
+            try:
+                from datalad.api import install
+
+                install(
+                    path=str(self.destination),
+                    source=self.source,
+                    result_renderer='disabled'
+                )
+
+                self.logger.info(
+                    f"Successfully installed Datalad dataset to {self.destination}"
+                )
+                return self.destination
+
+            except Exception as e:
+                self.logger.error(f"Datalad installation failed: {e}")
+                raise
+
+        return self._install_with_cli()
+
+    def _install_with_cli(self) -> Path:
+        """
+        Install the dataset with the datalad command-line tool.
+
+        Used when the datalad Python package is not importable.
+
+        Returns
+        -------
+        pathlib.Path
+            Path to installed dataset
+
+        Raises
+        ------
+        FileNotFoundError
+            If datalad is not installed
+        Exception
+            If installation fails
+        """
+        # Check if datalad is on PATH (a stat per entry, no process spawn)
+        if shutil.which('datalad') is None:
             raise FileNotFoundError(
                 "datalad is not installed. "
                 "Install instructions: https://www.datalad.org/get_datalad.html"
@@ -69,15 +104,12 @@ class DataladProvider(BaseProvider):
 
         # Run datalad install
         try:
-            result = subprocess.run(
+            result = self._run_command(
                 [
                     'datalad', 'install',
                     str(self.destination),
                     '-s', self.source
-                ],
-                capture_output=True,
-                text=True,
-                check=False
+                ]
             )
 
             if result.returncode != 0:
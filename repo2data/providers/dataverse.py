@@ -1,15 +1,145 @@
 """Dataverse provider for downloading datasets via DOI or dataset URL."""
 
+import functools
 import re
 import json
+import os
+import logging
+import threading
+from concurrent.futures import as_completed
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, BinaryIO, Iterator, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 import requests
+from rich.progress import Progress
 
+from repo2data.cache.api_cache import get_api_response, open_api_response
 from repo2data.providers.base import BaseProvider
-from repo2data.utils.download import download_with_progress, check_disk_space
-from repo2data.utils.logger import console
+from repo2data.utils.download import (
+    copy_response_with_progress,
+    check_disk_space,
+    check_file_size,
+    is_download_complete,
+    partial_path,
+    preallocate,
+    get_available_disk_space,
+    create_progress,
+    unique_file_name,
+    DEFAULT_MAX_WORKERS
+)
+from repo2data.utils.logger import get_console
+
+logger = logging.getLogger(__name__)
+
+_DVN_DOI_RE = re.compile(r"10\.\d+/DVN/\w+")
+_DOI_RE = re.compile(r"(?:doi:)?(10\.\d+/\S+)")
+
+# JSON paths of the entries streamed out of the dataset metadata
+_FILES_PREFIX = "data.latestVersion.files.item"
+_TITLE_PREFIX = "data.latestVersion.metadataBlocks.citation.fields.item"
+_STREAMED_PREFIXES = (_FILES_PREFIX, _TITLE_PREFIX)
+
+
+def _import_ijson():
+    """Import the optional ijson package, returning None if missing."""
+    try:
+        import ijson
+        return ijson
+    except ImportError:
+        return None
+
+
+def _parse_dataset_entries(stream: BinaryIO, ijson) -> Iterator[Tuple[str, Any]]:
+    """Yield ("title", str) and ("file", dict) entries from a JSON stream."""
+    builder = None
+    for prefix, event, value in ijson.parse(stream):
+        if builder is None:
+            if event == 'start_map' and prefix in _STREAMED_PREFIXES:
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            continue
+
+        builder.event(event, value)
+        if event != 'end_map' or prefix not in _STREAMED_PREFIXES:
+            continue
+
+        item, builder = builder.value, None
+        if prefix == _FILES_PREFIX:
+            yield "file", item
+        elif item.get("typeName") == "title":
+            yield "title", item.get("value", "Unknown Dataset")
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_source(source: str) -> Tuple[str, str]:
+    """
+    Parse source to extract Dataverse server and persistent ID.
+
+    Memoized: the same source is parsed by every provider instance that
+    handles it.
+
+    Parameters
+    ----------
+    source : str
+        Source string
+
+    Returns
+    -------
+    tuple of (str, str)
+        (server_url, persistent_id)
+
+    Raises
+    ------
+    ValueError
+        If source cannot be parsed
+    """
+    # Handle dataverse:// protocol
+    # Format: dataverse://server.edu/doi:10.7910/DVN/XXXXXX
+    if source.startswith("dataverse://"):
+        parts = source.replace("dataverse://", "").split("/", 1)
+        if len(parts) == 2:
+            server = f"https://{parts[0]}"
+            persistent_id = parts[1]
+            return server, persistent_id
+
+    # Check if it's a DOI (before trying to parse as URL)
+    # This handles both "doi:10.XXX" and "10.XXX" formats
+    doi_match = _DOI_RE.search(source)
+    if doi_match and not source.startswith("http"):
+        doi = doi_match.group(1)
+        if not doi.startswith("doi:"):
+            doi = f"doi:{doi}"
+        # Default to Harvard Dataverse
+        return "https://dataverse.harvard.edu", doi
+
+    # Handle full URLs
+    try:
+        parsed = urlparse(source)
+
+        # Extract server
+        server = f"{parsed.scheme}://{parsed.netloc}"
+
+        # Extract persistent ID from query parameters
+        if "persistentId=" in source:
+            query_params = parse_qs(parsed.query)
+            persistent_id = query_params.get("persistentId", [None])[0]
+            if persistent_id:
+                return server, persistent_id
+
+        # Fall back to a "doi:"-prefixed DOI in the path or query (not
+        # necessarily the first 10.x in the URL)
+        doi_pos = source.find("doi:10.")
+        doi_match = _DOI_RE.search(source, doi_pos) if doi_pos >= 0 else None
+        if doi_match:
+            persistent_id = doi_match.group(0)
+            # If valid server found, return it
+            if server and server != "://" and not server.startswith("doi://"):
+                return server, persistent_id
+
+    except Exception as e:
+        logger.debug(f"Failed to parse as URL: {e}")
+
+    raise ValueError(f"Could not parse Dataverse source: {source}")
 
 
 class DataverseProvider(BaseProvider):
@@ -36,7 +166,8 @@ class DataverseProvider(BaseProvider):
         "dataverse.lib.umanitoba.ca",
     ]
 
-    def can_handle(self, source: str) -> bool:
+    @classmethod
+    def can_handle(cls, source: str) -> bool:
         """
         Check if source is a Dataverse URL or DOI.
 
@@ -57,13 +188,13 @@ class DataverseProvider(BaseProvider):
         # Check for known Dataverse hosts in URL
         try:
             parsed = urlparse(source)
-            if any(host in parsed.netloc for host in self.KNOWN_DATAVERSE_HOSTS):
+            if any(host in parsed.netloc for host in cls.KNOWN_DATAVERSE_HOSTS):
                 return True
         except:
             pass
 
         # Check for Dataverse DOI pattern (common pattern, not exhaustive)
-        if re.search(r"10\.\d+/DVN/\w+", source):
+        if _DVN_DOI_RE.search(source):
             return True
 
         # Check for persistentId parameter in URL
@@ -96,51 +227,7 @@ class DataverseProvider(BaseProvider):
         ValueError
             If source cannot be parsed
         """
-        # Handle dataverse:// protocol
-        # Format: dataverse://server.edu/doi:10.7910/DVN/XXXXXX
-        if source.startswith("dataverse://"):
-            parts = source.replace("dataverse://", "").split("/", 1)
-            if len(parts) == 2:
-                server = f"https://{parts[0]}"
-                persistent_id = parts[1]
-                return server, persistent_id
-
-        # Check if it's a DOI (before trying to parse as URL)
-        # This handles both "doi:10.XXX" and "10.XXX" formats
-        doi_match = re.search(r"(?:doi:)?(10\.\d+/\S+)", source)
-        if doi_match and not source.startswith("http"):
-            doi = doi_match.group(1)
-            if not doi.startswith("doi:"):
-                doi = f"doi:{doi}"
-            # Default to Harvard Dataverse
-            return "https://dataverse.harvard.edu", doi
-
-        # Handle full URLs
-        try:
-            parsed = urlparse(source)
-
-            # Extract server
-            server = f"{parsed.scheme}://{parsed.netloc}"
-
-            # Extract persistent ID from query parameters
-            if "persistentId=" in source:
-                query_params = parse_qs(parsed.query)
-                persistent_id = query_params.get("persistentId", [None])[0]
-                if persistent_id:
-                    return server, persistent_id
-
-            # Try to extract DOI from path or query
-            doi_match = re.search(r"(doi:10\.\d+/\S+)", source)
-            if doi_match:
-                persistent_id = doi_match.group(1)
-                # If valid server found, return it
-                if server and server != "://" and not server.startswith("doi://"):
-                    return server, persistent_id
-
-        except Exception as e:
-            self.logger.debug(f"Failed to parse as URL: {e}")
-
-        raise ValueError(f"Could not parse Dataverse source: {source}")
+        return _parse_source(source)
 
     def _get_dataset_metadata(self, server: str, persistent_id: str) -> Dict[str, Any]:
         """
@@ -167,19 +254,117 @@ class DataverseProvider(BaseProvider):
         params = {"persistentId": persistent_id}
 
         try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return json.loads(get_api_response(self.session, url, params))
+        except (requests.RequestException, ValueError) as e:
             raise Exception(
                 f"Failed to fetch Dataverse metadata from {server}: {e}\n"
                 f"Make sure the DOI is correct and the server is accessible."
             )
 
+    def _iter_dataset_entries(
+        self,
+        server: str,
+        persistent_id: str,
+        ijson
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream dataset metadata from the Dataverse API with ijson.
+
+        The response is parsed incrementally, so file downloads can start
+        before the full (possibly multi-MB) file list has been received.
+        Goes through the API response cache like ``_get_dataset_metadata``.
+
+        Parameters
+        ----------
+        server : str
+            Dataverse server URL
+        persistent_id : str
+            Dataset persistent identifier (DOI)
+        ijson : module
+            The ijson module
+
+        Yields
+        ------
+        tuple of (str, object)
+            ``("title", str)`` for the citation title and
+            ``("file", dict)`` for each file entry
+
+        Raises
+        ------
+        Exception
+            If API request fails
+        """
+        url = f"{server}/api/datasets/:persistentId"
+        params = {"persistentId": persistent_id}
+
+        try:
+            with open_api_response(self.session, url, params) as body:
+                yield from _parse_dataset_entries(body, ijson)
+
+        except (requests.RequestException, ijson.JSONError) as e:
+            raise Exception(
+                f"Failed to fetch Dataverse metadata from {server}: {e}\n"
+                f"Make sure the DOI is correct and the server is accessible."
+            )
+
+    def _get_dataset_entries(
+        self,
+        server: str,
+        persistent_id: str
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Fetch dataset metadata in one request and yield its entries.
+
+        Used when ijson is not installed. Also checks disk space for the
+        whole dataset up front, since all file sizes are known.
+
+        Yields
+        ------
+        tuple of (str, object)
+            ``("title", str)``, ``("count", int)`` and ``("file", dict)``
+            entries, as in ``_iter_dataset_entries``
+        """
+        metadata = self._get_dataset_metadata(server, persistent_id)
+
+        # Extract dataset information
+        data = metadata.get("data", {})
+        latest_version = data.get("latestVersion", {})
+        title = latest_version.get("metadataBlocks", {}).get("citation", {}).get(
+            "fields", []
+        )
+
+        # Try to get title from metadata
+        dataset_title = next(
+            (
+                field.get("value", "Unknown Dataset")
+                for field in (title if isinstance(title, list) else ())
+                if field.get("typeName") == "title"
+            ),
+            "Unknown Dataset"
+        )
+
+        files = latest_version.get("files", [])
+
+        if files:
+            # Check disk space once for the whole dataset
+            total_size = sum(
+                f.get("dataFile", {}).get("filesize", 0) or 0 for f in files
+            )
+            if total_size > 0:
+                check_disk_space(self.destination, total_size)
+
+        yield "title", dataset_title
+        yield "count", len(files)
+        for file_info in files:
+            yield "file", file_info
+
     def download(self) -> Path:
         """
         Download dataset from Dataverse.
 
+        If ijson is installed, the file list is parsed while it streams in
+        and each file is queued for download as soon as it is read.
+
         Returns
         -------
         pathlib.Path
@@ -200,62 +385,137 @@ class DataverseProvider(BaseProvider):
 
         self.logger.info(f"Fetching Dataverse dataset: {persistent_id} from {server}")
 
-        # Get dataset metadata
-        try:
-            metadata = self._get_dataset_metadata(server, persistent_id)
-        except Exception as e:
-            raise Exception(f"Failed to access Dataverse: {e}")
-
-        # Extract dataset information
-        data = metadata.get("data", {})
-        latest_version = data.get("latestVersion", {})
-        title = latest_version.get("metadataBlocks", {}).get("citation", {}).get(
-            "fields", []
-        )
-
-        # Try to get title from metadata
+        ijson = _import_ijson()
+        if ijson is not None:
+            entries = self._iter_dataset_entries(server, persistent_id, ijson)
+        else:
+            entries = self._get_dataset_entries(server, persistent_id)
+
+        # Download files concurrently, starting each as soon as it is listed.
+        # Workers are capped at the session pool size so every worker keeps
+        # a keep-alive connection instead of a new TCP/TLS handshake per file.
+        max_workers = max(1, min(
+            int(self.config.get("max_concurrent_downloads") or DEFAULT_MAX_WORKERS),
+            self.SESSION_POOL_SIZE
+        ))
+        print_lock = threading.Lock()
+        errors = []
+        futures = []
         dataset_title = "Unknown Dataset"
-        for field in title if isinstance(title, list) else []:
-            if field.get("typeName") == "title":
-                dataset_title = field.get("value", "Unknown Dataset")
-                break
+        file_count = None
+        # Streamed listings have no total up front: reserve space per file
+        available = get_available_disk_space(self.destination)
+        reserved = 0
+        used_names = set()
+
+        with create_progress() as progress, \
+                self._worker_pool(max_workers) as executor:
+            try:
+                for kind, value in entries:
+                    if kind == "title":
+                        dataset_title = value
+                        continue
+                    if kind == "count":
+                        file_count = value
+                        continue
+
+                    if not futures:
+                        with print_lock:
+                            get_console().print(f"  [cyan]Dataverse:[/cyan] {dataset_title}")
+                            get_console().print(f"  [cyan]Server:[/cyan] {server}")
+                            if file_count is not None:
+                                get_console().print(f"  [dim]Files: {file_count}[/dim]")
+
+                    if file_count is None:
+                        reserved += value.get("dataFile", {}).get("filesize", 0) or 0
+                        check_disk_space(
+                            self.destination, reserved, available=available
+                        )
+
+                    # Folders (directoryLabel) of a dataset may repeat a name
+                    file_metadata = value.get("dataFile", {})
+                    file_name = unique_file_name(
+                        file_metadata.get("filename") or f"file_{len(futures) + 1}",
+                        file_metadata.get("id"),
+                        used_names
+                    )
+                    futures.append(executor.submit(
+                        self._download_one, server, value, file_name, progress
+                    ))
+            except Exception as e:
+                for future in futures:
+                    future.cancel()
+                if isinstance(e, OSError):
+                    raise
+                raise Exception(f"Failed to access Dataverse: {e}")
+
+            for future in as_completed(futures):
+                file_name, file_path, error = future.result()
+                with print_lock:
+                    if error is not None:
+                        errors.append(error)
+                        get_console().print(f"  [red]✗[/red] {error}")
+                    elif file_path is not None:
+                        get_console().print(f"  [green]✓[/green] Downloaded {file_name}")
+
+        if not futures:
+            raise ValueError(f"No files found in Dataverse dataset {persistent_id}")
 
-        files = latest_version.get("files", [])
+        if errors:
+            raise Exception(errors[0])
 
-        if not files:
-            raise ValueError(f"No files found in Dataverse dataset {persistent_id}")
+        self.logger.info(
+            f"Successfully downloaded {len(futures)} file(s) from Dataverse"
+        )
+        return self.destination
 
-        console.print(f"  [cyan]Dataverse:[/cyan] {dataset_title}")
-        console.print(f"  [cyan]Server:[/cyan] {server}")
-        console.print(f"  [dim]Files: {len(files)}[/dim]")
+    def _download_one(
+        self,
+        server: str,
+        file_info: Dict[str, Any],
+        file_name: str,
+        progress: Progress
+    ) -> Tuple[str, Optional[Path], Optional[str]]:
+        """
+        Download a single Dataverse file.
 
-        # Download all files
-        for idx, file_info in enumerate(files, 1):
-            file_metadata = file_info.get("dataFile", {})
-            file_name = file_metadata.get("filename", f"file_{idx}")
-            file_id = file_metadata.get("id")
-            file_size = file_metadata.get("filesize", 0)
+        Parameters
+        ----------
+        server : str
+            Dataverse server URL
+        file_info : dict
+            File entry from the dataset metadata
+        file_name : str
+            Name to save the file as, unique within the dataset
+        progress : rich.progress.Progress
+            Shared progress display
 
-            if not file_id:
-                self.logger.warning(f"No file ID for: {file_name}")
-                continue
+        Returns
+        -------
+        tuple of (str, pathlib.Path or None, str or None)
+            (file_name, downloaded_path, error_message)
+        """
+        file_metadata = file_info.get("dataFile", {})
+        file_id = file_metadata.get("id")
+        file_size = file_metadata.get("filesize", 0)
 
-            file_path = self.destination / file_name
+        if not file_id:
+            self.logger.warning(f"No file ID for: {file_name}")
+            return file_name, None, None
 
-            console.print(f"  [cyan]({idx}/{len(files)})[/cyan] {file_name}")
+        file_path = self.destination / file_name
+        part_path = partial_path(file_path)
 
-            # Check disk space
-            if file_size > 0:
-                try:
-                    check_disk_space(self.destination, file_size)
-                except OSError as e:
-                    raise OSError(f"Insufficient disk space for {file_name}: {e}")
+        # A complete copy from an earlier run is reused as-is
+        if is_download_complete(file_path, file_size):
+            self.logger.debug(f"{file_name} already downloaded, skipping")
+            return file_name, file_path, None
 
-            # Download file using Dataverse API
-            download_url = f"{server}/api/access/datafile/{file_id}"
+        # Download file using Dataverse API
+        download_url = f"{server}/api/access/datafile/{file_id}"
 
-            try:
-                response = requests.get(download_url, stream=True, timeout=60)
+        try:
+            with self.session.get(download_url, stream=True, timeout=60) as response:
                 response.raise_for_status()
 
                 # Get actual size from headers if not in metadata
@@ -263,21 +523,22 @@ class DataverseProvider(BaseProvider):
                 if not total_size:
                     total_size = int(response.headers.get('content-length', 0))
 
-                # Download with progress
-                with open(file_path, 'wb') as f:
-                    downloaded = download_with_progress(
-                        response.iter_content,
+                # Download with progress into <name>.part
+                with open(part_path, 'wb') as f:
+                    preallocate(f.fileno(), total_size)
+                    copy_response_with_progress(
+                        response,
                         f,
                         total_size=total_size if total_size > 0 else None,
-                        description=f"  Downloading {file_name}"
+                        description=f"  Downloading {file_name}",
+                        progress=progress
                     )
 
-                console.print(f"  [green]✓[/green] Downloaded {file_name}")
+            check_file_size(part_path, file_size)
+            os.replace(part_path, file_path)
 
-            except requests.RequestException as e:
-                raise Exception(f"Failed to download {file_name}: {e}")
+        except (requests.RequestException, OSError) as e:
+            part_path.unlink(missing_ok=True)
+            return file_name, None, f"Failed to download {file_name}: {e}"
 
-        self.logger.info(
-            f"Successfully downloaded {len(files)} file(s) from Dataverse"
-        )
-        return self.destination
+        return file_name, file_path, None
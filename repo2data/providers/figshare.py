@@ -1,15 +1,82 @@
 """Figshare provider for downloading datasets via DOI or article ID."""
 
+import functools
 import re
 import json
+import os
+import threading
+from concurrent.futures import as_completed
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from urllib.parse import urlparse
 import requests
+from rich.progress import Progress
 
+from repo2data.cache.api_cache import get_api_response
 from repo2data.providers.base import BaseProvider
-from repo2data.utils.download import download_with_progress, check_disk_space
-from repo2data.utils.logger import console
+from repo2data.utils.download import (
+    copy_response_with_progress,
+    check_disk_space,
+    check_file_size,
+    is_download_complete,
+    partial_path,
+    preallocate,
+    create_progress,
+    unique_file_name,
+    DEFAULT_MAX_WORKERS
+)
+from repo2data.utils.logger import get_console
+
+_FIGSHARE_DOI_RE = re.compile(r"10\.6084/m9\.figshare\.(\d+)")
+_FIGSHARE_URL_RE = re.compile(r"figshare\.com/articles/.*/(\d+)")
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_article_id(source: str) -> str:
+    """
+    Extract Figshare article ID from various source formats.
+
+    Memoized: the same source is parsed by every provider instance that
+    handles it.
+
+    Parameters
+    ----------
+    source : str
+        Source string (DOI, URL, or article ID)
+
+    Returns
+    -------
+    str
+        Article ID
+
+    Raises
+    ------
+    ValueError
+        If article ID cannot be extracted
+    """
+    # Extract from DOI
+    doi_match = _FIGSHARE_DOI_RE.search(source)
+    if doi_match:
+        return doi_match.group(1)
+
+    # Extract from URL - handles various URL formats
+    # Examples:
+    # - https://figshare.com/articles/dataset/Title/7778845
+    # - https://figshare.com/articles/Title/7778845
+    # Match the last numeric segment in the path
+    url_match = _FIGSHARE_URL_RE.search(source)
+    if url_match:
+        return url_match.group(1)
+
+    # Extract from figshare:// protocol
+    if source.startswith("figshare://"):
+        return source.replace("figshare://", "")
+
+    # Try as direct article ID
+    if source.isdigit():
+        return source
+
+    raise ValueError(f"Could not extract Figshare article ID from: {source}")
 
 
 class FigshareProvider(BaseProvider):
@@ -26,7 +93,8 @@ class FigshareProvider(BaseProvider):
 
     FIGSHARE_API_BASE = "https://api.figshare.com/v2"
 
-    def can_handle(self, source: str) -> bool:
+    @classmethod
+    def can_handle(cls, source: str) -> bool:
         """
         Check if source is a Figshare DOI, URL, or article ID.
 
@@ -41,7 +109,7 @@ class FigshareProvider(BaseProvider):
             True if source matches Figshare pattern
         """
         # Check for Figshare DOI
-        if re.search(r"10\.6084/m9\.figshare\.\d+", source):
+        if _FIGSHARE_DOI_RE.search(source):
             return True
 
         # Check for Figshare URL
@@ -78,29 +146,7 @@ class FigshareProvider(BaseProvider):
         ValueError
             If article ID cannot be extracted
         """
-        # Extract from DOI
-        doi_match = re.search(r"10\.6084/m9\.figshare\.(\d+)", source)
-        if doi_match:
-            return doi_match.group(1)
-
-        # Extract from URL - handles various URL formats
-        # Examples:
-        # - https://figshare.com/articles/dataset/Title/7778845
-        # - https://figshare.com/articles/Title/7778845
-        # Match the last numeric segment in the path
-        url_match = re.search(r"figshare\.com/articles/.*/(\d+)", source)
-        if url_match:
-            return url_match.group(1)
-
-        # Extract from figshare:// protocol
-        if source.startswith("figshare://"):
-            return source.replace("figshare://", "")
-
-        # Try as direct article ID
-        if source.isdigit():
-            return source
-
-        raise ValueError(f"Could not extract Figshare article ID from: {source}")
+        return _extract_article_id(source)
 
     def _get_article_metadata(self, article_id: str) -> Dict[str, Any]:
         """
@@ -124,10 +170,8 @@ class FigshareProvider(BaseProvider):
         url = f"{self.FIGSHARE_API_BASE}/articles/{article_id}"
 
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return json.loads(get_api_response(self.session, url))
+        except (requests.RequestException, ValueError) as e:
             raise Exception(f"Failed to fetch Figshare metadata: {e}")
 
     def download(self) -> Path:
@@ -163,33 +207,95 @@ class FigshareProvider(BaseProvider):
         if not files:
             raise ValueError(f"No files found in Figshare article {article_id}")
 
-        console.print(f"  [cyan]Figshare:[/cyan] {title}")
-        console.print(f"  [dim]Files: {len(files)}[/dim]")
+        get_console().print(f"  [cyan]Figshare:[/cyan] {title}")
+        get_console().print(f"  [dim]Files: {len(files)}[/dim]")
+
+        # Check disk space once for the whole article
+        total_size = sum(f.get("size", 0) or 0 for f in files)
+        if total_size > 0:
+            check_disk_space(self.destination, total_size)
+
+        # Download files concurrently, at most one worker per pooled connection
+        max_workers = max(1, min(
+            int(self.config.get("max_concurrent_downloads") or DEFAULT_MAX_WORKERS),
+            len(files),
+            self.SESSION_POOL_SIZE
+        ))
+        print_lock = threading.Lock()
+        errors = []
+
+        # An article may list the same name twice; concurrent downloads
+        # must not share a target
+        used_names = set()
+        file_names = [
+            unique_file_name(
+                file_info.get("name") or f"file_{idx}", file_info.get("id"), used_names
+            )
+            for idx, file_info in enumerate(files, 1)
+        ]
+
+        with create_progress() as progress, \
+                self._worker_pool(max_workers) as executor:
+            futures = [
+                executor.submit(self._download_one, file_info, file_name, progress)
+                for file_info, file_name in zip(files, file_names)
+            ]
+
+            for future in as_completed(futures):
+                file_name, file_path, error = future.result()
+                with print_lock:
+                    if error is not None:
+                        errors.append(error)
+                        get_console().print(f"  [red]✗[/red] {error}")
+                    elif file_path is not None:
+                        get_console().print(f"  [green]✓[/green] Downloaded {file_name}")
+
+        if errors:
+            raise Exception(errors[0])
 
-        # Download all files
-        for idx, file_info in enumerate(files, 1):
-            file_name = file_info.get("name", f"file_{idx}")
-            file_url = file_info.get("download_url")
-            file_size = file_info.get("size", 0)
+        self.logger.info(f"Successfully downloaded {len(files)} file(s) from Figshare")
+        return self.destination
 
-            if not file_url:
-                self.logger.warning(f"No download URL for file: {file_name}")
-                continue
+    def _download_one(
+        self,
+        file_info: Dict[str, Any],
+        file_name: str,
+        progress: Progress
+    ) -> Tuple[str, Optional[Path], Optional[str]]:
+        """
+        Download a single Figshare file.
 
-            file_path = self.destination / file_name
+        Parameters
+        ----------
+        file_info : dict
+            File entry from the article metadata
+        file_name : str
+            Name to save the file as, unique within the article
+        progress : rich.progress.Progress
+            Shared progress display
 
-            console.print(f"  [cyan]({idx}/{len(files)})[/cyan] {file_name}")
+        Returns
+        -------
+        tuple of (str, pathlib.Path or None, str or None)
+            (file_name, downloaded_path, error_message)
+        """
+        file_url = file_info.get("download_url")
+        file_size = file_info.get("size", 0)
+
+        if not file_url:
+            self.logger.warning(f"No download URL for file: {file_name}")
+            return file_name, None, None
+
+        file_path = self.destination / file_name
+        part_path = partial_path(file_path)
 
-            # Check disk space
-            if file_size > 0:
-                try:
-                    check_disk_space(self.destination, file_size)
-                except OSError as e:
-                    raise OSError(f"Insufficient disk space for {file_name}: {e}")
+        # A complete copy from an earlier run is reused as-is
+        if is_download_complete(file_path, file_size):
+            self.logger.debug(f"{file_name} already downloaded, skipping")
+            return file_name, file_path, None
 
-            # Download file
-            try:
-                response = requests.get(file_url, stream=True, timeout=60)
+        try:
+            with self.session.get(file_url, stream=True, timeout=60) as response:
                 response.raise_for_status()
 
                 # Get actual size from headers if not in metadata
@@ -197,19 +303,22 @@ class FigshareProvider(BaseProvider):
                 if not total_size:
                     total_size = int(response.headers.get('content-length', 0))
 
-                # Download with progress
-                with open(file_path, 'wb') as f:
-                    downloaded = download_with_progress(
-                        response.iter_content,
+                # Download with progress into <name>.part
+                with open(part_path, 'wb') as f:
+                    preallocate(f.fileno(), total_size)
+                    copy_response_with_progress(
+                        response,
                         f,
                         total_size=total_size if total_size > 0 else None,
-                        description=f"  Downloading {file_name}"
+                        description=f"  Downloading {file_name}",
+                        progress=progress
                     )
 
-                console.print(f"  [green]✓[/green] Downloaded {file_name}")
+            check_file_size(part_path, file_size)
+            os.replace(part_path, file_path)
 
-            except requests.RequestException as e:
-                raise Exception(f"Failed to download {file_name}: {e}")
+        except (requests.RequestException, OSError) as e:
+            part_path.unlink(missing_ok=True)
+            return file_name, None, f"Failed to download {file_name}: {e}"
 
-        self.logger.info(f"Successfully downloaded {len(files)} file(s) from Figshare")
-        return self.destination
+        return file_name, file_path, None
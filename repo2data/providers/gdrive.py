@@ -1,8 +1,6 @@
 """Google Drive provider for downloading files."""
 
 import os
-import re
-import subprocess
 from pathlib import Path
 from typing import Dict, Any
 
@@ -13,10 +11,12 @@ class GoogleDriveProvider(BaseProvider):
     """
     Provider for Google Drive downloads.
 
-    Uses gdown utility to download files from Google Drive.
+    Uses the gdown package to download files and folders from Google
+    Drive.
     """
 
-    def can_handle(self, source: str) -> bool:
+    @classmethod
+    def can_handle(cls, source: str) -> bool:
         """
         Check if source is a Google Drive URL.
 
@@ -30,7 +30,7 @@ class GoogleDriveProvider(BaseProvider):
         bool
             True if source is a Google Drive URL
         """
-        return bool(re.match(r".*?(drive\.google\.com).*", source))
+        return 'drive.google.com' in source
 
     @property
     def provider_name(self) -> str:
@@ -39,7 +39,10 @@ class GoogleDriveProvider(BaseProvider):
 
     def download(self) -> Path:
         """
-        Download file from Google Drive.
+        Download a file or folder from Google Drive.
+
+        Folder links (``https://drive.google.com/drive/folders/<id>``) are
+        downloaded with all their contents into the destination.
 
         Returns
         -------
@@ -59,40 +62,41 @@ class GoogleDriveProvider(BaseProvider):
             f"Downloading from Google Drive: {self.source}"
         )
 
-        # Check if gdown is available
         try:
-            subprocess.run(
-                ['gdown', '--version'],
-                capture_output=True,
-                check=True
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
+            import gdown
+        except ImportError:
             raise FileNotFoundError(
                 "gdown is not installed. Install with: pip install gdown"
             )
 
-        # gdown doesn't support output directory, so we need to change cwd
-        original_cwd = os.getcwd()
+        # FileURLRetrievalError only exists in gdown >= 5; older versions
+        # return None on failure instead of raising
+        retrieval_error = getattr(
+            getattr(gdown, 'exceptions', None), 'FileURLRetrievalError', None
+        ) or ()
 
         try:
-            os.chdir(self.destination)
-
-            # Run gdown
-            result = subprocess.run(
-                ['gdown', self.source],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-
-            if result.returncode != 0:
-                self.logger.error(f"gdown stderr: {result.stderr}")
-                raise Exception(
-                    f"gdown failed with return code {result.returncode}"
+            if '/folders/' in self.source:
+                # Fetches every file of the folder over one gdown session
+                output = gdown.download_folder(
+                    url=self.source,
+                    output=str(self.destination),
+                    quiet=False,
+                    use_cookies=False
+                )
+            else:
+                # A trailing separator makes gdown keep the server-side filename
+                output = gdown.download(
+                    self.source,
+                    output=str(self.destination) + os.sep,
+                    quiet=False,
+                    fuzzy=True
                 )
+        except retrieval_error as e:
+            raise Exception(f"gdown failed to download {self.source}: {e}")
 
-            self.logger.info(f"Successfully downloaded to {self.destination}")
-            return self.destination
+        if output is None:
+            raise Exception(f"gdown failed to download {self.source}")
 
-        finally:
-            os.chdir(original_cwd)
+        self.logger.info(f"Successfully downloaded to {self.destination}")
+        return self.destination
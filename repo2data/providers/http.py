@@ -1,19 +1,54 @@
 """HTTP/HTTPS provider for downloading files."""
 
+import os
 import re
-import time
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Optional, Tuple
+from urllib.parse import urlparse
 import requests
 
 from repo2data.providers.base import BaseProvider
 from repo2data.utils.download import (
-    download_with_progress,
+    copy_response_with_progress,
     check_disk_space,
+    check_file_size,
+    is_download_complete,
+    partial_path,
+    temporary_path,
+    preallocate,
     verify_checksum,
-    compute_checksum
+    compute_checksum,
+    new_hasher,
+    BLAKE3_MMAP_THRESHOLD,
+    create_progress,
+    drop_from_page_cache,
+    COPY_CHUNK_SIZE
 )
-from repo2data.utils.logger import console
+from repo2data.utils.logger import get_console
+
+# Files larger than this are split into parallel range requests
+RANGE_THRESHOLD = 32 * 1024 * 1024
+DEFAULT_CONNECTIONS_PER_FILE = 6
+RANGE_CHUNK_SIZE = 1024 * 1024
+
+# Times a broken-off single-stream transfer is resumed with a Range request
+MAX_RESUME_ATTEMPTS = 3
+
+# (connect, read) timeouts in seconds: unreachable hosts fail after 5 s,
+# slow but live transfers get 30 s between reads
+TIMEOUT = (5, 30)
+
+# Filename in a Content-Disposition header
+_CD_FILENAME_RE = re.compile(r'filename="?([^"]+)"?')
+
+# Extension for downloads whose URL has no filename, by Content-Type
+_EXT_MAP = {
+    'application/zip': '.zip',
+    'application/x-tar': '.tar',
+    'application/gzip': '.tar.gz',
+    'application/x-gzip': '.tar.gz',
+}
 
 
 class HTTPProvider(BaseProvider):
@@ -23,22 +58,8 @@ class HTTPProvider(BaseProvider):
     Downloads files from generic HTTP/HTTPS URLs using the requests library.
     """
 
-    def __init__(self, config: Dict[str, Any], destination: Path):
-        """
-        Initialize HTTP provider.
-
-        Parameters
-        ----------
-        config : dict
-            Configuration containing 'src' URL
-        destination : pathlib.Path
-            Destination directory
-        """
-        super().__init__(config, destination)
-        self.max_retries = 3
-        self.retry_delay = 5  # seconds
-
-    def can_handle(self, source: str) -> bool:
+    @classmethod
+    def can_handle(cls, source: str) -> bool:
         """
         Check if source is an HTTP/HTTPS URL.
 
@@ -54,18 +75,15 @@ class HTTPProvider(BaseProvider):
         bool
             True if this is a generic HTTP/HTTPS URL
         """
-        # Check for HTTP/HTTPS
-        is_http = bool(
-            re.match(r".*?(https?://).*", source)
-        )
+        is_http = 'http://' in source or 'https://' in source
 
         if not is_http:
             return False
 
         # Exclude specialized providers
-        is_git = bool(re.match(r".*?\.git$", source))
-        is_gdrive = bool(re.match(r".*?(drive\.google\.com).*", source))
-        is_osf = bool(re.match(r".*?(https://osf\.io).*", source))
+        is_git = source.endswith('.git')
+        is_gdrive = 'drive.google.com' in source
+        is_osf = 'https://osf.io' in source
 
         return not (is_git or is_gdrive or is_osf)
 
@@ -74,10 +92,26 @@ class HTTPProvider(BaseProvider):
         """Get provider name."""
         return "HTTP"
 
+    @property
+    def max_retries(self) -> int:
+        """Retries per request of the shared session (read-only)."""
+        return self.session.get_adapter('https://').max_retries.total
+
+    @property
+    def retry_delay(self) -> float:
+        """Backoff factor between retries, in seconds (read-only)."""
+        return self.session.get_adapter('https://').max_retries.backoff_factor
+
     def download(self) -> Path:
         """
         Download file from HTTP/HTTPS URL with progress tracking and verification.
 
+        A HEAD request is sent first to fail fast on 404/403 and to check
+        disk space before any data is transferred. Large files on servers
+        that accept byte ranges are fetched over several parallel
+        connections (``connections_per_file`` in the config, default 6);
+        otherwise a single stream is used.
+
         Returns
         -------
         pathlib.Path
@@ -86,7 +120,7 @@ class HTTPProvider(BaseProvider):
         Raises
         ------
         Exception
-            If download fails after all retries
+            If download fails (after the session's retries)
         OSError
             If insufficient disk space
         ValueError
@@ -97,104 +131,707 @@ class HTTPProvider(BaseProvider):
         url = self.source
         self.logger.debug(f"Downloading from {url}")
 
-        # Get checksum from config if provided
-        expected_checksum = self.config.get("checksum")
-        checksum_algorithm = self.config.get("checksum_algorithm", "sha256")
+        connections = int(
+            self.config.get("connections_per_file") or DEFAULT_CONNECTIONS_PER_FILE
+        )
+
+        # With a checksum configured, a copy named after the URL can be
+        # verified locally without touching the network
+        url_filename = self._url_filename(url)
+        if url_filename and self.config.get("checksum"):
+            filepath = self.destination / url_filename
+            if filepath.is_file() and self._matches_checksum(filepath):
+                get_console().print(f"  [green]✓[/green] {filepath.name} already downloaded")
+                self.logger.debug(f"Reusing existing {filepath} (checksum matches)")
+                return filepath
+
+        # Probe with HEAD first: a bad URL fails without opening a transfer,
+        # and the size is known for the disk-space check up front
+        head = self._head(url)
+        if head is not None and head.status_code in (403, 404):
+            self._raise_for_status(url, head)
+
+        probed = head is not None and head.status_code == 200
+        checked_size = None
+        if probed:
+            filename = self._extract_filename(url, head)
+            filepath = self.destination / filename
+
+            # Content-Length is the encoded size for compressed transfers
+            encoded = head.headers.get('content-encoding', 'identity') != 'identity'
+            total_size = int(head.headers.get('content-length', 0))
+
+            etag = head.headers.get('etag')
+
+            if self._is_reusable(filepath, 0 if encoded else total_size, etag):
+                return filepath
+
+            self._check_space(total_size)
+            checked_size = total_size
+
+            # Parallel ranged download for large files
+            if (
+                connections > 1
+                and hasattr(os, 'pwrite')
+                and self._accepts_ranges(head, total_size)
+            ):
+                tmp_filepath = temporary_path(filepath)
+                try:
+                    if self._download_ranges(
+                        url, tmp_filepath, total_size, connections,
+                        description=f"  Downloading {filename}"
+                    ):
+                        return self._finalize(tmp_filepath, filepath, etag=etag)
+                except requests.RequestException as e:
+                    raise Exception(f"Download of {url} interrupted: {e}")
+                finally:
+                    # Gone after a successful os.replace
+                    tmp_filepath.unlink(missing_ok=True)
+
+                # Server ignored the Range header: fall back to one stream
+                self.logger.debug("Ranged download not honoured, using single stream")
+
+            # Continue a transfer that broke off in an earlier run
+            if etag and not encoded and total_size > 0:
+                resumed = self._resume_partial(url, filepath, total_size, etag)
+                if resumed is not None:
+                    return resumed
+
+        # Connection errors and 5xx responses are retried with backoff by
+        # the session's HTTPAdapter (see BaseProvider.get_session)
+        try:
+            response = self.session.get(url, stream=True, timeout=TIMEOUT)
+        except requests.RequestException as e:
+            raise Exception(
+                f"Failed to download from {url}: {e}\n"
+                f"Please check your internet connection and try again."
+            )
 
-        for retry in range(self.max_retries):
+        with response:
+            self._raise_for_status(url, response)
+
+            # Get filename and file size
+            filename = self._extract_filename(url, response)
+            filepath = self.destination / filename
+
+            # Content-Length is the encoded size for compressed transfers
+            encoded = response.headers.get('content-encoding', 'identity') != 'identity'
+            total_size = int(response.headers.get('content-length', 0))
+            expected_size = 0 if encoded else total_size
+            etag = response.headers.get('etag')
+
+            # Skip what the HEAD probe already covered
+            if not probed and self._is_reusable(filepath, expected_size, etag):
+                return filepath
+
+            if total_size != checked_size:
+                self._check_space(total_size)
+
+            # Hash while writing so the file is not read back to verify it.
+            # Large blake3 files are hashed afterwards instead, on all cores
+            hasher = None
+            checksum_algorithm = self.config.get("checksum_algorithm", "sha256")
+            if self.config.get("checksum") and not (
+                checksum_algorithm.lower() == 'blake3'
+                and total_size > BLAKE3_MMAP_THRESHOLD
+            ):
+                hasher = new_hasher(checksum_algorithm)
+
+            # Download with progress bar
+            tmp_filepath = temporary_path(filepath)
             try:
-                response = requests.get(url, stream=True, timeout=30)
+                hasher = self._stream_to_file(
+                    url,
+                    response,
+                    tmp_filepath,
+                    filename,
+                    total_size,
+                    resumable=not encoded,
+                    hasher=hasher,
+                    etag=etag
+                )
+                check_file_size(tmp_filepath, expected_size)
+                return self._finalize(
+                    tmp_filepath,
+                    filepath,
+                    actual_checksum=hasher.hexdigest() if hasher else None,
+                    etag=etag
+                )
 
-                if response.status_code == 200:
-                    # Get filename and file size
-                    filename = self._extract_filename(url, response)
-                    filepath = self.destination / filename
-                    tmp_filepath = filepath.with_suffix(filepath.suffix + '.tmp')
+            except requests.RequestException as e:
+                if etag and not encoded and self._keep_partial(tmp_filepath, filepath, etag):
+                    raise Exception(
+                        f"Download of {url} interrupted: {e}\n"
+                        f"The partial file was kept; run again to resume."
+                    )
+                raise Exception(f"Download of {url} interrupted: {e}")
+            finally:
+                # Clean up temp file on any error
+                tmp_filepath.unlink(missing_ok=True)
 
-                    total_size = int(response.headers.get('content-length', 0))
+    def _keep_partial(self, tmp_filepath: Path, filepath: Path, etag: str) -> bool:
+        """
+        Keep the data of a failed transfer as ``<name>.part`` for a later run.
 
-                    # Check disk space before downloading
-                    if total_size > 0:
-                        try:
-                            check_disk_space(self.destination, total_size)
-                        except OSError as e:
-                            console.print(f"  [red]✗[/red] {str(e)}")
-                            raise
+        The response ETag is recorded next to it, so the next run only
+        resumes if the file on the server is unchanged.
 
-                    # Download with progress bar
-                    try:
-                        with open(tmp_filepath, 'wb') as f:
-                            downloaded = download_with_progress(
-                                response.iter_content,
-                                f,
-                                total_size=total_size if total_size > 0 else None,
-                                description=f"  Downloading {filename}"
-                            )
+        Returns
+        -------
+        bool
+            True if a non-empty partial file was kept
+        """
+        try:
+            if tmp_filepath.stat().st_size == 0:
+                return False
+            part_path = partial_path(filepath)
+            os.replace(tmp_filepath, part_path)
+            self._etag_path(part_path).write_text(etag)
+        except OSError as e:
+            self.logger.debug(f"Could not keep partial download: {e}")
+            return False
+        return True
 
-                        # Verify checksum if provided
-                        if expected_checksum:
-                            console.print(f"  [cyan]Verifying checksum ({checksum_algorithm})...[/cyan]")
-                            try:
-                                verify_checksum(tmp_filepath, expected_checksum, checksum_algorithm)
-                                console.print(f"  [green]✓[/green] Checksum verified")
-                            except ValueError as e:
-                                # Clean up failed download
-                                tmp_filepath.unlink(missing_ok=True)
-                                raise
+    def _resume_partial(
+        self,
+        url: str,
+        filepath: Path,
+        total_size: int,
+        etag: str
+    ) -> Optional[Path]:
+        """
+        Finish a ``<name>.part`` left by an interrupted earlier run.
+
+        The rest of the file is requested with ``Range: bytes=<size>-``
+        and ``If-Range: <etag>``: if the file changed on the server, the
+        server answers with the full body instead, and the partial file is
+        discarded. A partial file whose recorded ETag differs from the
+        current one is discarded without a request.
+
+        Parameters
+        ----------
+        url : str
+            Download URL
+        filepath : pathlib.Path
+            Final path of the download
+        total_size : int
+            Size of the complete file (from the HEAD probe)
+        etag : str
+            Current ETag of the file (from the HEAD probe)
 
-                        # Atomic move: tmp -> final
-                        tmp_filepath.rename(filepath)
+        Returns
+        -------
+        pathlib.Path or None
+            Path to the completed file, or None if there was nothing to
+            resume (the caller then downloads from scratch)
 
-                        self.logger.debug(f"Downloaded to {filepath}")
-                        return filepath
+        Raises
+        ------
+        Exception
+            If the resumed transfer is interrupted (the partial file is
+            kept, with the data received so far)
+        ValueError
+            If checksum verification fails
+        """
+        part_path = partial_path(filepath)
+        etag_path = self._etag_path(part_path)
+        try:
+            offset = part_path.stat().st_size
+            recorded = etag_path.read_text().strip()
+        except OSError:
+            return None
+
+        response = None
+        if 0 < offset < total_size and recorded == etag:
+            try:
+                response = self.session.get(
+                    url,
+                    headers={'Range': f'bytes={offset}-', 'If-Range': etag},
+                    stream=True,
+                    timeout=TIMEOUT
+                )
+            except requests.RequestException as e:
+                # Keep the partial file; the regular download reports the error
+                self.logger.debug(f"Resume request failed: {e}")
+                return None
+            content_range = response.headers.get('content-range', '')
+            if not (
+                response.status_code == 206
+                and content_range.startswith(f"bytes {offset}-")
+            ):
+                response.close()
+                response = None
+
+        if response is None:
+            self.logger.debug(f"Discarding stale partial download {part_path.name}")
+            part_path.unlink(missing_ok=True)
+            etag_path.unlink(missing_ok=True)
+            return None
+
+        get_console().print(
+            f"  [cyan]Resuming {filepath.name} at byte {offset} of {total_size}[/cyan]"
+        )
 
-                    except Exception as e:
-                        # Clean up temp file on any error
-                        tmp_filepath.unlink(missing_ok=True)
-                        raise
+        # The hash has to cover the bytes received in the earlier run too
+        hasher = None
+        checksum_algorithm = self.config.get("checksum_algorithm", "sha256")
+        if self.config.get("checksum") and not (
+            checksum_algorithm.lower() == 'blake3'
+            and total_size > BLAKE3_MMAP_THRESHOLD
+        ):
+            hasher = new_hasher(checksum_algorithm)
+            with open(part_path, 'rb') as f:
+                while chunk := f.read(COPY_CHUNK_SIZE):
+                    hasher.update(chunk)
+
+        try:
+            with response:
+                hasher = self._stream_to_file(
+                    url,
+                    response,
+                    part_path,
+                    filepath.name,
+                    total_size,
+                    resumable=True,
+                    hasher=hasher,
+                    offset=offset,
+                    etag=etag
+                )
+        except requests.RequestException as e:
+            raise Exception(
+                f"Download of {url} interrupted: {e}\n"
+                f"The partial file was kept; run again to resume."
+            )
 
-                elif response.status_code == 404:
-                    raise Exception(
-                        f"File not found (404): {url}\n"
-                        f"Please check the URL is correct."
-                    )
-                elif response.status_code == 403:
-                    raise Exception(
-                        f"Access forbidden (403): {url}\n"
-                        f"You may not have permission to access this resource."
+        try:
+            check_file_size(part_path, total_size)
+            result = self._finalize(
+                part_path,
+                filepath,
+                actual_checksum=hasher.hexdigest() if hasher else None,
+                etag=etag
+            )
+        except Exception:
+            part_path.unlink(missing_ok=True)
+            raise
+        finally:
+            etag_path.unlink(missing_ok=True)
+
+        return result
+
+    def _stream_to_file(
+        self,
+        url: str,
+        response: requests.Response,
+        tmp_filepath: Path,
+        filename: str,
+        total_size: int,
+        resumable: bool,
+        hasher=None,
+        offset: int = 0,
+        etag: Optional[str] = None
+    ):
+        """
+        Write a streamed response to a file, resuming if it breaks off.
+
+        When the connection drops mid-transfer, the download is resumed
+        with a ``Range: bytes=<written>-`` request (up to
+        MAX_RESUME_ATTEMPTS times) instead of starting over. With an
+        ``etag``, the request carries ``If-Range`` so a file that changed
+        on the server is fetched whole. A server that answers the range
+        request with the full body restarts the file.
+
+        Parameters
+        ----------
+        url : str
+            Download URL
+        response : requests.Response
+            Initial streamed GET response
+        tmp_filepath : pathlib.Path
+            File to write into
+        filename : str
+            Name shown in the progress bar
+        total_size : int
+            Content length (0 if unknown)
+        resumable : bool
+            False for content-encoded transfers, where byte offsets in
+            the file do not match offsets in the response body
+        hasher : hashlib hash object, optional
+            Updated with the written data
+        offset : int
+            Bytes already in ``tmp_filepath``; ``response`` continues the
+            file from there
+        etag : str, optional
+            ETag of the file, sent as ``If-Range`` when resuming
+
+        Returns
+        -------
+        hashlib hash object or None
+            The hasher covering the whole file (replaced on restart)
+
+        Raises
+        ------
+        requests.RequestException
+            If the transfer cannot be completed
+        """
+        attempt = 0
+        description = f"  Downloading {filename}"
+
+        with open(tmp_filepath, 'r+b' if offset else 'wb') as f:
+            f.seek(offset)
+            preallocate(f.fileno(), total_size)
+
+            while True:
+                try:
+                    if response is None:
+                        response = self._resume_from(url, f.tell(), etag)
+                        if response.status_code != 206:
+                            # Full body returned: start the file (and hash) over
+                            self.logger.debug(
+                                "Server ignored the Range header, restarting"
+                            )
+                            f.seek(0)
+                            f.truncate()
+                            if hasher is not None:
+                                hasher = new_hasher(hasher.name)
+                        description = f"  Resuming {filename}"
+
+                    copy_response_with_progress(
+                        response,
+                        f,
+                        total_size=(total_size - f.tell()) if total_size > 0 else None,
+                        description=description,
+                        hasher=hasher
                     )
-                else:
+                    return hasher
+
+                except requests.RequestException as e:
+                    attempt += 1
+                    if not resumable or attempt > MAX_RESUME_ATTEMPTS:
+                        # Drop preallocated space so the size is what arrived
+                        f.truncate()
+                        raise
+
                     self.logger.warning(
-                        f"Attempt {retry + 1}/{self.max_retries} - "
-                        f"HTTP {response.status_code}: {response.reason}"
+                        f"Download of {filename} interrupted at byte {f.tell()}, "
+                        f"resuming ({attempt}/{MAX_RESUME_ATTEMPTS}): {e}"
                     )
+                    if response is not None:
+                        response.close()
+                    response = None
 
-            except requests.Timeout:
-                self.logger.warning(
-                    f"Attempt {retry + 1}/{self.max_retries} - "
-                    f"Timeout after 30 seconds"
-                )
-            except requests.ConnectionError as e:
-                self.logger.warning(
-                    f"Attempt {retry + 1}/{self.max_retries} - "
-                    f"Connection error: {e}"
-                )
-            except requests.RequestException as e:
-                self.logger.warning(
-                    f"Attempt {retry + 1}/{self.max_retries} - "
-                    f"Request error: {e}"
+    def _resume_from(
+        self,
+        url: str,
+        offset: int,
+        etag: Optional[str] = None
+    ) -> requests.Response:
+        """
+        Request the rest of a download starting at a byte offset.
+
+        Returns a 206 response whose body starts at ``offset``, or a 200
+        response with the full body if the server does not honour the
+        range (or, with ``etag``, if the file no longer has that ETag).
+        """
+        headers = {'Range': f'bytes={offset}-'}
+        if etag:
+            headers['If-Range'] = etag
+
+        response = self.session.get(
+            url,
+            headers=headers,
+            stream=True,
+            timeout=TIMEOUT
+        )
+
+        content_range = response.headers.get('content-range', '')
+        if response.status_code == 206 and content_range.startswith(f"bytes {offset}-"):
+            return response
+
+        if response.status_code == 206:
+            # Some other range came back; ask for the whole file instead
+            response.close()
+            response = self.session.get(url, stream=True, timeout=TIMEOUT)
+
+        self._raise_for_status(url, response)
+        return response
+
+    def _raise_for_status(self, url: str, response: requests.Response) -> None:
+        """Raise a readable error for a non-200 response."""
+        if response.status_code == 404:
+            raise Exception(
+                f"File not found (404): {url}\n"
+                f"Please check the URL is correct."
+            )
+        elif response.status_code == 403:
+            raise Exception(
+                f"Access forbidden (403): {url}\n"
+                f"You may not have permission to access this resource."
+            )
+        elif response.status_code != 200:
+            raise Exception(
+                f"Failed to download from {url}: "
+                f"HTTP {response.status_code} {response.reason}"
+            )
+
+    def _check_space(self, total_size: int) -> None:
+        """Check disk space for a download of known size."""
+        if total_size > 0:
+            try:
+                check_disk_space(self.destination, total_size)
+            except OSError as e:
+                get_console().print(f"  [red]✗[/red] {str(e)}")
+                raise
+
+    def _is_reusable(
+        self,
+        filepath: Path,
+        expected_size: int,
+        etag: Optional[str] = None
+    ) -> bool:
+        """
+        Check whether a complete copy from an earlier run can be kept.
+
+        The file must have the expected size and, if a checksum is
+        configured, match it. Without a checksum, the server's ETag must
+        match the one recorded when the file was downloaded (if both are
+        known).
+        """
+        if not is_download_complete(filepath, expected_size):
+            return False
+
+        if self.config.get("checksum"):
+            if not self._matches_checksum(filepath):
+                return False
+        elif etag:
+            try:
+                recorded = self._etag_path(filepath).read_text().strip()
+            except OSError:
+                recorded = None
+            if recorded is not None and recorded != etag:
+                self.logger.debug(f"ETag of {filepath.name} changed, downloading again")
+                return False
+
+        get_console().print(f"  [green]✓[/green] {filepath.name} already downloaded")
+        self.logger.debug(f"Reusing existing {filepath}")
+        return True
+
+    def _matches_checksum(self, filepath: Path) -> bool:
+        """Check an existing file against the configured checksum."""
+        try:
+            verify_checksum(
+                filepath,
+                self.config["checksum"],
+                self.config.get("checksum_algorithm", "sha256"),
+                expected_probe=self.config.get("probe_sha256")
+            )
+        except ValueError:
+            return False
+        return True
+
+    def _finalize(
+        self,
+        tmp_filepath: Path,
+        filepath: Path,
+        actual_checksum: Optional[str] = None,
+        etag: Optional[str] = None
+    ) -> Path:
+        """
+        Verify the checksum (if configured) and move tmp -> final.
+
+        ``actual_checksum`` is the digest computed during the download,
+        if any; otherwise the file is hashed from disk. The response
+        ``etag`` is recorded next to the file for later runs.
+        """
+        expected_checksum = self.config.get("checksum")
+        checksum_algorithm = self.config.get("checksum_algorithm", "sha256")
+
+        if expected_checksum:
+            get_console().print(f"  [cyan]Verifying checksum ({checksum_algorithm})...[/cyan]")
+            # Report mismatches under the final name, not the temp file's
+            verify_checksum(
+                filepath,
+                expected_checksum,
+                checksum_algorithm,
+                actual_checksum=(
+                    actual_checksum
+                    or compute_checksum(tmp_filepath, checksum_algorithm)
                 )
+            )
+            get_console().print(f"  [green]✓[/green] Checksum verified")
+
+        # Atomic move: tmp -> final
+        os.replace(tmp_filepath, filepath)
+
+        etag_path = self._etag_path(filepath)
+        try:
+            if etag:
+                etag_path.write_text(etag)
+            else:
+                etag_path.unlink(missing_ok=True)
+        except OSError as e:
+            self.logger.debug(f"Could not record ETag for {filepath.name}: {e}")
+
+        self.logger.debug(f"Downloaded to {filepath}")
+        return filepath
+
+    @staticmethod
+    def _etag_path(filepath: Path) -> Path:
+        """Get the hidden sidecar file holding a download's ETag."""
+        return filepath.with_name(f".{filepath.name}.etag")
+
+    @staticmethod
+    def _url_filename(url: str) -> Optional[str]:
+        """Get the filename from the last URL path segment, if it has one."""
+        filename = urlparse(url).path.rsplit('/', 1)[-1]
+        return filename if '.' in filename else None
+
+    def _head(self, url: str) -> Optional[requests.Response]:
+        """
+        Send a HEAD request for a download URL.
 
-            # Retry with exponential backoff
-            if retry < self.max_retries - 1:
-                delay = self.retry_delay * (2 ** retry)  # Exponential backoff
-                self.logger.info(f"Retrying in {delay} seconds...")
-                time.sleep(delay)
+        Parameters
+        ----------
+        url : str
+            Download URL
 
-        raise Exception(
-            f"Failed to download from {url} after {self.max_retries} attempts.\n"
-            f"Please check your internet connection and try again."
-        )
+        Returns
+        -------
+        requests.Response or None
+            HEAD response (redirects followed), or None if the request
+            failed; the download then proceeds with GET alone
+        """
+        try:
+            return self.session.head(url, allow_redirects=True, timeout=TIMEOUT)
+        except requests.RequestException as e:
+            self.logger.debug(f"HEAD request failed: {e}")
+            return None
+
+    def _accepts_ranges(self, head: requests.Response, total_size: int) -> bool:
+        """
+        Check whether a URL can be downloaded in parallel byte ranges.
+
+        Parameters
+        ----------
+        head : requests.Response
+            Successful HEAD response for the URL
+        total_size : int
+            Content length from the HEAD response
+
+        Returns
+        -------
+        bool
+            True if the server accepts byte ranges and the file is larger
+            than RANGE_THRESHOLD
+        """
+        accepts_ranges = head.headers.get('accept-ranges', '').lower() == 'bytes'
+        # Ranges apply to the encoded body; only split identity transfers
+        encoded = head.headers.get('content-encoding', 'identity') != 'identity'
+
+        return accepts_ranges and not encoded and total_size > RANGE_THRESHOLD
+
+    def _download_ranges(
+        self,
+        url: str,
+        tmp_filepath: Path,
+        total_size: int,
+        connections: int,
+        description: str
+    ) -> bool:
+        """
+        Download a file as parallel byte ranges written at their offsets.
+
+        Parameters
+        ----------
+        url : str
+            Download URL
+        tmp_filepath : pathlib.Path
+            File to write into
+        total_size : int
+            Size of the file in bytes
+        connections : int
+            Number of parallel range requests
+        description : str
+            Description to show in progress bar
+
+        Returns
+        -------
+        bool
+            True if all ranges were downloaded, False if the server
+            answered a range request with the full body (no 206)
+        """
+        part_size = -(-total_size // connections)  # ceil division
+        ranges = [
+            (start, min(start + part_size, total_size) - 1)
+            for start in range(0, total_size, part_size)
+        ]
+
+        fd = os.open(tmp_filepath, os.O_WRONLY | os.O_TRUNC)
+        try:
+            os.ftruncate(fd, total_size)
+            preallocate(fd, total_size)
+
+            # Set when a range fails, so the others stop writing early
+            failed = threading.Event()
+
+            with create_progress() as progress:
+                task = progress.add_task(description, total=total_size)
+
+                def fetch(byte_range: Tuple[int, int]) -> bool:
+                    start, end = byte_range
+                    offset = start
+                    attempt = 0
+
+                    # A range that breaks off is re-requested from where it
+                    # stopped, without disturbing the other ranges
+                    while not failed.is_set():
+                        try:
+                            with self.session.get(
+                                url,
+                                headers={'Range': f'bytes={offset}-{end}'},
+                                stream=True,
+                                timeout=TIMEOUT
+                            ) as response:
+                                if response.status_code != 206:
+                                    return False
+                                for chunk in response.iter_content(
+                                    chunk_size=RANGE_CHUNK_SIZE
+                                ):
+                                    if failed.is_set():
+                                        return False
+                                    if chunk:
+                                        os.pwrite(fd, chunk, offset)
+                                        offset += len(chunk)
+                                        progress.update(task, advance=len(chunk))
+                                if offset != end + 1:
+                                    raise requests.ConnectionError(
+                                        f"Range {start}-{end} ended early at byte {offset}"
+                                    )
+                            return True
+                        except requests.RequestException as e:
+                            attempt += 1
+                            if attempt > MAX_RESUME_ATTEMPTS:
+                                failed.set()
+                                raise
+                            self.logger.debug(
+                                f"Range {start}-{end} interrupted at byte {offset}, "
+                                f"resuming ({attempt}/{MAX_RESUME_ATTEMPTS}): {e}"
+                            )
+                        except BaseException:
+                            failed.set()
+                            raise
+                    return False
+
+                # Leaving the pool waits for every fetch, so none of them
+                # can still write to fd once it is closed below
+                with self._worker_pool(len(ranges)) as executor:
+                    results = list(executor.map(fetch, ranges))
+
+            drop_from_page_cache(fd)
+        finally:
+            os.close(fd)
+
+        return all(results)
 
     def _extract_filename(
         self,
@@ -217,29 +854,20 @@ class HTTPProvider(BaseProvider):
             Extracted filename
         """
         # Try to get from Content-Disposition header
-        if 'Content-Disposition' in response.headers:
-            import re
-            match = re.search(
-                r'filename="?([^"]+)"?',
-                response.headers['Content-Disposition']
-            )
+        content_disposition = response.headers.get('Content-Disposition')
+        if content_disposition:
+            match = _CD_FILENAME_RE.search(content_disposition)
             if match:
                 return match.group(1)
 
         # Fall back to URL
-        filename = url.split('/')[-1].split('?')[0]
+        filename = self._url_filename(url)
 
         # If no filename in URL, use a default
-        if not filename or '.' not in filename:
-            # Try to guess extension from content-type
+        if not filename:
+            # Try to guess extension from content-type (minus parameters)
             content_type = response.headers.get('Content-Type', '')
-            ext_map = {
-                'application/zip': '.zip',
-                'application/x-tar': '.tar',
-                'application/gzip': '.tar.gz',
-                'application/x-gzip': '.tar.gz',
-            }
-            ext = ext_map.get(content_type, '.bin')
+            ext = _EXT_MAP.get(content_type.split(';', 1)[0].strip(), '.bin')
             filename = f"download{ext}"
 
         return filename
@@ -11,13 +11,13 @@ For library-based dataset downloads, we recommend:
 """
 
 import re
-import subprocess
 from pathlib import Path
 from typing import Dict, Any
-import warnings
 
 from repo2data.providers.base import BaseProvider
 
+_IMPORT_RE = re.compile(r"import.*?;")
+
 
 class LibraryProvider(BaseProvider):
     """
@@ -34,6 +34,9 @@ class LibraryProvider(BaseProvider):
     # This provider is DISABLED by default for security
     ENABLED = False
 
+    # Set once the deprecation warning has been shown in this process
+    _warned: bool = False
+
     def __init__(self, config: Dict[str, Any], destination: Path):
         """
         Initialize Library provider.
@@ -48,7 +51,8 @@ class LibraryProvider(BaseProvider):
         super().__init__(config, destination)
         self._show_deprecation_warning()
 
-    def can_handle(self, source: str) -> bool:
+    @classmethod
+    def can_handle(cls, source: str) -> bool:
         """
         Check if source is a Python import command.
 
@@ -65,10 +69,10 @@ class LibraryProvider(BaseProvider):
             False (provider disabled)
         """
         # Return False to disable this provider by default
-        if not self.ENABLED:
+        if not cls.ENABLED:
             return False
 
-        return bool(re.match(r".*?(import.*?;).*", source))
+        return _IMPORT_RE.search(source) is not None
 
     @property
     def provider_name(self) -> str:
@@ -76,7 +80,14 @@ class LibraryProvider(BaseProvider):
         return "Python Library (DEPRECATED)"
 
     def _show_deprecation_warning(self) -> None:
-        """Show strong deprecation warning."""
+        """Show strong deprecation warning (once per process)."""
+        if type(self)._warned:
+            return
+        type(self)._warned = True
+
+        # Imported here: the provider is disabled by default
+        import warnings
+
         warnings.warn(
             "\n" + "=" * 70 + "\n"
             "LibraryProvider is DEPRECATED and disabled by default.\n\n"
@@ -137,13 +148,12 @@ class LibraryProvider(BaseProvider):
 
         self.logger.warning(f"Executing potentially unsafe command: {command}")
 
+        import subprocess
+
         # Execute the Python command
         try:
-            result = subprocess.run(
+            result = self._run_command(
                 ['python3', '-c', command],
-                capture_output=True,
-                text=True,
-                check=False,
                 timeout=600  # 10 minute timeout
             )
 
@@ -154,9 +164,6 @@ class LibraryProvider(BaseProvider):
                     f"{result.returncode}"
                 )
 
-            if result.stdout:
-                self.logger.debug(f"Command output: {result.stdout}")
-
             self.logger.info(
                 f"Library download completed (NOT RECOMMENDED)"
             )
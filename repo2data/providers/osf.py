@@ -2,11 +2,16 @@
 
 import os
 import re
-import subprocess
+import shutil
+from concurrent.futures import as_completed
 from pathlib import Path
 from typing import Dict, Any, List
 
 from repo2data.providers.base import BaseProvider
+from repo2data.utils.download import DEFAULT_MAX_WORKERS
+
+_OSF_RE = re.compile(r"https://osf\.io")
+_OSF_PROJECT_RE = re.compile(r"https://osf\.io/(.{5})")
 
 
 class OSFProvider(BaseProvider):
@@ -16,7 +21,11 @@ class OSFProvider(BaseProvider):
     Uses osfclient to download files from OSF projects.
     """
 
-    def can_handle(self, source: str) -> bool:
+    # Set once the osf CLI has been found on PATH
+    _osf_checked: bool = False
+
+    @classmethod
+    def can_handle(cls, source: str) -> bool:
         """
         Check if source is an OSF URL.
 
@@ -30,7 +39,7 @@ class OSFProvider(BaseProvider):
         bool
             True if source is an OSF URL
         """
-        return bool(re.match(r".*?(https://osf\.io).*", source))
+        return _OSF_RE.search(source) is not None
 
     @property
     def provider_name(self) -> str:
@@ -59,21 +68,17 @@ class OSFProvider(BaseProvider):
 
         self.logger.info(f"Downloading from OSF: {self.source}")
 
-        # Check if osf CLI is available
-        try:
-            subprocess.run(
-                ['osf', '--version'],
-                capture_output=True,
-                check=True
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            raise FileNotFoundError(
-                "osfclient is not installed. "
-                "Install with: pip install osfclient"
-            )
+        # Check if osf CLI is available (once per process)
+        if not OSFProvider._osf_checked:
+            if shutil.which('osf') is None:
+                raise FileNotFoundError(
+                    "osfclient is not installed. "
+                    "Install with: pip install osfclient"
+                )
+            OSFProvider._osf_checked = True
 
         # Extract project ID from URL
-        match = re.match(r"https://osf\.io/(.{5})", self.source)
+        match = _OSF_PROJECT_RE.match(self.source)
         if not match:
             raise ValueError(
                 f"Cannot extract OSF project ID from URL: {self.source}"
@@ -88,47 +93,30 @@ class OSFProvider(BaseProvider):
         try:
             if not remote_filepaths:
                 # Clone entire project
-                result = subprocess.run(
-                    [
-                        'osf',
-                        '--project', project_id,
-                        'clone',
-                        str(self.destination)
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=False
-                )
+                result = self._run_command([
+                    'osf',
+                    '--project', project_id,
+                    'clone',
+                    str(self.destination)
+                ])
             else:
                 # Download specific files
                 if not isinstance(remote_filepaths, list):
                     remote_filepaths = [remote_filepaths]
 
+                # Each fetch is a separate osf process; run them concurrently
                 result = None
-                for remote_filepath in remote_filepaths:
-                    self.logger.info(f"Fetching file: {remote_filepath}")
-
-                    local_path = self.destination / remote_filepath
-                    local_path.parent.mkdir(parents=True, exist_ok=True)
-
-                    result = subprocess.run(
-                        [
-                            'osf',
-                            '--project', project_id,
-                            'fetch',
-                            '-f', remote_filepath,
-                            str(local_path)
-                        ],
-                        capture_output=True,
-                        text=True,
-                        check=False
-                    )
-
-                    if result.returncode != 0:
-                        self.logger.error(f"osf stderr: {result.stderr}")
-                        raise Exception(
-                            f"OSF fetch failed for {remote_filepath}"
-                        )
+                max_workers = max(1, min(
+                    int(self.config.get("max_concurrent_downloads") or DEFAULT_MAX_WORKERS),
+                    len(remote_filepaths)
+                ))
+                with self._worker_pool(max_workers) as executor:
+                    futures = [
+                        executor.submit(self._fetch_one, project_id, remote_filepath)
+                        for remote_filepath in remote_filepaths
+                    ]
+                    for future in as_completed(futures):
+                        future.result()
 
             if result and result.returncode != 0:
                 self.logger.error(f"osf stderr: {result.stderr}")
@@ -144,3 +132,45 @@ class OSFProvider(BaseProvider):
         except Exception as e:
             self.logger.error(f"OSF download failed: {e}")
             raise
+
+    def _fetch_one(self, project_id: str, remote_filepath: str) -> Path:
+        """
+        Fetch a single file from an OSF project.
+
+        Parameters
+        ----------
+        project_id : str
+            OSF project ID
+        remote_filepath : str
+            Path of the file within the project
+
+        Returns
+        -------
+        pathlib.Path
+            Local path of the fetched file
+
+        Raises
+        ------
+        Exception
+            If the osf fetch fails
+        """
+        self.logger.info(f"Fetching file: {remote_filepath}")
+
+        local_path = self.destination / remote_filepath
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+
+        result = self._run_command([
+            'osf',
+            '--project', project_id,
+            'fetch',
+            '-f', remote_filepath,
+            str(local_path)
+        ])
+
+        if result.returncode != 0:
+            self.logger.error(f"osf stderr: {result.stderr}")
+            raise Exception(
+                f"OSF fetch failed for {remote_filepath}"
+            )
+
+        return local_path
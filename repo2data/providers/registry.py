@@ -1,7 +1,8 @@
 """Provider registry for auto-discovering and selecting providers."""
 
+import functools
 from pathlib import Path
-from typing import Dict, Any, List, Type, Optional
+from typing import Dict, Any, Callable, List, Tuple, Type, Optional
 import logging
 
 from repo2data.providers.base import BaseProvider
@@ -21,6 +22,16 @@ class ProviderRegistry:
         self._providers: List[Type[BaseProvider]] = []
         self._provider_instances: Dict[str, BaseProvider] = {}
 
+        # (bound can_handle, provider class) pairs in registration order
+        self._dispatch: List[
+            Tuple[Callable[[str], bool], Type[BaseProvider]]
+        ] = []
+
+        # Bounded memo of source -> provider class resolutions
+        self._resolve_class = functools.lru_cache(maxsize=1024)(
+            self._find_provider_class
+        )
+
     def register(self, provider_class: Type[BaseProvider]) -> Type[BaseProvider]:
         """
         Register a provider class.
@@ -46,6 +57,8 @@ class ProviderRegistry:
             )
 
         self._providers.append(provider_class)
+        self._dispatch.append((provider_class.can_handle, provider_class))
+        self._resolve_class.cache_clear()
         logger.debug(f"Registered provider: {provider_class.__name__}")
         return provider_class
 
@@ -80,22 +93,62 @@ class ProviderRegistry:
         ValueError
             If no provider can handle the source
         """
-        # Try providers in reverse order (last registered has priority)
-        for provider_class in reversed(self._providers):
-            # Create temporary instance to check if it can handle the source
-            temp_instance = provider_class(config, destination)
-            if temp_instance.can_handle(source):
-                logger.info(
-                    f"Selected provider: {temp_instance.provider_name} "
-                    f"for source: {source}"
-                )
-                return temp_instance
-
-        raise ValueError(
-            f"No provider found for source: {source}\n"
-            f"Available providers: "
-            f"{', '.join(p.__name__ for p in self._providers)}"
+        provider_class = self._resolve_class(source)
+        if provider_class is None:
+            raise ValueError(
+                f"No provider found for source: {source}\n"
+                f"Available providers: "
+                f"{', '.join(p.__name__ for p in self._providers)}"
+            )
+
+        provider = provider_class(config, destination)
+        logger.info(
+            f"Selected provider: {provider.provider_name} "
+            f"for source: {source}"
         )
+        return provider
+
+    def get_provider_class(self, source: str) -> Optional[Type[BaseProvider]]:
+        """
+        Get the provider class for a source without instantiating it.
+
+        Parameters
+        ----------
+        source : str
+            Source URL or command
+
+        Returns
+        -------
+        Type[BaseProvider] or None
+            Matching provider class, or None if no provider matches
+        """
+        return self._resolve_class(source)
+
+    def _find_provider_class(self, source: str) -> Optional[Type[BaseProvider]]:
+        """
+        Find the provider class that handles a source.
+
+        Results are memoized per source by ``_resolve_class``; the cache is
+        cleared whenever the set of registered providers changes.
+
+        Parameters
+        ----------
+        source : str
+            Source URL or command
+
+        Returns
+        -------
+        Type[BaseProvider] or None
+            Matching provider class, or None if no provider matches
+        """
+        # Try providers in reverse order (last registered has priority)
+        # can_handle is a classmethod, so probing does not instantiate
+        # providers (or trigger LibraryProvider's deprecation warning)
+        for can_handle, provider_class in reversed(self._dispatch):
+            if can_handle(source):
+                return provider_class
+
+        return None
 
     def list_providers(self) -> List[str]:
         """
@@ -111,7 +164,9 @@ class ProviderRegistry:
     def clear(self) -> None:
         """Clear all registered providers."""
         self._providers.clear()
+        self._dispatch.clear()
         self._provider_instances.clear()
+        self._resolve_class.cache_clear()
         logger.debug("Provider registry cleared")
 
     def __len__(self) -> int:
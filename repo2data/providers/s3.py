@@ -1,12 +1,71 @@
 """AWS S3 provider for downloading datasets."""
 
+import configparser
+import functools
+import os
 import re
-import subprocess
+import shutil
+import tempfile
 from pathlib import Path
 from typing import Dict, Any
 
 from repo2data.providers.base import BaseProvider
 
+_S3_RE = re.compile(r"s3://")
+
+# Concurrent requests of `aws s3 sync` (the CLI's own default is 10)
+S3_MAX_CONCURRENT_REQUESTS = 32
+
+
+@functools.lru_cache(maxsize=None)
+def _cli_available(name: str) -> bool:
+    """Check once per process whether a command is on PATH."""
+    return shutil.which(name) is not None
+
+
+def _write_transfer_config(path: Path, max_concurrent_requests: int) -> None:
+    """
+    Write an AWS CLI config file with raised S3 transfer concurrency.
+
+    The user's config file (``AWS_CONFIG_FILE`` or ``~/.aws/config``) is
+    copied, and ``s3.max_concurrent_requests`` is set on the active
+    profile unless that profile already has its own ``s3`` settings.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        File to write
+    max_concurrent_requests : int
+        Number of concurrent S3 requests
+
+    Raises
+    ------
+    configparser.Error
+        If the user's config file cannot be parsed
+    OSError
+        If the config file cannot be written
+    """
+    user_config = os.environ.get(
+        'AWS_CONFIG_FILE', os.path.expanduser('~/.aws/config')
+    )
+    parser = configparser.RawConfigParser()
+    parser.read(user_config)
+
+    profile = os.environ.get('AWS_PROFILE', 'default')
+    section = 'default' if profile == 'default' else f'profile {profile}'
+    if not parser.has_section(section):
+        parser.add_section(section)
+    if not parser.has_option(section, 's3'):
+        parser.set(
+            section,
+            's3',
+            f"\nmax_concurrent_requests = {max_concurrent_requests}"
+            f"\nmax_queue_size = {max_concurrent_requests * 1000}"
+        )
+
+    with open(path, 'w') as f:
+        parser.write(f)
+
 
 class S3Provider(BaseProvider):
     """
@@ -15,7 +74,8 @@ class S3Provider(BaseProvider):
     Uses AWS CLI to sync S3 buckets/paths.
     """
 
-    def can_handle(self, source: str) -> bool:
+    @classmethod
+    def can_handle(cls, source: str) -> bool:
         """
         Check if source is an S3 URL.
 
@@ -29,7 +89,7 @@ class S3Provider(BaseProvider):
         bool
             True if source starts with s3://
         """
-        return bool(re.match(r".*?(s3://).*", source))
+        return _S3_RE.search(source) is not None
 
     @property
     def provider_name(self) -> str:
@@ -56,35 +116,49 @@ class S3Provider(BaseProvider):
 
         self.logger.info(f"Downloading from S3: {self.source}")
 
-        # Check if AWS CLI is available
-        try:
-            subprocess.run(
-                ['aws', '--version'],
-                capture_output=True,
-                check=True
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        # Check if AWS CLI is available (no process spawn)
+        if not _cli_available('aws'):
             raise FileNotFoundError(
                 "AWS CLI is not installed. "
                 "Install with: pip install awscli"
             )
 
+        # The CLI only reads transfer concurrency from its config file, so
+        # point it at a copy of the user's config with the limit raised
+        max_concurrent_requests = int(
+            self.config.get("max_concurrent_downloads") or S3_MAX_CONCURRENT_REQUESTS
+        )
+
         # Run aws s3 sync with no-sign-request for public buckets
         try:
-            result = subprocess.run(
-                [
-                    'aws', 's3', 'sync',
-                    '--no-sign-request',
-                    self.source,
-                    str(self.destination)
-                ],
-                capture_output=True,
-                text=True,
-                check=False
-            )
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                aws_config = Path(tmp_dir) / 'config'
+                env = None
+                try:
+                    _write_transfer_config(aws_config, max_concurrent_requests)
+                    env = {**os.environ, 'AWS_CONFIG_FILE': str(aws_config)}
+                except (configparser.Error, OSError) as e:
+                    # The unsigned sync does not need the config, so run
+                    # it with the CLI's default concurrency instead
+                    self.logger.debug(
+                        f"Not raising S3 transfer concurrency: {e}"
+                    )
+
+                # Per-object progress lines go straight to the terminal
+                # instead of being buffered until the sync finishes
+                result = self._run_command(
+                    [
+                        'aws', 's3', 'sync',
+                        '--no-sign-request',
+                        self.source,
+                        str(self.destination)
+                    ],
+                    env=env
+                )
 
             if result.returncode != 0:
-                self.logger.error(f"AWS CLI stderr: {result.stderr}")
+                if result.stderr:
+                    self.logger.error(f"AWS CLI stderr: {result.stderr}")
                 raise Exception(
                     f"AWS S3 sync failed with return code {result.returncode}"
                 )
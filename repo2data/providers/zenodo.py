@@ -1,21 +1,73 @@
 """Zenodo provider for downloading datasets via DOI."""
 
+import functools
 import re
-import subprocess
+import os
+import threading
+from concurrent.futures import Executor, as_completed
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+import requests
+from rich.progress import Progress
 
 from repo2data.providers.base import BaseProvider
+from repo2data.utils.download import (
+    copy_response_with_progress,
+    check_disk_space,
+    check_file_size,
+    is_download_complete,
+    partial_path,
+    preallocate,
+    new_hasher,
+    create_progress,
+    DEFAULT_MAX_WORKERS
+)
+from repo2data.utils.executor import worker_pool
+from repo2data.utils.logger import get_console
+
+_ZENODO_DOI_RE = re.compile(r"10\.\d{4}/zenodo")
+_ZENODO_RECORD_RE = re.compile(r"10\.\d{4}/zenodo\.(\d+)")
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_record_id(source: str) -> str:
+    """
+    Extract the Zenodo record ID from a DOI.
+
+    Parameters
+    ----------
+    source : str
+        Zenodo DOI, optionally as a doi.org URL
+
+    Returns
+    -------
+    str
+        Record ID
+
+    Raises
+    ------
+    ValueError
+        If the record ID cannot be extracted
+    """
+    match = _ZENODO_RECORD_RE.search(source)
+    if match:
+        return match.group(1)
+
+    raise ValueError(f"Could not extract Zenodo record ID from: {source}")
 
 
 class ZenodoProvider(BaseProvider):
     """
     Provider for Zenodo downloads.
 
-    Uses zenodo_get to download datasets by DOI.
+    Resolves the DOI to a record with the Zenodo REST API and downloads
+    the record's files concurrently.
     """
 
-    def can_handle(self, source: str) -> bool:
+    ZENODO_API_BASE = "https://zenodo.org/api"
+
+    @classmethod
+    def can_handle(cls, source: str) -> bool:
         """
         Check if source is a Zenodo DOI.
 
@@ -29,13 +81,148 @@ class ZenodoProvider(BaseProvider):
         bool
             True if source matches Zenodo DOI pattern
         """
-        return bool(re.match(r".*?(10\.\d{4}/zenodo).*", source))
+        return _ZENODO_DOI_RE.search(source) is not None
 
     @property
     def provider_name(self) -> str:
         """Get provider name."""
         return "Zenodo"
 
+    def _get_record_metadata(self, record_id: str) -> Dict[str, Any]:
+        """
+        Fetch record metadata from the Zenodo API.
+
+        Parameters
+        ----------
+        record_id : str
+            Zenodo record ID
+
+        Returns
+        -------
+        dict
+            Record metadata
+
+        Raises
+        ------
+        Exception
+            If API request fails
+        """
+        url = f"{self.ZENODO_API_BASE}/records/{record_id}"
+
+        try:
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+            return response.json()
+        except requests.RequestException as e:
+            raise Exception(f"Failed to fetch Zenodo metadata: {e}")
+
+    @staticmethod
+    def _file_entries(metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Normalize the file list of a record.
+
+        Handles both the current API (``key``/``size``/``links.self``)
+        and the legacy one (``filename``/``filesize``/``links.download``).
+
+        Parameters
+        ----------
+        metadata : dict
+            Record metadata
+
+        Returns
+        -------
+        list of dict
+            Entries with ``name``, ``url``, ``size`` and ``checksum``
+        """
+        entries = []
+        for file_info in metadata.get("files") or []:
+            links = file_info.get("links", {})
+            entries.append({
+                "name": file_info.get("key") or file_info.get("filename"),
+                "url": links.get("self") or links.get("download"),
+                "size": file_info.get("size") or file_info.get("filesize") or 0,
+                "checksum": file_info.get("checksum"),
+            })
+        return entries
+
+    def _resolve_files(self) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Resolve the source DOI to the record's title and files.
+
+        Returns
+        -------
+        tuple of (str, list of dict)
+            Record title and normalized file entries
+
+        Raises
+        ------
+        ValueError
+            If the record ID cannot be extracted or the record has no files
+        Exception
+            If the API request fails
+        """
+        try:
+            record_id = _extract_record_id(self.source)
+        except ValueError as e:
+            raise ValueError(f"Invalid Zenodo source: {e}")
+
+        metadata = self._get_record_metadata(record_id)
+
+        title = metadata.get("metadata", {}).get("title", "Unknown")
+        files = self._file_entries(metadata)
+
+        if not files:
+            raise ValueError(f"No files found in Zenodo record {record_id}")
+
+        return title, files
+
+    @classmethod
+    def _download_entries(
+        cls,
+        jobs: List[Tuple["ZenodoProvider", Dict[str, Any], int]],
+        max_workers: int,
+        executor: Optional[Executor] = None
+    ) -> List[str]:
+        """
+        Download files of one or more records through a single pool.
+
+        Parameters
+        ----------
+        jobs : list of tuple
+            (provider, file_entry, 1-based index) for every file
+        max_workers : int
+            Requested number of concurrent downloads
+        executor : concurrent.futures.Executor, optional
+            Shared executor to run the downloads on
+
+        Returns
+        -------
+        list of str
+            Error messages of failed files
+        """
+        # At most one worker per pooled connection
+        max_workers = max(1, min(max_workers, len(jobs), cls.SESSION_POOL_SIZE))
+        print_lock = threading.Lock()
+        errors = []
+
+        with create_progress() as progress, \
+                worker_pool(executor, max_workers) as pool:
+            futures = [
+                pool.submit(provider._download_one, file_info, idx, progress)
+                for provider, file_info, idx in jobs
+            ]
+
+            for future in as_completed(futures):
+                file_name, file_path, error = future.result()
+                with print_lock:
+                    if error is not None:
+                        errors.append(error)
+                        get_console().print(f"  [red]✗[/red] {error}")
+                    elif file_path is not None:
+                        get_console().print(f"  [green]✓[/green] Downloaded {file_name}")
+
+        return errors
+
     def download(self) -> Path:
         """
         Download dataset from Zenodo.
@@ -47,8 +234,8 @@ class ZenodoProvider(BaseProvider):
 
         Raises
         ------
-        FileNotFoundError
-            If zenodo_get is not installed
+        ValueError
+            If the record ID cannot be extracted or the record has no files
         Exception
             If download fails
         """
@@ -56,43 +243,176 @@ class ZenodoProvider(BaseProvider):
 
         self.logger.info(f"Downloading from Zenodo: {self.source}")
 
-        # Check if zenodo_get is available
-        try:
-            subprocess.run(
-                ['zenodo_get', '--version'],
-                capture_output=True,
-                check=True
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            raise FileNotFoundError(
-                "zenodo_get is not installed. "
-                "Install with: pip install zenodo-get"
+        title, files = self._resolve_files()
+
+        get_console().print(f"  [cyan]Zenodo:[/cyan] {title}")
+        get_console().print(f"  [dim]Files: {len(files)}[/dim]")
+
+        # Check disk space once for the whole record
+        total_size = sum(f["size"] for f in files)
+        if total_size > 0:
+            check_disk_space(self.destination, total_size)
+
+        errors = self._download_entries(
+            [(self, file_info, idx) for idx, file_info in enumerate(files, 1)],
+            int(self.config.get("max_concurrent_downloads") or DEFAULT_MAX_WORKERS),
+            executor=self.executor
+        )
+
+        if errors:
+            raise Exception(errors[0])
+
+        self.logger.info(
+            f"Successfully downloaded from Zenodo to {self.destination}"
+        )
+        return self.destination
+
+    @classmethod
+    def batch_download(
+        cls,
+        sources: List[str],
+        destinations: List[Path],
+        max_concurrent: int = DEFAULT_MAX_WORKERS,
+        executor: Optional[Executor] = None
+    ) -> List[Path]:
+        """
+        Download several Zenodo records at once.
+
+        All records are resolved concurrently, then the files of every
+        record share one download pool, so N records cost neither N
+        sequential metadata round trips nor N separately drained pools.
+
+        Parameters
+        ----------
+        sources : list of str
+            Zenodo DOIs
+        destinations : list of pathlib.Path
+            Destination directory of each source
+        max_concurrent : int
+            Number of files downloaded concurrently
+        executor : concurrent.futures.Executor, optional
+            Shared executor to run the requests on
+
+        Returns
+        -------
+        list of pathlib.Path
+            Destination directories
+
+        Raises
+        ------
+        ValueError
+            If a record ID cannot be extracted or a record has no files
+        Exception
+            If a download fails
+        """
+        providers = [
+            cls({"src": source}, destination)
+            for source, destination in zip(sources, destinations)
+        ]
+
+        # Resolve every record before downloading anything
+        workers = max(1, min(max_concurrent, len(providers), cls.SESSION_POOL_SIZE))
+        with worker_pool(executor, workers) as pool:
+            resolved = list(pool.map(lambda p: p._resolve_files(), providers))
+
+        jobs = []
+        for provider, (title, files) in zip(providers, resolved):
+            provider._ensure_destination_exists()
+            total_size = sum(f["size"] for f in files)
+            if total_size > 0:
+                check_disk_space(provider.destination, total_size)
+            get_console().print(f"  [cyan]Zenodo:[/cyan] {title} [dim]({len(files)} files)[/dim]")
+            jobs.extend(
+                (provider, file_info, idx) for idx, file_info in enumerate(files, 1)
             )
 
-        # Run zenodo_get
+        errors = cls._download_entries(jobs, max_concurrent, executor=executor)
+        if errors:
+            raise Exception(errors[0])
+
+        return [provider.destination for provider in providers]
+
+    def _download_one(
+        self,
+        file_info: Dict[str, Any],
+        idx: int,
+        progress: Progress
+    ) -> Tuple[str, Optional[Path], Optional[str]]:
+        """
+        Download a single Zenodo file.
+
+        The file is checked against the record's checksum
+        (``<algorithm>:<hex>``, usually md5) while it is written.
+
+        Parameters
+        ----------
+        file_info : dict
+            Normalized file entry (see ``_file_entries``)
+        idx : int
+            1-based index of the file (used for default names)
+        progress : rich.progress.Progress
+            Shared progress display
+
+        Returns
+        -------
+        tuple of (str, pathlib.Path or None, str or None)
+            (file_name, downloaded_path, error_message)
+        """
+        file_name = file_info["name"] or f"file_{idx}"
+        file_url = file_info["url"]
+        file_size = file_info["size"]
+
+        if not file_url:
+            self.logger.warning(f"No download URL for file: {file_name}")
+            return file_name, None, None
+
+        file_path = self.destination / file_name
+        part_path = partial_path(file_path)
+
+        # A complete copy from an earlier run is reused as-is
+        if is_download_complete(file_path, file_size):
+            self.logger.debug(f"{file_name} already downloaded, skipping")
+            return file_name, file_path, None
+
+        algorithm, _, expected_checksum = (file_info["checksum"] or "").partition(":")
+        hasher = None
+        if expected_checksum:
+            try:
+                hasher = new_hasher(algorithm)
+            except ValueError:
+                self.logger.debug(f"Not verifying {file_name}: unknown {algorithm}")
+
         try:
-            result = subprocess.run(
-                [
-                    'zenodo_get',
-                    '-o', str(self.destination),
-                    self.source
-                ],
-                capture_output=True,
-                text=True,
-                check=False
-            )
+            with self.session.get(file_url, stream=True, timeout=60) as response:
+                response.raise_for_status()
 
-            if result.returncode != 0:
-                self.logger.error(f"zenodo_get stderr: {result.stderr}")
-                raise Exception(
-                    f"zenodo_get failed with return code {result.returncode}"
-                )
+                # Get actual size from headers if not in metadata
+                total_size = file_size
+                if not total_size:
+                    total_size = int(response.headers.get('content-length', 0))
 
-            self.logger.info(
-                f"Successfully downloaded from Zenodo to {self.destination}"
-            )
-            return self.destination
+                # Download with progress into <name>.part
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(part_path, 'wb') as f:
+                    preallocate(f.fileno(), total_size)
+                    copy_response_with_progress(
+                        response,
+                        f,
+                        total_size=total_size if total_size > 0 else None,
+                        description=f"  Downloading {file_name}",
+                        progress=progress,
+                        hasher=hasher
+                    )
+
+            check_file_size(part_path, file_size)
+
+            if hasher is not None and hasher.hexdigest().lower() != expected_checksum.lower():
+                raise OSError(f"Checksum mismatch for {file_name}")
+
+            os.replace(part_path, file_path)
+
+        except (requests.RequestException, OSError) as e:
+            part_path.unlink(missing_ok=True)
+            return file_name, None, f"Failed to download {file_name}: {e}"
 
-        except Exception as e:
-            self.logger.error(f"Zenodo download failed: {e}")
-            raise
+        return file_name, file_path, None
@@ -6,9 +6,11 @@ from repo2data.utils.validation import validate_config_structure
 from repo2data.utils.locator import locate_evidence_data, list_evidence_datasets
 from repo2data.utils.download import (
     download_with_progress,
+    download_many,
     check_disk_space,
     verify_checksum,
-    compute_checksum
+    compute_checksum,
+    compute_probe
 )
 
 __all__ = [
@@ -19,7 +21,9 @@ __all__ = [
     'locate_evidence_data',
     'list_evidence_datasets',
     'download_with_progress',
+    'download_many',
     'check_disk_space',
     'verify_checksum',
     'compute_checksum',
+    'compute_probe',
 ]
@@ -2,12 +2,131 @@
 
 import os
 import shutil
+import struct
+import subprocess
+import tarfile
+import zipfile
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 import logging
 
+from repo2data.utils.executor import BoundedExecutor
+
 logger = logging.getLogger(__name__)
 
+# Suffixes handled by the fast (non-patool) extraction paths
+_TAR_GZIP_SUFFIXES = ('.tar.gz', '.tgz')
+_TAR_ZSTD_SUFFIXES = ('.tar.zst', '.tzst')
+
+# Extensions of files decompress_all() hands to the extractors; anything
+# else is skipped without sniffing its contents
+_ARCHIVE_SUFFIXES = (
+    '.zip', '.tar', '.gz', '.tgz', '.bz2', '.tbz2', '.xz', '.txz',
+    '.zst', '.tzst', '.7z', '.rar', '.lz', '.lzma',
+)
+
+# Archives extracted at the same time (bounded to avoid disk thrashing)
+MAX_PARALLEL_EXTRACTIONS = min(os.cpu_count() or 1, 4)
+
+# Leading signatures of archive/compression formats (patool format names)
+_MAGIC_SIGNATURES = (
+    (b'PK\x03\x04', 'zip'),
+    (b'\x1f\x8b', 'gzip'),
+    (b'7z\xbc\xaf\x27\x1c', '7z'),
+    (b'BZh', 'bzip2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+    (b'Rar!\x1a\x07\x00', 'rar'),
+    (b'Rar!\x1a\x07\x01\x00', 'rar'),
+)
+
+# Sniffed formats that are containers; compressors (gzip, ...) may wrap a
+# tarball, so patool has to look at those itself
+_CONTAINER_FORMATS = frozenset(('zip', '7z', 'rar', 'tar'))
+
+# Bytes copied per copy_file_range/read call when staging archive members
+_MEMBER_COPY_CHUNK = 8 * 1024 * 1024
+
+
+def _import_zstandard():
+    """Import the optional zstandard package, returning None if missing."""
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+
+def _copy_range(src_fd: int, dst_fd: int, offset: int, size: int) -> None:
+    """
+    Copy ``size`` bytes at ``offset`` of one file to the end of another.
+
+    Uses ``os.copy_file_range`` where available (Linux), which keeps the
+    data in the kernel and reflinks blocks on filesystems that support
+    it (btrfs, xfs); elsewhere falls back to a pread/write loop.
+
+    Parameters
+    ----------
+    src_fd : int
+        Descriptor of the archive
+    dst_fd : int
+        Descriptor of the extracted file
+    offset : int
+        Start of the member data in the archive
+    size : int
+        Member size in bytes
+    """
+    end = offset + size
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while offset < end:
+                copied = os.copy_file_range(
+                    src_fd, dst_fd, min(_MEMBER_COPY_CHUNK, end - offset),
+                    offset_src=offset
+                )
+                if copied == 0:
+                    break
+                offset += copied
+        except OSError:
+            # e.g. EXDEV on older kernels, or unsupported filesystems
+            pass
+
+    while offset < end:
+        data = os.pread(src_fd, min(_MEMBER_COPY_CHUNK, end - offset), offset)
+        if not data:
+            raise EOFError("Archive member is truncated")
+        os.write(dst_fd, data)
+        offset += len(data)
+
+
+def _member_target(output_dir: Path, name: str) -> Path:
+    """
+    Resolve where an archive member is extracted, refusing path traversal.
+
+    Parameters
+    ----------
+    output_dir : pathlib.Path
+        Extraction directory
+    name : str
+        Member name from the archive
+
+    Returns
+    -------
+    pathlib.Path
+        Target path inside ``output_dir``
+
+    Raises
+    ------
+    ValueError
+        If the member would be written outside ``output_dir``
+    """
+    root = os.path.realpath(output_dir)
+    target = os.path.realpath(os.path.join(root, name))
+    if os.path.commonpath([root, target]) != root:
+        raise ValueError(f"Archive member escapes extraction directory: {name}")
+    return Path(target)
+
 
 class Decompressor:
     """
@@ -16,7 +135,7 @@ class Decompressor:
     Supports various archive formats using patoolib.
     """
 
-    def __init__(self, directory: Path):
+    def __init__(self, directory: Path, executor: Optional[Executor] = None):
         """
         Initialize Decompressor.
 
@@ -24,10 +143,19 @@ class Decompressor:
         ----------
         directory : pathlib.Path
             Directory containing files to decompress
+        executor : concurrent.futures.Executor, optional
+            Shared executor to extract on (at most
+            MAX_PARALLEL_EXTRACTIONS archives at a time). If None, each
+            ``decompress_all`` call uses a private thread pool that it
+            shuts down before returning.
         """
         self.directory = Path(directory)
         self.logger = logger
         self._patool_available = self._check_patool_support()
+        self._executor: Optional[BoundedExecutor] = (
+            BoundedExecutor(executor, MAX_PARALLEL_EXTRACTIONS)
+            if executor is not None else None
+        )
 
     def _check_patool_support(self) -> bool:
         """Check if patool is available."""
@@ -41,11 +169,93 @@ class Decompressor:
             )
             return False
 
+    @staticmethod
+    def _sniff(file_path: Path) -> Optional[str]:
+        """
+        Classify a file by its magic bytes.
+
+        One 512-byte read recognizes the common formats without going
+        through patool's detection (which may spawn ``file``).
+
+        Parameters
+        ----------
+        file_path : pathlib.Path
+            Path to a (possible) archive
+
+        Returns
+        -------
+        str or None
+            patool format name, or None if the signature is not recognized
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                head = f.read(512)
+        except OSError:
+            return None
+
+        for signature, archive_format in _MAGIC_SIGNATURES:
+            if head.startswith(signature):
+                return archive_format
+        if head[257:262] == b'ustar':
+            return 'tar'
+        return None
+
+    def _archive_format(self, file_path: Path):
+        """
+        Get the archive format of a file, sniffing magic bytes first.
+
+        Falls back to ``patoolib.get_archive_format`` for files whose
+        signature is not recognized.
+
+        Parameters
+        ----------
+        file_path : pathlib.Path
+            Path to a (possible) archive
+
+        Returns
+        -------
+        str, tuple or None
+            Sniffed format name, patool's ``(format, compression)`` when
+            patool classified the file, or None if it is not an archive
+
+        Raises
+        ------
+        patoolib.util.PatoolError
+            If patool cannot classify the file
+        """
+        archive_format = self._sniff(file_path)
+        if archive_format is not None:
+            return archive_format
+
+        import patoolib
+
+        return patoolib.get_archive_format(str(file_path))
+
+    def _patool_extract(
+        self,
+        file_path: Path,
+        output_dir: Path,
+        archive_format: Optional[str]
+    ) -> None:
+        """Extract with patool, skipping its re-detection for containers."""
+        import patoolib
+
+        patoolib.extract_archive(
+            str(file_path),
+            outdir=str(output_dir),
+            interactive=False,
+            format=archive_format if archive_format in _CONTAINER_FORMATS else None
+        )
+
     def decompress_all(self) -> List[Path]:
         """
         Decompress all archive files in the directory.
 
-        Archives are extracted in-place and then deleted.
+        Archives (recognized by extension, see _ARCHIVE_SUFFIXES) are
+        extracted in-place and then deleted. Up to
+        MAX_PARALLEL_EXTRACTIONS archives are extracted at the same time
+        (extraction mostly runs in external tools or in C with the GIL
+        released).
 
         Returns
         -------
@@ -69,52 +279,39 @@ class Decompressor:
             )
             return []
 
-        import patoolib
-        decompressed = []
-
-        files = list(self.directory.iterdir())
+        # One scandir pass (file type comes with the entry) and an
+        # extension filter, so non-archives are never sniffed by patool
+        with os.scandir(self.directory) as entries:
+            files = sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.is_file(follow_symlinks=False)
+                and entry.name.lower().endswith(_ARCHIVE_SUFFIXES)
+            )
         self.logger.debug(
             f"Checking {len(files)} files for decompression"
         )
 
-        for file_path in files:
-            if not file_path.is_file():
-                continue
-
-            try:
-                # Check if file is an archive
-                archive_format = patoolib.get_archive_format(str(file_path))
-
-                if archive_format:
-                    self.logger.info(
-                        f"Decompressing {file_path.name} ({archive_format})"
-                    )
-
-                    # Extract archive
-                    patoolib.extract_archive(
-                        str(file_path),
-                        outdir=str(self.directory),
-                        interactive=False
-                    )
-
-                    # Delete the archive after successful extraction
-                    file_path.unlink()
-                    self.logger.debug(f"Deleted archive: {file_path.name}")
-
-                    decompressed.append(file_path)
-
-            except patoolib.util.PatoolError as e:
-                # Not an archive or unsupported format
-                self.logger.debug(
-                    f"Skipping {file_path.name}: {e}"
-                )
-                continue
-            except Exception as e:
-                self.logger.error(
-                    f"Error decompressing {file_path.name}: {e}"
-                )
-                # Don't delete file if extraction failed
-                continue
+        executor = self._executor
+        if executor is None and files:
+            executor = ThreadPoolExecutor(
+                max_workers=min(len(files), MAX_PARALLEL_EXTRACTIONS),
+                thread_name_prefix="repo2data-extract"
+            )
+        try:
+            futures = [
+                executor.submit(self._extract_one, file_path)
+                for file_path in files
+            ]
+            decompressed = [
+                file_path
+                for file_path, future in zip(files, futures)
+                if future.result()
+            ]
+        finally:
+            # Only a pool created here is shut down, never a shared one
+            if executor is not None and executor is not self._executor:
+                executor.shutdown(wait=True)
 
         if decompressed:
             self.logger.info(
@@ -132,6 +329,239 @@ class Decompressor:
 
         return decompressed
 
+    def _extract_one(self, file_path: Path) -> bool:
+        """
+        Extract a single archive in place and delete it.
+
+        Files that are not archives, and archives that fail to extract,
+        are left untouched.
+
+        Parameters
+        ----------
+        file_path : pathlib.Path
+            Path to a (possible) archive
+
+        Returns
+        -------
+        bool
+            True if the file was extracted
+        """
+        import patoolib
+
+        output_dir = file_path.parent
+
+        # Large gzip/zstd archives go through the multi-threaded paths
+        if self._extract_fast(file_path, output_dir):
+            file_path.unlink()
+            self.logger.debug(f"Deleted archive: {file_path.name}")
+            return True
+
+        try:
+            # Check if file is an archive
+            archive_format = self._archive_format(file_path)
+
+            if not archive_format:
+                return False
+
+            self.logger.info(
+                f"Decompressing {file_path.name} ({archive_format})"
+            )
+
+            # Extract archive
+            self._patool_extract(file_path, output_dir, archive_format)
+
+            # Delete the archive after successful extraction
+            file_path.unlink()
+            self.logger.debug(f"Deleted archive: {file_path.name}")
+            return True
+
+        except patoolib.util.PatoolError as e:
+            # Not an archive or unsupported format
+            self.logger.debug(
+                f"Skipping {file_path.name}: {e}"
+            )
+            return False
+        except Exception as e:
+            self.logger.error(
+                f"Error decompressing {file_path.name}: {e}"
+            )
+            # Don't delete file if extraction failed
+            return False
+
+    def _extract_fast(self, file_path: Path, output_dir: Path) -> bool:
+        """
+        Extract zip/tar/gzip/zstd archives without going through patool.
+
+        zip and uncompressed tar archives are extracted in-process, with
+        the data of stored members copied by ``copy_file_range``. gzip
+        archives are decoded with ``pugz`` (parallel gzip) when it is on
+        PATH, zstd archives with the ``zstandard`` package when it is
+        installed. Any failure falls back to patool.
+
+        Parameters
+        ----------
+        file_path : pathlib.Path
+            Path to archive file
+        output_dir : pathlib.Path
+            Directory to extract into
+
+        Returns
+        -------
+        bool
+            True if the archive was extracted by a fast path
+        """
+        name = file_path.name.lower()
+
+        try:
+            if name.endswith('.zip'):
+                return self._extract_zip(file_path, output_dir)
+            if name.endswith('.tar'):
+                return self._extract_tar(file_path, output_dir)
+            if name.endswith('.gz') or name.endswith('.tgz'):
+                return self._extract_pugz(file_path, output_dir)
+            if name.endswith('.zst') or name.endswith('.tzst'):
+                return self._extract_zstd(file_path, output_dir)
+        except Exception as e:
+            self.logger.debug(
+                f"Fast extraction failed for {file_path.name}, "
+                f"falling back to patool: {e}"
+            )
+
+        return False
+
+    def _extract_zip(self, file_path: Path, output_dir: Path) -> bool:
+        """Extract a zip archive, copying stored members without decoding."""
+        self.logger.info(f"Decompressing {file_path.name} (zip)")
+
+        with open(file_path, 'rb') as src, zipfile.ZipFile(src) as archive:
+            for info in archive.infolist():
+                target = _member_target(output_dir, info.filename)
+                if info.is_dir():
+                    target.mkdir(parents=True, exist_ok=True)
+                    continue
+
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with open(target, 'wb') as dst:
+                    if (info.compress_type == zipfile.ZIP_STORED
+                            and not info.flag_bits & 0x1):
+                        # Member data follows its local header, whose
+                        # name/extra lengths may differ from the central
+                        # directory's
+                        header = os.pread(src.fileno(), 30, info.header_offset)
+                        name_len, extra_len = struct.unpack('<26xHH', header)
+                        data_offset = info.header_offset + 30 + name_len + extra_len
+                        _copy_range(
+                            src.fileno(), dst.fileno(), data_offset, info.file_size
+                        )
+                    else:
+                        with archive.open(info) as member:
+                            shutil.copyfileobj(member, dst, _MEMBER_COPY_CHUNK)
+        return True
+
+    def _extract_tar(self, file_path: Path, output_dir: Path) -> bool:
+        """Extract an uncompressed tar, copying file data without decoding."""
+        self.logger.info(f"Decompressing {file_path.name} (tar)")
+        data_filter = getattr(tarfile, 'data_filter', None)
+
+        with open(file_path, 'rb') as src, \
+                tarfile.open(fileobj=src, mode='r:') as archive:
+            for member in archive:
+                if data_filter is not None:
+                    member = data_filter(member, str(output_dir))
+                target = _member_target(output_dir, member.name)
+
+                if not member.isreg() or member.sparse is not None:
+                    # Directories, links and special files go through tarfile
+                    if data_filter is not None:
+                        archive.extract(member, output_dir, filter='data')
+                    else:
+                        archive.extract(member, output_dir)
+                    continue
+
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with open(target, 'wb') as dst:
+                    _copy_range(
+                        src.fileno(), dst.fileno(), member.offset_data, member.size
+                    )
+                if member.mode is not None:
+                    os.chmod(target, member.mode & 0o777)
+                if member.mtime is not None:
+                    os.utime(target, (member.mtime, member.mtime))
+        return True
+
+    def _extract_pugz(self, file_path: Path, output_dir: Path) -> bool:
+        """Decompress a gzip or gzipped tarball with multi-threaded pugz."""
+        pugz = shutil.which('pugz')
+        if pugz is None:
+            return False
+
+        name = file_path.name.lower()
+        threads = str(os.cpu_count() or 1)
+        self.logger.info(f"Decompressing {file_path.name} (gzip, pugz -t {threads})")
+
+        if name.endswith(_TAR_GZIP_SUFFIXES):
+            tar = shutil.which('tar')
+            if tar is None:
+                return False
+
+            pugz_proc = subprocess.Popen(
+                [pugz, '-t', threads, str(file_path)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+            tar_result = subprocess.run(
+                [tar, '-x', '-C', str(output_dir)],
+                stdin=pugz_proc.stdout,
+                capture_output=True
+            )
+            pugz_proc.stdout.close()
+            pugz_returncode = pugz_proc.wait()
+
+            if pugz_returncode != 0 or tar_result.returncode != 0:
+                raise RuntimeError(
+                    f"pugz/tar exited with {pugz_returncode}/{tar_result.returncode}"
+                )
+            return True
+
+        # Single gzip-compressed file
+        target = output_dir / file_path.name[:-len('.gz')]
+        with open(target, 'wb') as out:
+            result = subprocess.run(
+                [pugz, '-t', threads, str(file_path)],
+                stdout=out,
+                stderr=subprocess.PIPE
+            )
+        if result.returncode != 0:
+            target.unlink(missing_ok=True)
+            raise RuntimeError(f"pugz exited with {result.returncode}")
+        return True
+
+    def _extract_zstd(self, file_path: Path, output_dir: Path) -> bool:
+        """Decompress a zstd file or zstd tarball with the zstandard package."""
+        zstandard = _import_zstandard()
+        if zstandard is None:
+            return False
+
+        name = file_path.name.lower()
+        self.logger.info(f"Decompressing {file_path.name} (zstd)")
+        dctx = zstandard.ZstdDecompressor()
+
+        with open(file_path, 'rb') as src:
+            if name.endswith(_TAR_ZSTD_SUFFIXES):
+                with dctx.stream_reader(src) as reader:
+                    with tarfile.open(fileobj=reader, mode='r|') as tar:
+                        if hasattr(tarfile, 'data_filter'):
+                            tar.extractall(output_dir, filter='data')
+                        else:
+                            tar.extractall(output_dir)
+                return True
+
+            # Single zstd-compressed file
+            target = output_dir / file_path.name[:-len('.zst')]
+            with open(target, 'wb') as dst:
+                dctx.copy_stream(src, dst)
+        return True
+
     def decompress_file(self, file_path: Path) -> bool:
         """
         Decompress a specific archive file.
@@ -167,11 +597,20 @@ class Decompressor:
         if not file_path.is_file():
             raise ValueError(f"Not a file: {file_path}")
 
+        # Extract to parent directory
+        output_dir = file_path.parent
+
+        if self._extract_fast(file_path, output_dir):
+            file_path.unlink()
+            self.logger.info(f"Decompressed and deleted {file_path.name}")
+            self.clean_macos_junk()
+            return True
+
         import patoolib
 
         try:
             # Check if it's an archive
-            archive_format = patoolib.get_archive_format(str(file_path))
+            archive_format = self._archive_format(file_path)
 
             if not archive_format:
                 self.logger.info(f"{file_path.name} is not an archive")
@@ -181,14 +620,7 @@ class Decompressor:
                 f"Decompressing {file_path.name} ({archive_format})"
             )
 
-            # Extract to parent directory
-            output_dir = file_path.parent
-
-            patoolib.extract_archive(
-                str(file_path),
-                outdir=str(output_dir),
-                interactive=False
-            )
+            self._patool_extract(file_path, output_dir, archive_format)
 
             # Delete archive
             file_path.unlink()
@@ -224,6 +656,9 @@ class Decompressor:
         if not self._patool_available:
             return False
 
+        if self._sniff(file_path) is not None:
+            return True
+
         import patoolib
 
         try:
@@ -1,9 +1,19 @@
 """Download utilities for progress tracking, verification, and validation."""
 
+import errno
 import hashlib
+import io
+import logging
+import mmap
+import os
+import secrets
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Callable, BinaryIO
+from typing import Any, Optional, Callable, BinaryIO, List, Sequence, Set
+import requests
+import urllib3
 from rich.progress import (
     Progress,
     BarColumn,
@@ -14,7 +24,60 @@ from rich.progress import (
 )
 from rich.console import Console
 
+from repo2data.utils.http import create_session
+
 console = Console()
+logger = logging.getLogger(__name__)
+
+# Default number of files downloaded concurrently by multi-file providers
+DEFAULT_MAX_WORKERS = 8
+
+# Read size used when copying a response body to disk
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Files of known size below this are copied without a progress bar
+PROGRESS_MIN_SIZE = 10 * 1024 * 1024
+
+# Progress bars are advanced at most every this many bytes or seconds
+PROGRESS_FLUSH_BYTES = 256 * 1024
+PROGRESS_FLUSH_INTERVAL = 0.05
+
+# Written pages are dropped from the page cache every this many bytes
+PAGE_CACHE_DROP_INTERVAL = 64 * 1024 * 1024
+
+# Fast checksum algorithms provided by optional packages (not hashlib)
+_XXH3_ALGORITHMS = ('xxh3_64', 'xxh3_128')
+_OPTIONAL_ALGORITHMS = ('blake3',) + _XXH3_ALGORITHMS
+
+# Files larger than this are hashed with multithreaded blake3 over mmap
+BLAKE3_MMAP_THRESHOLD = 256 * 1024 * 1024
+
+# Verifying a file larger than this with another algorithm suggests blake3
+BLAKE3_ADVICE_SIZE = 1024 * 1024 * 1024
+
+# Set once the blake3 suggestion has been logged in this process
+_blake3_advised = False
+
+# Bytes hashed from each end of a file by compute_probe
+PROBE_SIZE = 64 * 1024
+
+
+def _import_blake3():
+    """Import the optional blake3 package, returning None if missing."""
+    try:
+        import blake3
+        return blake3
+    except ImportError:
+        return None
+
+
+def _import_xxhash():
+    """Import the optional xxhash package, returning None if missing."""
+    try:
+        import xxhash
+        return xxhash
+    except ImportError:
+        return None
 
 
 def get_available_disk_space(path: Path) -> int:
@@ -35,7 +98,12 @@ def get_available_disk_space(path: Path) -> int:
     return stat.free
 
 
-def check_disk_space(path: Path, required_bytes: int, buffer_mb: int = 100) -> bool:
+def check_disk_space(
+    path: Path,
+    required_bytes: int,
+    buffer_mb: int = 100,
+    available: Optional[int] = None
+) -> bool:
     """
     Check if there's enough disk space for a download.
 
@@ -47,6 +115,9 @@ def check_disk_space(path: Path, required_bytes: int, buffer_mb: int = 100) -> b
         Required space in bytes
     buffer_mb : int
         Additional buffer space in MB to require (default: 100MB)
+    available : int, optional
+        Free space in bytes measured earlier; avoids another statvfs when
+        checking a running total against the same snapshot
 
     Returns
     -------
@@ -58,7 +129,8 @@ def check_disk_space(path: Path, required_bytes: int, buffer_mb: int = 100) -> b
     OSError
         If not enough disk space is available
     """
-    available = get_available_disk_space(path)
+    if available is None:
+        available = get_available_disk_space(path)
     buffer_bytes = buffer_mb * 1024 * 1024
     needed = required_bytes + buffer_bytes
 
@@ -72,22 +144,333 @@ def check_disk_space(path: Path, required_bytes: int, buffer_mb: int = 100) -> b
     return True
 
 
+def partial_path(file_path: Path) -> Path:
+    """
+    Get the temporary path a download is written to.
+
+    Downloads go to ``<name>.part`` and are moved into place with
+    ``os.replace`` once complete, so an interrupted transfer never leaves
+    a truncated file at the final path.
+
+    Parameters
+    ----------
+    file_path : Path
+        Final path of the download
+
+    Returns
+    -------
+    Path
+        Path of the in-progress download
+    """
+    return file_path.with_name(file_path.name + '.part')
+
+
+def temporary_path(file_path: Path) -> Path:
+    """
+    Create a uniquely named temporary file next to a download target.
+
+    The file (``.<name>.<random>.part``) lives in the same directory as
+    ``file_path``, so it can be moved into place atomically with
+    ``os.replace``, and concurrent downloads of the same target do not
+    overwrite each other. It gets the permissions a regular file created
+    with ``open`` would have. The caller removes it if the download fails.
+
+    Parameters
+    ----------
+    file_path : Path
+        Final path of the download
+
+    Returns
+    -------
+    Path
+        Path of the new, empty temporary file
+    """
+    # Created like open() would (mode 0666 minus the umask, applied by the
+    # kernel), not with tempfile's 0600
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_CLOEXEC', 0)
+    while True:
+        tmp_path = file_path.parent / f".{file_path.name}.{secrets.token_hex(4)}.part"
+        try:
+            os.close(os.open(tmp_path, flags, 0o666))
+        except FileExistsError:
+            continue
+        return tmp_path
+
+
+def unique_file_name(file_name: str, file_id: Any, used_names: Set[str]) -> str:
+    """
+    Get a target name for a file that no other file of a dataset uses.
+
+    Datasets may list several files with the same name (e.g. in different
+    Dataverse folders). Downloaded concurrently into one directory, they
+    would write to the same ``.part`` file. The first file keeps its
+    name; later ones get their ``file_id`` inserted before the extension.
+    Listings come in a stable order, so a file gets the same name on
+    every run.
+
+    Parameters
+    ----------
+    file_name : str
+        Name of the file in the dataset listing
+    file_id : object
+        Identifier of the file in the dataset (used for renamed files);
+        if None, a counter is used instead
+    used_names : set of str
+        Names already taken in this download; the returned name is added
+
+    Returns
+    -------
+    str
+        ``file_name``, or e.g. ``data_1234.csv`` if it is already taken
+    """
+    name = file_name
+    if name in used_names:
+        stem, dot, suffix = file_name.partition('.')
+        base = stem if file_id is None else f"{stem}_{file_id}"
+        name = f"{base}{dot}{suffix}"
+        counter = 1
+        while name in used_names:
+            counter += 1
+            name = f"{base}_{counter}{dot}{suffix}"
+    used_names.add(name)
+    return name
+
+
+def is_download_complete(file_path: Path, expected_size: Optional[int]) -> bool:
+    """
+    Check whether a previous download of a file can be reused.
+
+    Parameters
+    ----------
+    file_path : Path
+        Final path of the download
+    expected_size : int, optional
+        Expected size in bytes; unknown sizes (None or 0) never match
+
+    Returns
+    -------
+    bool
+        True if the file exists with exactly the expected size
+    """
+    if not expected_size:
+        return False
+
+    try:
+        return file_path.stat().st_size == expected_size
+    except OSError:
+        return False
+
+
+def check_file_size(file_path: Path, expected_size: Optional[int]) -> None:
+    """
+    Check that a downloaded file has the expected size.
+
+    Parameters
+    ----------
+    file_path : Path
+        Downloaded file
+    expected_size : int, optional
+        Expected size in bytes; the check is skipped if unknown
+
+    Raises
+    ------
+    OSError
+        If the file size differs from the expected size
+    """
+    if not expected_size:
+        return
+
+    actual = file_path.stat().st_size
+    if actual != expected_size:
+        raise OSError(
+            f"Incomplete download of {file_path.name}: "
+            f"got {actual} of {expected_size} bytes"
+        )
+
+
+def preallocate(fd: int, size: Optional[int]) -> None:
+    """
+    Reserve disk space for a file before writing it.
+
+    Lets the filesystem allocate the whole extent at once instead of
+    growing the file block by block. The file size is extended to
+    ``size``; writers that may end short must truncate afterwards
+    (``copy_response_with_progress`` does). No-op for unknown sizes or
+    where ``os.posix_fallocate`` is unavailable.
+
+    Parameters
+    ----------
+    fd : int
+        File descriptor of the file being written
+    size : int, optional
+        Expected size in bytes
+    """
+    if not size or not hasattr(os, 'posix_fallocate'):
+        return
+
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError as e:
+        # Running out of space is fatal; filesystems without fallocate
+        # support (EOPNOTSUPP, EINVAL) just skip the optimization
+        if e.errno == errno.ENOSPC:
+            raise
+
+
+def drop_from_page_cache(fd: int) -> None:
+    """
+    Advise the kernel that a freshly written file will not be re-read soon.
+
+    Starts writeback and releases the file's pages with
+    ``POSIX_FADV_DONTNEED`` so multi-GB downloads do not evict the rest of
+    the page cache. No-op where ``os.posix_fadvise`` is unavailable
+    (macOS, Windows).
+
+    Parameters
+    ----------
+    fd : int
+        File descriptor of the written file
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+
+
+def advise_sequential(fd: int) -> None:
+    """
+    Advise the kernel that a file will be accessed sequentially.
+
+    Enables aggressive readahead/write-behind for the file with
+    ``POSIX_FADV_SEQUENTIAL``. macOS has no ``posix_fadvise``; there the
+    file is opened for uncached I/O with ``F_NOCACHE`` instead. No-op on
+    Windows.
+
+    Parameters
+    ----------
+    fd : int
+        File descriptor of the file being written
+    """
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+        return
+
+    try:
+        import fcntl
+    except ImportError:
+        return
+
+    if hasattr(fcntl, 'F_NOCACHE'):
+        try:
+            fcntl.fcntl(fd, fcntl.F_NOCACHE, 1)
+        except OSError:
+            pass
+
+
+def _advise_sequential_write(file_handle: BinaryIO) -> None:
+    """Mark a file handle as written sequentially, if it has a descriptor."""
+    try:
+        advise_sequential(file_handle.fileno())
+    except (AttributeError, io.UnsupportedOperation):
+        pass
+
+
+def _release_written(file_handle: BinaryIO) -> None:
+    """Flush a file handle and drop its pages from the page cache."""
+    try:
+        file_handle.flush()
+        drop_from_page_cache(file_handle.fileno())
+    except (AttributeError, io.UnsupportedOperation):
+        pass
+
+
+def new_hasher(algorithm: str = "sha256"):
+    """
+    Create an incremental hash object for a checksum algorithm.
+
+    Besides the hashlib algorithms, ``blake3`` (SIMD tree hash, needs the
+    blake3 package) and ``xxh3_64``/``xxh3_128`` (needs the xxhash
+    package) are accepted. They are much faster than sha256 and suited
+    to integrity checks, though xxh3 is not a cryptographic hash.
+
+    Parameters
+    ----------
+    algorithm : str
+        Hash algorithm (sha256, md5, sha1, blake3, xxh3_128, ...)
+
+    Returns
+    -------
+    hash object
+        Object to ``update()`` with data and read ``hexdigest()`` from
+
+    Raises
+    ------
+    ValueError
+        If algorithm is not supported or its package is not installed
+    """
+    algorithm = algorithm.lower()
+
+    if algorithm == 'blake3':
+        blake3 = _import_blake3()
+        if blake3 is None:
+            raise ValueError(
+                "blake3 checksums require the blake3 package. "
+                "Install with: pip install blake3"
+            )
+        return blake3.blake3()
+
+    if algorithm in _XXH3_ALGORITHMS:
+        xxhash = _import_xxhash()
+        if xxhash is None:
+            raise ValueError(
+                f"{algorithm} checksums require the xxhash package. "
+                f"Install with: pip install xxhash"
+            )
+        return getattr(xxhash, algorithm)()
+
+    if algorithm not in hashlib.algorithms_available:
+        available = sorted(hashlib.algorithms_available) + list(_OPTIONAL_ALGORITHMS)
+        raise ValueError(
+            f"Unsupported algorithm: {algorithm}. "
+            f"Available: {', '.join(available)}"
+        )
+
+    return hashlib.new(algorithm)
+
+
 def compute_checksum(
     file_path: Path,
     algorithm: str = "sha256",
-    chunk_size: int = 8192
+    chunk_size: int = COPY_CHUNK_SIZE
 ) -> str:
     """
     Compute checksum of a file.
 
+    The file is hashed with ``hashlib.file_digest`` (Python 3.11+), which
+    reads and hashes in C without returning to Python between blocks, or
+    else over a memory map advised with ``MADV_SEQUENTIAL``. Either way
+    the file is marked for sequential access first, so kernel readahead
+    runs ahead of the hash. blake3 checksums of files larger than
+    BLAKE3_MMAP_THRESHOLD are computed over a memory map with blake3's
+    multithreaded tree hash; hashing a file larger than
+    BLAKE3_ADVICE_SIZE with anything else logs (once) that blake3 would
+    be faster.
+
     Parameters
     ----------
     file_path : Path
         Path to file
     algorithm : str
-        Hash algorithm (sha256, md5, sha1)
+        Hash algorithm (see ``new_hasher``)
     chunk_size : int
-        Size of chunks to read
+        Size of chunks to read where neither ``file_digest`` nor mmap
+        can be used (e.g. empty files)
 
     Returns
     -------
@@ -99,27 +482,88 @@ def compute_checksum(
     ValueError
         If algorithm is not supported
     """
-    algorithm = algorithm.lower()
-
-    if algorithm not in hashlib.algorithms_available:
-        raise ValueError(
-            f"Unsupported algorithm: {algorithm}. "
-            f"Available: {', '.join(sorted(hashlib.algorithms_available))}"
+    global _blake3_advised
+
+    hash_obj = new_hasher(algorithm)
+    file_size = os.path.getsize(file_path)
+
+    if algorithm.lower() == 'blake3':
+        if file_size > BLAKE3_MMAP_THRESHOLD:
+            hash_obj = type(hash_obj)(max_threads=type(hash_obj).AUTO)
+            hash_obj.update_mmap(str(file_path))
+            return hash_obj.hexdigest()
+    elif file_size > BLAKE3_ADVICE_SIZE and not _blake3_advised:
+        _blake3_advised = True
+        logger.info(
+            f"Verifying {Path(file_path).name} with {algorithm}; publishing a "
+            f"blake3 checksum (checksum_algorithm: blake3) makes verification "
+            f"of large files several times faster"
         )
 
-    hash_obj = hashlib.new(algorithm)
-
     with open(file_path, 'rb') as f:
+        # Widen kernel readahead so reads overlap with hashing
+        advise_sequential(f.fileno())
+
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, lambda: hash_obj).hexdigest()
+
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    try:
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    except OSError:
+                        pass
+                hash_obj.update(mm)
+            return hash_obj.hexdigest()
+        except (ValueError, OSError):
+            # Empty files and special files cannot be mapped
+            pass
+
         while chunk := f.read(chunk_size):
             hash_obj.update(chunk)
 
     return hash_obj.hexdigest()
 
 
+def compute_probe(file_path: Path) -> str:
+    """
+    Compute a cheap fingerprint of a file's size, head and tail.
+
+    The probe is the sha256 of the file size (8 bytes, little-endian),
+    the first PROBE_SIZE bytes and the last PROBE_SIZE bytes, so it costs
+    two small reads however large the file is. A differing probe proves
+    the file differs; a matching one does not prove it is intact.
+
+    Parameters
+    ----------
+    file_path : Path
+        Path to file
+
+    Returns
+    -------
+    str
+        Hexadecimal probe string
+    """
+    hash_obj = hashlib.sha256()
+
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        hash_obj.update(size.to_bytes(8, 'little'))
+        hash_obj.update(os.pread(f.fileno(), PROBE_SIZE, 0))
+        hash_obj.update(
+            os.pread(f.fileno(), PROBE_SIZE, max(0, size - PROBE_SIZE))
+        )
+
+    return hash_obj.hexdigest()
+
+
 def verify_checksum(
     file_path: Path,
     expected_checksum: str,
-    algorithm: str = "sha256"
+    algorithm: str = "sha256",
+    actual_checksum: Optional[str] = None,
+    expected_probe: Optional[str] = None
 ) -> bool:
     """
     Verify file checksum matches expected value.
@@ -132,6 +576,12 @@ def verify_checksum(
         Expected checksum (hexadecimal)
     algorithm : str
         Hash algorithm used
+    actual_checksum : str, optional
+        Checksum already computed while the file was written; the file is
+        only read back when this is not given
+    expected_probe : str, optional
+        Expected ``compute_probe`` value. When the file has to be read
+        back, a differing probe rejects it without hashing the whole file.
 
     Returns
     -------
@@ -143,7 +593,19 @@ def verify_checksum(
     ValueError
         If checksums don't match
     """
-    actual = compute_checksum(file_path, algorithm)
+    if (
+        actual_checksum is None
+        and expected_probe
+        and compute_probe(file_path).lower() != expected_probe.lower()
+    ):
+        raise ValueError(
+            f"Checksum mismatch for {file_path.name}!\n"
+            f"Size, first or last {PROBE_SIZE // 1024} KiB differ from the "
+            f"expected file (probe_sha256).\n\n"
+            f"The file may be corrupted or tampered with."
+        )
+
+    actual = actual_checksum or compute_checksum(file_path, algorithm)
 
     if actual.lower() != expected_checksum.lower():
         raise ValueError(
@@ -156,12 +618,73 @@ def verify_checksum(
     return True
 
 
+def create_progress() -> Progress:
+    """
+    Create a download progress display.
+
+    A single display can track several concurrent downloads (one task
+    per file); rich only allows one live display at a time.
+
+    Returns
+    -------
+    rich.progress.Progress
+        Progress display with the repo2data download columns
+    """
+    return Progress(
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(bar_width=40),
+        "[progress.percentage]{task.percentage:>3.1f}%",
+        "•",
+        DownloadColumn(),
+        "•",
+        TransferSpeedColumn(),
+        "•",
+        TimeRemainingColumn(),
+        console=console,
+        transient=False  # Keep progress bar visible after completion
+    )
+
+
+class ProgressBatcher:
+    """
+    Accumulate progress and advance a task in batches.
+
+    Each ``Progress.update`` takes a lock and recomputes the transfer
+    rate; flushing every PROGRESS_FLUSH_BYTES or PROGRESS_FLUSH_INTERVAL
+    seconds keeps that off the per-chunk path.
+    """
+
+    def __init__(self, progress: Progress, task):
+        self.progress = progress
+        self.task = task
+        self.pending = 0
+        self.last_flush = time.monotonic()
+
+    def add(self, n: int) -> None:
+        """Record ``n`` more bytes, flushing if a batch is due."""
+        self.pending += n
+        if self.pending >= PROGRESS_FLUSH_BYTES:
+            self.flush()
+        else:
+            now = time.monotonic()
+            if now - self.last_flush > PROGRESS_FLUSH_INTERVAL:
+                self.flush(now)
+
+    def flush(self, now: Optional[float] = None) -> None:
+        """Advance the task by the bytes recorded since the last flush."""
+        if self.pending:
+            self.progress.update(self.task, advance=self.pending)
+            self.pending = 0
+        self.last_flush = time.monotonic() if now is None else now
+
+
 def download_with_progress(
     response_iter: Callable,
     file_handle: BinaryIO,
     total_size: Optional[int] = None,
     description: str = "Downloading",
-    chunk_size: int = 8192
+    chunk_size: int = COPY_CHUNK_SIZE,
+    progress: Optional[Progress] = None
 ) -> int:
     """
     Download data with a progress bar.
@@ -177,42 +700,231 @@ def download_with_progress(
     description : str
         Description to show in progress bar
     chunk_size : int
-        Size of chunks to download
+        Size of chunks to download (default: 1 MiB, so large downloads
+        take one write syscall per MiB rather than per 8 KiB)
+    progress : rich.progress.Progress, optional
+        Already running progress display to add a task to (used for
+        concurrent downloads). If None, a new display is created.
 
     Returns
     -------
     int
         Total bytes downloaded
     """
+    if progress is None:
+        with create_progress() as progress:
+            return download_with_progress(
+                response_iter,
+                file_handle,
+                total_size=total_size,
+                description=description,
+                chunk_size=chunk_size,
+                progress=progress
+            )
+
     downloaded = 0
+    _advise_sequential_write(file_handle)
+
+    task = progress.add_task(
+        description,
+        total=total_size
+    )
+
+    advance = ProgressBatcher(progress, task)
+    unreleased = 0
+    for chunk in response_iter(chunk_size=chunk_size):
+        if chunk:
+            file_handle.write(chunk)
+            chunk_len = len(chunk)
+            downloaded += chunk_len
+            advance.add(chunk_len)
+            unreleased += chunk_len
+            if unreleased >= PAGE_CACHE_DROP_INTERVAL:
+                _release_written(file_handle)
+                unreleased = 0
+    advance.flush()
+
+    _release_written(file_handle)
+    return downloaded
 
-    with Progress(
-        TextColumn("[bold blue]{task.description}"),
-        BarColumn(bar_width=40),
-        "[progress.percentage]{task.percentage:>3.1f}%",
-        "•",
-        DownloadColumn(),
-        "•",
-        TransferSpeedColumn(),
-        "•",
-        TimeRemainingColumn(),
-        console=console,
-        transient=False  # Keep progress bar visible after completion
-    ) as progress:
 
-        task = progress.add_task(
-            description,
-            total=total_size
+def copy_response_with_progress(
+    response,
+    file_handle: BinaryIO,
+    total_size: Optional[int] = None,
+    description: str = "Downloading",
+    chunk_size: int = COPY_CHUNK_SIZE,
+    progress: Optional[Progress] = None,
+    hasher=None
+) -> int:
+    """
+    Copy a streamed HTTP response body to a file with a progress bar.
+
+    Reads the raw urllib3 stream with ``readinto`` into one reused
+    buffer instead of iterating small, freshly allocated chunks, so a
+    multi-GB download costs a few thousand Python-level writes.
+
+    Parameters
+    ----------
+    response : requests.Response
+        Response opened with ``stream=True``
+    file_handle : BinaryIO
+        Open file handle to write to
+    total_size : int, optional
+        Total size in bytes (if known)
+    description : str
+        Description to show in progress bar
+    chunk_size : int
+        Size of blocks to read (default: 1 MiB)
+    progress : rich.progress.Progress, optional
+        Already running progress display to add a task to (used for
+        concurrent downloads). If None, a new display is created, unless
+        the file is known to be smaller than PROGRESS_MIN_SIZE.
+    hasher : hashlib hash object, optional
+        Updated with every block written (see ``new_hasher``), so the
+        checksum is known without reading the file back
+
+    Returns
+    -------
+    int
+        Total bytes written
+    """
+    advance = None
+    if progress is not None:
+        advance = ProgressBatcher(
+            progress, progress.add_task(description, total=total_size)
         )
+    elif not total_size or total_size >= PROGRESS_MIN_SIZE:
+        with create_progress() as progress:
+            return copy_response_with_progress(
+                response,
+                file_handle,
+                total_size=total_size,
+                description=description,
+                chunk_size=chunk_size,
+                progress=progress,
+                hasher=hasher
+            )
+
+    start = file_handle.tell()
+    _advise_sequential_write(file_handle)
+
+    # Undo any Content-Encoding (gzip, deflate) like iter_content does
+    raw = response.raw
+    raw.decode_content = True
+
+    buffer = memoryview(bytearray(chunk_size))
+    unreleased = 0
+    try:
+        while n := raw.readinto(buffer):
+            block = buffer[:n]
+            file_handle.write(block)
+            if hasher is not None:
+                hasher.update(block)
+            if advance is not None:
+                advance.add(n)
+            # Release pages as we go, not only at the end of a multi-GB file
+            unreleased += n
+            if unreleased >= PAGE_CACHE_DROP_INTERVAL:
+                _release_written(file_handle)
+                unreleased = 0
+    except urllib3.exceptions.HTTPError as e:
+        # Surface as requests errors, like iter_content does
+        raise requests.ConnectionError(e)
+    finally:
+        if advance is not None:
+            advance.flush()
+
+    # Drop any preallocated space past the end of the data
+    file_handle.truncate()
+    _release_written(file_handle)
+    return file_handle.tell() - start
+
+
+def download_many(
+    urls: Sequence[str],
+    destinations: Sequence[Path],
+    session: Optional[requests.Session] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeout: float = 60
+) -> List[Path]:
+    """
+    Download several URLs concurrently under one progress display.
 
-        for chunk in response_iter(chunk_size=chunk_size):
-            if chunk:
-                file_handle.write(chunk)
-                chunk_len = len(chunk)
-                downloaded += chunk_len
-                progress.update(task, advance=chunk_len)
+    Each file is streamed to ``<name>.part`` by a worker thread and
+    moved into place once complete. All workers share ``session``, so
+    requests to the same host reuse pooled keep-alive connections.
 
-    return downloaded
+    Parameters
+    ----------
+    urls : sequence of str
+        URLs to download
+    destinations : sequence of pathlib.Path
+        File path for each URL
+    session : requests.Session, optional
+        Session to download with (default: a new one, closed afterwards)
+    max_workers : int
+        Number of parallel downloads
+    timeout : float
+        Connect/read timeout in seconds
+
+    Returns
+    -------
+    list of pathlib.Path
+        The destination paths, in input order
+
+    Raises
+    ------
+    ValueError
+        If ``urls`` and ``destinations`` differ in length
+    requests.RequestException
+        If a download fails (other downloads are completed first)
+    """
+    if len(urls) != len(destinations):
+        raise ValueError("urls and destinations must have the same length")
+
+    own_session = session is None
+    if own_session:
+        session = create_session(pool_size=max(1, max_workers))
+
+    def fetch(url: str, file_path: Path) -> Path:
+        file_path = Path(file_path)
+        part_path = partial_path(file_path)
+        try:
+            with session.get(url, stream=True, timeout=timeout) as response:
+                response.raise_for_status()
+                total_size = int(response.headers.get('content-length', 0))
+                with open(part_path, 'wb') as f:
+                    preallocate(f.fileno(), total_size)
+                    copy_response_with_progress(
+                        response,
+                        f,
+                        total_size=total_size or None,
+                        description=f"  Downloading {file_path.name}",
+                        progress=progress
+                    )
+            os.replace(part_path, file_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        return file_path
+
+    try:
+        with create_progress() as progress, \
+                ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [
+                executor.submit(fetch, url, file_path)
+                for url, file_path in zip(urls, destinations)
+            ]
+            # Wait for every download before surfacing the first error
+            errors = [f.exception() for f in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+        return [f.result() for f in futures]
+    finally:
+        if own_session:
+            session.close()
 
 
 def _format_bytes(size_bytes: int) -> str:
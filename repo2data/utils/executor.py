@@ -0,0 +1,152 @@
+"""Thread pool sharing between the manager, providers and decompressor."""
+
+import contextlib
+import os
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, Any, Optional
+
+
+def default_max_workers() -> int:
+    """
+    Get the size of the pool a DatasetManager creates for itself.
+
+    Returns
+    -------
+    int
+        ``min(32, cpu_count * 4)``: downloads are I/O bound, but a
+        many-dataset install should not start hundreds of threads
+    """
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+def create_executor(max_workers: int = 0) -> ThreadPoolExecutor:
+    """
+    Create the thread pool shared by one install.
+
+    Parameters
+    ----------
+    max_workers : int
+        Number of threads (default: ``default_max_workers()``)
+
+    Returns
+    -------
+    concurrent.futures.ThreadPoolExecutor
+        New thread pool
+    """
+    return ThreadPoolExecutor(
+        max_workers=max_workers or default_max_workers(),
+        thread_name_prefix="repo2data"
+    )
+
+
+class BoundedExecutor:
+    """
+    View of a shared executor that runs at most N of its caller's tasks.
+
+    A provider that used to own a pool of N threads gets the same
+    concurrency limit (e.g. one task per pooled HTTP connection) on a
+    shared executor. ``submit`` blocks the submitting thread while N
+    tasks are in flight, so queued work is held back by the caller rather
+    than piling up in the shared pool. ``wait`` blocks until the view's
+    outstanding tasks have finished, like leaving a ``with`` block of a
+    private pool does.
+    """
+
+    def __init__(self, executor: Executor, max_workers: int):
+        """
+        Initialize BoundedExecutor.
+
+        Parameters
+        ----------
+        executor : concurrent.futures.Executor
+            Shared executor (anything with a compatible ``submit``)
+        max_workers : int
+            Maximum number of this view's tasks running at once
+        """
+        self._executor = executor
+        self._slots = threading.BoundedSemaphore(max(1, max_workers))
+        self._lock = threading.Lock()
+        self._pending = set()
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Schedule ``fn(*args, **kwargs)`` once a slot is free.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future of the call
+        """
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._task_done)
+        return future
+
+    def _task_done(self, future: Future) -> None:
+        """Free the slot of a finished task."""
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+
+    def wait(self) -> None:
+        """Block until every task submitted through this view has finished."""
+        with self._lock:
+            pending = list(self._pending)
+        wait(pending)
+
+    def map(self, fn: Callable[..., Any], *iterables: Iterable) -> Iterator[Any]:
+        """
+        Like ``Executor.map``: apply ``fn`` concurrently, yield in order.
+
+        Returns
+        -------
+        iterator
+            Results of ``fn`` in the order of the inputs
+        """
+        futures = [self.submit(fn, *args) for args in zip(*iterables)]
+        return (future.result() for future in futures)
+
+
+@contextlib.contextmanager
+def worker_pool(
+    executor: Optional[Executor],
+    max_workers: int
+) -> Iterator[Executor]:
+    """
+    Get an executor running at most ``max_workers`` tasks at a time.
+
+    Uses ``executor`` when one is given, bounded to ``max_workers`` of
+    the caller's tasks; otherwise a private thread pool that is shut down
+    on exit. Either way, leaving the block (also on an exception) waits
+    for the caller's running tasks, so they never outlive resources the
+    caller releases afterwards.
+
+    Parameters
+    ----------
+    executor : concurrent.futures.Executor or None
+        Shared executor
+    max_workers : int
+        Maximum number of concurrent tasks
+
+    Yields
+    ------
+    concurrent.futures.Executor
+        Executor to submit the caller's tasks to
+    """
+    if executor is not None:
+        bounded = BoundedExecutor(executor, max_workers)
+        try:
+            yield bounded
+        finally:
+            bounded.wait()
+        return
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        yield pool
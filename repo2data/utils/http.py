@@ -0,0 +1,60 @@
+"""Construction of pooled, retrying HTTP sessions."""
+
+from typing import Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Keep-alive connections kept per host
+DEFAULT_POOL_SIZE = 16
+
+# Response statuses retried with exponential backoff: rate limiting (429,
+# honouring Retry-After) and transient server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def create_session(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    retry_statuses: Sequence[int] = RETRY_STATUSES,
+    total_retries: int = 3,
+    backoff_factor: float = 1
+) -> requests.Session:
+    """
+    Create a requests session with connection pooling and retries.
+
+    Requests to the same host reuse pooled keep-alive connections instead
+    of opening a new TCP/TLS connection each time. Connection errors and
+    responses with a status in ``retry_statuses`` are retried with
+    exponential backoff; a ``Retry-After`` header on 429/503 responses is
+    honoured.
+
+    Parameters
+    ----------
+    pool_size : int
+        Connections kept per host (and number of host pools)
+    retry_statuses : sequence of int
+        HTTP statuses to retry
+    total_retries : int
+        Maximum number of retries per request
+    backoff_factor : float
+        Base of the exponential backoff between retries, in seconds
+
+    Returns
+    -------
+    requests.Session
+        Configured session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=total_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=list(retry_statuses)
+        )
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
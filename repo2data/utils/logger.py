@@ -2,35 +2,100 @@
 
 import logging
 import sys
+import threading
 from typing import Optional
 
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.theme import Theme
+# rich is imported and the console built on first use (see get_console),
+# so importing this module stays cheap
 
-# Custom theme for repo2data
-REPO2DATA_THEME = Theme({
+# Custom theme styles for repo2data
+_THEME_STYLES = {
     "info": "cyan",
     "warning": "yellow",
     "error": "bold red",
     "success": "bold green",
-})
+}
 
-# Global console instance
-console = Console(theme=REPO2DATA_THEME)
+_lazy_lock = threading.Lock()
+_theme = None
+_console = None
+_handler_class = None
 
+# Loggers already returned by get_logger, by name
+_configured = {}
 
-class CleanRichHandler(RichHandler):
-    """Custom RichHandler with cleaner formatting."""
 
-    def __init__(self, *args, **kwargs):
-        """Initialize with sensible defaults for repo2data."""
-        kwargs.setdefault("show_time", False)
-        kwargs.setdefault("show_path", False)
-        kwargs.setdefault("markup", True)
-        kwargs.setdefault("rich_tracebacks", True)
-        kwargs.setdefault("tracebacks_show_locals", False)
-        super().__init__(*args, **kwargs, console=console)
+def _get_theme():
+    """Get the repo2data rich Theme, creating it on first use."""
+    global _theme
+    with _lazy_lock:
+        if _theme is None:
+            from rich.theme import Theme
+            _theme = Theme(_THEME_STYLES)
+    return _theme
+
+
+def get_console():
+    """
+    Get the global rich Console, creating it on first use.
+
+    Call this where the console is used rather than binding it at import
+    time, which would import rich and build the console right away.
+
+    Returns
+    -------
+    rich.console.Console
+        Console themed with the repo2data styles
+    """
+    global _console
+    theme = _get_theme()
+    with _lazy_lock:
+        if _console is None:
+            from rich.console import Console
+            _console = Console(theme=theme)
+    return _console
+
+
+def _get_handler_class():
+    """Get the CleanRichHandler class, defining it on first use."""
+    global _handler_class
+    if _handler_class is not None:
+        return _handler_class
+
+    from rich.logging import RichHandler
+
+    class CleanRichHandler(RichHandler):
+        """Custom RichHandler with cleaner formatting."""
+
+        def __init__(self, *args, **kwargs):
+            """Initialize with sensible defaults for repo2data."""
+            kwargs.setdefault("show_time", False)
+            kwargs.setdefault("show_path", False)
+            kwargs.setdefault("markup", True)
+            kwargs.setdefault("rich_tracebacks", True)
+            kwargs.setdefault("tracebacks_show_locals", False)
+            super().__init__(*args, **kwargs, console=get_console())
+
+    CleanRichHandler.__qualname__ = "CleanRichHandler"
+
+    with _lazy_lock:
+        if _handler_class is None:
+            _handler_class = CleanRichHandler
+    return _handler_class
+
+
+def __getattr__(name: str):
+    """Build ``console``, ``REPO2DATA_THEME`` and ``CleanRichHandler`` lazily.
+
+    ``console`` is kept for existing imports; prefer ``get_console()``.
+    """
+    if name == "console":
+        return get_console()
+    if name == "REPO2DATA_THEME":
+        return _get_theme()
+    if name == "CleanRichHandler":
+        return _get_handler_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def setup_logger(
@@ -63,7 +128,7 @@ def setup_logger(
         return logger
 
     # Rich console handler with clean formatting
-    console_handler = CleanRichHandler(level=level)
+    console_handler = _get_handler_class()(level=level)
     console_handler.setLevel(level)
 
     # No formatter needed - Rich handles it beautifully
@@ -71,7 +136,8 @@ def setup_logger(
 
     # File handler (optional) - plain format for files
     if log_file:
-        file_handler = logging.FileHandler(log_file)
+        # Opened on the first record rather than at setup
+        file_handler = logging.FileHandler(log_file, delay=True)
         file_handler.setLevel(level)
 
         # Plain formatter for file logs
@@ -99,7 +165,13 @@ def get_logger(name: str = "repo2data") -> logging.Logger:
     logging.Logger
         Logger instance
     """
+    # Repeated calls skip the logging manager and its lock
+    logger = _configured.get(name)
+    if logger is not None:
+        return logger
+
     logger = logging.getLogger(name)
     if not logger.handlers:
         setup_logger(name)
+    _configured[name] = logger
     return logger
@@ -5,6 +5,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Tells a missing field apart from one set to None
+_MISSING = object()
+
 
 def validate_config_structure(config: Dict[str, Any]) -> bool:
     """
@@ -25,20 +28,20 @@ def validate_config_structure(config: Dict[str, Any]) -> bool:
     ValueError
         If required fields are missing
     """
-    required_fields = ["src", "projectName"]
-
-    # Check if this is a multi-download config
-    first_key = next(iter(config))
-    first_value = config[first_key]
+    # Single download: its fields are at the top level
+    if "src" in config or "projectName" in config:
+        _validate_single_config(config)
+        return True
 
-    if isinstance(first_value, dict):
-        # Multi-download: validate each sub-config
-        for key, sub_config in config.items():
-            if not isinstance(sub_config, dict):
-                continue
+    # Multi-download: validate each sub-config
+    has_sub_configs = False
+    for key, sub_config in config.items():
+        if isinstance(sub_config, dict):
             _validate_single_config(sub_config, key)
-    else:
-        # Single download
+            has_sub_configs = True
+
+    if not has_sub_configs:
+        # Neither shape: report the missing fields of a single download
         _validate_single_config(config)
 
     return True
@@ -63,26 +66,28 @@ def _validate_single_config(
     ValueError
         If validation fails
     """
-    required_fields = ["src", "projectName"]
+    # One lookup per field
+    src = config.get("src", _MISSING)
+    project_name = config.get("projectName", _MISSING)
+    dst = config.get("dst", _MISSING)
 
-    for field in required_fields:
-        if field not in config:
-            raise ValueError(
-                f"Missing required field '{field}' in {key}"
-            )
+    if src is _MISSING:
+        raise ValueError(f"Missing required field 'src' in {key}")
+    if project_name is _MISSING:
+        raise ValueError(f"Missing required field 'projectName' in {key}")
 
     # Validate src is not empty
-    if not config["src"] or not isinstance(config["src"], str):
+    if not isinstance(src, str) or not src:
         raise ValueError(f"'src' must be a non-empty string in {key}")
 
     # Validate projectName is not empty
-    if not config["projectName"] or not isinstance(config["projectName"], str):
+    if not isinstance(project_name, str) or not project_name:
         raise ValueError(
             f"'projectName' must be a non-empty string in {key}"
         )
 
     # Validate dst if present
-    if "dst" in config and not isinstance(config["dst"], str):
+    if dst is not _MISSING and not isinstance(dst, str):
         raise ValueError(f"'dst' must be a string in {key}")
 
-    logger.debug(f"Configuration validated for {key}")
+    logger.debug("Configuration validated for %s", key)
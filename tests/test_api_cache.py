@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Offline tests for the metadata API response cache."""
+
+import http.server
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import requests
+
+from repo2data.cache.api_cache import get_api_response, is_version_pinned
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests += 1
+        etag = server.etag if "noetag" not in self.path else None
+        if etag and self.headers.get("If-None-Match") == etag:
+            server.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(server.body)))
+        self.end_headers()
+        self.wfile.write(server.body)
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.body, self.server.etag = b'{"v": 1}', '"v1"'
+        self.server.requests = self.server.not_modified = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        env = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": tmp_dir.name})
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop("REPO2DATA_NO_CACHE", None)
+
+        self.session = requests.Session()
+        self.addCleanup(self.session.close)
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def test_version_pinned(self):
+        self.assertTrue(is_version_pinned("https://x/api/datasets/1/versions/1.2"))
+        self.assertTrue(is_version_pinned("https://x/v2/articles/5/versions/3"))
+        self.assertFalse(is_version_pinned("https://x/api/datasets/:persistentId"))
+        self.assertFalse(is_version_pinned("https://x/api/datasets/1/versions/:latest"))
+
+    def test_unpinned_revalidated(self):
+        url = f"{self.base}/api/datasets/:persistentId"
+        self.assertEqual(get_api_response(self.session, url), b'{"v": 1}')
+        self.assertEqual(get_api_response(self.session, url), b'{"v": 1}')
+        self.assertEqual((self.server.requests, self.server.not_modified), (2, 1))
+
+        # A new version is served as soon as the ETag changes
+        self.server.body, self.server.etag = b'{"v": 2}', '"v2"'
+        self.assertEqual(get_api_response(self.session, url), b'{"v": 2}')
+        self.assertEqual(get_api_response(self.session, url), b'{"v": 2}')
+        self.assertEqual((self.server.requests, self.server.not_modified), (4, 2))
+
+    def test_unpinned_without_etag_not_cached(self):
+        url = f"{self.base}/api/noetag"
+        get_api_response(self.session, url)
+        self.server.body = b'{"v": 2}'
+        self.assertEqual(get_api_response(self.session, url), b'{"v": 2}')
+        self.assertEqual(self.server.requests, 2)
+
+    def test_pinned_cached(self):
+        url = f"{self.base}/api/datasets/1/versions/1.0"
+        get_api_response(self.session, url)
+        self.assertEqual(get_api_response(self.session, url), b'{"v": 1}')
+        self.assertEqual(self.server.requests, 1)
+
+    def test_cache_disabled(self):
+        url = f"{self.base}/api/datasets/1/versions/1.0"
+        with mock.patch.dict(os.environ, {"REPO2DATA_NO_CACHE": "1"}):
+            get_api_response(self.session, url)
+            get_api_response(self.session, url)
+        self.assertEqual((self.server.requests, self.server.not_modified), (2, 0))
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Offline tests for Dataverse source parsing."""
+
+import unittest
+from repo2data.providers.dataverse import _parse_source
+from repo2data.utils.download import unique_file_name
+
+class Test(unittest.TestCase):
+    def test_parse_doi(self):
+        self.assertEqual(
+            _parse_source("doi:10.7910/DVN/ABC"),
+            ("https://dataverse.harvard.edu", "doi:10.7910/DVN/ABC"))
+        self.assertEqual(
+            _parse_source("10.7910/DVN/ABC"),
+            ("https://dataverse.harvard.edu", "doi:10.7910/DVN/ABC"))
+
+    def test_parse_protocol(self):
+        self.assertEqual(
+            _parse_source("dataverse://dv.example.org/doi:10.7910/DVN/ABC"),
+            ("https://dv.example.org", "doi:10.7910/DVN/ABC"))
+
+    def test_parse_persistent_id(self):
+        self.assertEqual(
+            _parse_source("https://dv.example.org/dataset.xhtml?persistentId=doi:10.7910/DVN/ABC"),
+            ("https://dv.example.org", "doi:10.7910/DVN/ABC"))
+
+    def test_parse_doi_after_bare_doi(self):
+        self.assertEqual(
+            _parse_source("https://dv.example.org/file/10.99/xx/doi:10.7910/DVN/ABC"),
+            ("https://dv.example.org", "doi:10.7910/DVN/ABC"))
+        self.assertEqual(
+            _parse_source("https://dv.example.org/dataset/10.1234/abc?persistentId2=doi:10.5555/XYZ"),
+            ("https://dv.example.org", "doi:10.5555/XYZ"))
+
+    def test_parse_invalid(self):
+        with self.assertRaises(ValueError):
+            _parse_source("https://dv.example.org/dataset/10.1234/abc")
+
+    def test_duplicate_file_names(self):
+        used = set()
+        self.assertEqual(
+            [unique_file_name("a.tar.gz", i, used) for i in (7, 8, 9)],
+            ["a.tar.gz", "a_8.tar.gz", "a_9.tar.gz"])
+        self.assertEqual(
+            [unique_file_name("b", None, used) for _ in range(3)],
+            ["b", "b_2", "b_3"])
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Offline tests for the bounded view of a shared executor."""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from repo2data.utils.executor import BoundedExecutor, worker_pool
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.pool = ThreadPoolExecutor(max_workers=8)
+        self.addCleanup(self.pool.shutdown)
+        self.lock = threading.Lock()
+        self.running = self.peak = 0
+
+    def _task(self, value):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.02)
+        with self.lock:
+            self.running -= 1
+        return value
+
+    def test_slot_limit(self):
+        bounded = BoundedExecutor(self.pool, 2)
+        self.assertEqual(list(bounded.map(self._task, range(10))), list(range(10)))
+        self.assertEqual(self.peak, 2)
+
+    def test_wait(self):
+        bounded = BoundedExecutor(self.pool, 3)
+        futures = [bounded.submit(self._task, i) for i in range(9)]
+        bounded.wait()
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual(self.running, 0)
+
+    def test_worker_pool_waits_on_error(self):
+        futures = []
+        with self.assertRaises(RuntimeError):
+            with worker_pool(self.pool, 2) as executor:
+                futures = [executor.submit(self._task, i) for i in range(4)]
+                raise RuntimeError
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual(self.peak, 2)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Offline tests for ranged and resumed HTTP downloads."""
+
+import http.server
+import os
+import re
+import socket
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from repo2data.providers import http as http_provider
+from repo2data.providers.http import HTTPProvider
+from repo2data.utils.download import COPY_CHUNK_SIZE, partial_path
+
+# Truncated bodies (half of the file) end on a chunk boundary, so the
+# bytes received before the break are all written
+SIZE = 4 * COPY_CHUNK_SIZE
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Serves ``server.data`` with byte ranges, ETag and If-Range."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _headers(self, status, length, content_range=None):
+        self.send_response(status)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", self.server.etag)
+        self.send_header("Content-Length", str(length))
+        if content_range:
+            self.send_header("Content-Range", content_range)
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._headers(200, len(self.server.data))
+
+    def do_GET(self):
+        server = self.server
+        data = server.data
+        byte_range = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        with server.lock:
+            server.gets.append((byte_range, if_range))
+            truncate = server.truncate > 0
+            server.truncate -= truncate
+
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", byte_range or "")
+        if match and if_range in (None, server.etag):
+            start = int(match.group(1))
+            end = int(match.group(2) or len(data) - 1)
+            body = data[start:end + 1]
+            self._headers(206, len(body), f"bytes {start}-{end}/{len(data)}")
+        else:
+            body = data
+            self._headers(200, len(body))
+
+        if truncate:
+            # Break the connection halfway through the body
+            self.wfile.write(body[:len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            self.connection.shutdown(socket.SHUT_RDWR)
+            if server.change_after_truncate:
+                server.data, server.etag = server.new_data, '"v2"'
+            return
+        self.wfile.write(body)
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.data, self.server.etag = os.urandom(SIZE), '"v1"'
+        self.server.new_data = os.urandom(SIZE)
+        self.server.lock = threading.Lock()
+        self.server.gets = []
+        self.server.truncate = 0
+        self.server.change_after_truncate = False
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.destination = Path(tmp_dir.name) / "data"
+        env = mock.patch.dict(os.environ, {
+            "XDG_CACHE_HOME": tmp_dir.name,
+            "REPO2DATA_NO_CACHE": "1"
+        })
+        env.start()
+        self.addCleanup(env.stop)
+
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/file.bin"
+
+    def _download(self, **config):
+        provider = HTTPProvider({"src": self.url, **config}, self.destination)
+        self.addCleanup(provider.session.close)
+        return provider.download()
+
+    def test_ranges_reassembled(self):
+        with mock.patch.object(http_provider, "RANGE_THRESHOLD", SIZE // 4):
+            path = self._download(connections_per_file=4)
+        self.assertEqual(path.read_bytes(), self.server.data)
+        part = SIZE // 4
+        self.assertEqual(
+            sorted(byte_range for byte_range, _ in self.server.gets),
+            [f"bytes={start}-{start + part - 1}" for start in range(0, SIZE, part)])
+
+    def test_range_resumed_after_truncated_body(self):
+        self.server.truncate = 1
+        with mock.patch.object(http_provider, "RANGE_THRESHOLD", SIZE // 4):
+            path = self._download(connections_per_file=4)
+        self.assertEqual(path.read_bytes(), self.server.data)
+        # One range was re-requested from where it broke off
+        self.assertEqual(len(self.server.gets), 5)
+
+    def test_resume_after_truncated_body(self):
+        self.server.truncate = 1
+        path = self._download()
+        self.assertEqual(path.read_bytes(), self.server.data)
+        self.assertEqual(
+            self.server.gets,
+            [(None, None), (f"bytes={SIZE // 2}-", '"v1"')])
+
+    def test_resume_partial_next_run(self):
+        # Every attempt of the first run breaks off halfway
+        self.server.truncate = http_provider.MAX_RESUME_ATTEMPTS + 1
+        with self.assertRaises(Exception):
+            self._download()
+        part_path = partial_path(self.destination / "file.bin")
+        offset = part_path.stat().st_size
+        self.assertGreater(offset, 0)
+        self.assertEqual(part_path.read_bytes(), self.server.data[:offset])
+
+        del self.server.gets[:]
+        path = self._download()
+        self.assertEqual(path.read_bytes(), self.server.data)
+        self.assertEqual(self.server.gets, [(f"bytes={offset}-", '"v1"')])
+        self.assertFalse(part_path.exists())
+
+    def test_if_range_mismatch_restarts(self):
+        # The file changes on the server while the transfer is interrupted
+        self.server.truncate = 1
+        self.server.change_after_truncate = True
+        path = self._download()
+        self.assertEqual(path.read_bytes(), self.server.new_data)
+        self.assertEqual(self.server.gets[1], (f"bytes={SIZE // 2}-", '"v1"'))
+
+    def test_stale_partial_discarded(self):
+        part_path = partial_path(self.destination / "file.bin")
+        self.destination.mkdir()
+        part_path.write_bytes(os.urandom(SIZE // 2))
+        HTTPProvider._etag_path(part_path).write_text('"v0"')
+
+        path = self._download()
+        self.assertEqual(path.read_bytes(), self.server.data)
+        self.assertEqual(self.server.gets, [(None, None)])
+        self.assertFalse(part_path.exists())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Offline tests for the projectName fast scan of the data locator."""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import yaml
+
+from repo2data.utils.locator import (
+    _fast_scan_project_name,
+    _FAST_SCAN_SIZE,
+    locate_evidence_data
+)
+
+FILLER = "# " + "x" * 60 + "\n"
+
+CASES = {
+    "data_block": "project:\n  title: x\ndata:\n  src: foo\n  projectName: my-proj # c\n",
+    "top_level": "projectName: 'quoted name'\n",
+    "nested_deeper": "data:\n  nested:\n    projectName: deep\n  projectName: real\n",
+    "nested_only": "data:\n  nested:\n    projectName: deep\nprojectName: top\n",
+    "number": "projectName: 123\n",
+    "flow_data": "data: {projectName: flow}\nprojectName: top\n",
+    "crlf": "data:\r\n  projectName: \"crlf\"\r\n",
+    "blank_lines": "data:\n\n  # hi\n  src: x\n\n  projectName: gap\n",
+    "data_after_window": (
+        "projectName: top\n"
+        + FILLER * (_FAST_SCAN_SIZE // len(FILLER) + 10)
+        + "data:\n  projectName: deep\n"
+    ),
+    "duplicate_data": "data:\n  projectName: a\ndata:\n  projectName: b\n",
+    "duplicate_top": "projectName: a\nprojectName: b\n",
+    "quoted_data_key": "\"data\":\n  projectName: deep\nprojectName: top\n",
+    "multiline_plain": "projectName: foo\n  bar\n",
+    "document_start": "# comment\n---\ndata:\n  projectName: doc\n",
+    "two_documents": "---\nprojectName: a\n---\nprojectName: b\n",
+    "flow_document": "{data: {projectName: a},\nprojectName: b}\n",
+    "merge_key": "base: &b\n  projectName: m\ndata:\n  <<: *b\n",
+    "hex": "projectName: 0x1F\n",
+    "binary": "projectName: 0b101\n",
+    "sexagesimal": "projectName: 12:30\n",
+    "sexagesimal_float": "projectName: 190:20:30.15\n",
+    "date": "data:\n  projectName: 2024-01-01\n",
+    "timestamp": "projectName: 2024-01-01t12:30:00Z\n",
+    "sequence": "projectName: - foo\n",
+    "value_key": "projectName: =\n",
+    "trailing_tab": "projectName: foo\t\n",
+    "tab_before_comment": "data:\n  projectName: foo\t# c\n",
+    "boolean": "projectName: Off\n",
+}
+
+
+def _expected(text):
+    """Project name strategies 1 and 2 of _extract_project_name."""
+    try:
+        config = yaml.safe_load(text)
+    except yaml.YAMLError:
+        return None
+    if not isinstance(config, dict):
+        return None
+    data = config.get("data", {})
+    if isinstance(data, dict) and data.get("projectName"):
+        return data["projectName"]
+    return config.get("projectName") or None
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def _scan(self, name, text):
+        path = Path(self.tmp_dir.name) / f"{name}.yml"
+        path.write_bytes(text.encode())
+        return _fast_scan_project_name(path), _fast_scan_project_name(path, path.read_bytes())
+
+    def test_scan_agrees_with_yaml(self):
+        for name, text in CASES.items():
+            with self.subTest(name):
+                for scanned in self._scan(name, text):
+                    if scanned is not None:
+                        self.assertEqual(scanned, _expected(text))
+
+    def test_scan_answers_simple_configs(self):
+        for name, value in [("data_block", "my-proj"), ("top_level", "quoted name"),
+                            ("crlf", "crlf"),
+                            ("blank_lines", "gap"), ("document_start", "doc")]:
+            with self.subTest(name):
+                self.assertEqual(self._scan(name, CASES[name]), (value, value))
+
+    def test_scan_defers_past_window(self):
+        self.assertEqual(self._scan("data_after_window", CASES["data_after_window"]),
+                         (None, None))
+
+    def _bump_mtime(self, path):
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def test_cache_refreshes_on_binder_edit(self):
+        root = Path(self.tmp_dir.name)
+        (root / "binder").mkdir()
+        (root / "myst.yml").write_text("project:\n  title: t\n")
+        binder_json = root / "binder" / "data_requirement.json"
+        binder_json.write_text(json.dumps({"projectName": "A"}))
+        self.assertEqual(locate_evidence_data(start_dir=root, verify_exists=False).name, "A")
+
+        binder_json.write_text(json.dumps({"projectName": "B"}))
+        self._bump_mtime(binder_json)
+        self.assertEqual(locate_evidence_data(start_dir=root, verify_exists=False).name, "B")
+
+    def test_cache_refreshes_on_nearer_config(self):
+        root = Path(self.tmp_dir.name)
+        (root / "sub").mkdir()
+        (root / "data_requirement.yaml").write_text("projectName: p1\n")
+        self.assertEqual(locate_evidence_data(start_dir=root / "sub", verify_exists=False).name, "p1")
+
+        (root / "sub" / "data_requirement.yaml").write_text("projectName: p2\n")
+        self._bump_mtime(root / "sub")
+        self.assertEqual(locate_evidence_data(start_dir=root / "sub", verify_exists=False).name, "p2")